@@ -7,6 +7,8 @@ from datetime import timedelta
 import logging
 from types import MappingProxyType
 
+from aiohttp import ClientSession
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -14,11 +16,31 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN, SCAN_INTERVAL
-from .coordinator import PurpleAirDataUpdateCoordinator
+from .const import (
+    CONF_BACKFILL_HISTORY,
+    CONF_LOCAL_POLL_INTERVAL,
+    CONF_MAX_DATA_AGE,
+    CONF_POINTS_BUDGET,
+    CONF_POLL_INTERVAL,
+    DEFAULT_BACKFILL_HISTORY,
+    DEFAULT_LOCAL_POLL_INTERVAL,
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_POINTS_BUDGET,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    LOCAL_API_KEY,
+    SCAN_INTERVAL,
+)
+from .coordinator import ApiProtocol, PurpleAirDataUpdateCoordinator
 from .model import PurpleAirConfigEntry, PurpleAirDomainData
 from .purple_air_api import PurpleAirApi
+from .purple_air_api.local.api import PurpleAirApiLocal
 from .purple_air_api.v1.api import PurpleAirApiV1
+from .sensor_descriptions import (
+    SIMPLE_SENSOR_DESCRIPTIONS,
+    UPDATE_STATS_SENSOR_DESCRIPTIONS,
+    ApiPointsSensorDescription,
+)
 
 PARALLEL_UPDATES = 1
 
@@ -85,12 +107,14 @@ async def async_setup(hass: HomeAssistant, config: None) -> bool:
     _LOGGER.info("Adding support for v1 PurpleAir sensors")
 
     coordinator_v1 = PurpleAirDataUpdateCoordinator(
-        PurpleAirApiV1,
+        _create_api,
         hass,
         _LOGGER,
         name="purpleair_v1",
         update_interval=timedelta(seconds=SCAN_INTERVAL),
     )
+    await coordinator_v1.async_load_epa_cache()
+    await coordinator_v1.async_load_points_ledgers()
 
     hass.data[DOMAIN] = PurpleAirDomainData(
         api=None,
@@ -103,6 +127,19 @@ async def async_setup(hass: HomeAssistant, config: None) -> bool:
     return True
 
 
+def _create_api(session: ClientSession, api_key: str) -> ApiProtocol:
+    """Create the API polling the sensors of an API key.
+
+    Sensors configured with the local key are polled over the LAN, and every other
+    key polls its sensors through the v1 API.
+    """
+
+    if api_key == LOCAL_API_KEY:
+        return PurpleAirApiLocal(session)
+
+    return PurpleAirApiV1(session, api_key)
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up PurpleAir from a config entry."""
 
@@ -134,13 +171,53 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER.debug("Removing deprecated air_quality entity %s", entity_id)
         ent_reg.async_remove(entity_id)
 
+    # entities about the API moved from each sensor to one set for each key
+    for description in (*UPDATE_STATS_SENSOR_DESCRIPTIONS, ApiPointsSensorDescription):
+        unique_id = f"{config.pa_sensor_id}_{description.key}"
+        if entity_id := ent_reg.async_get_entity_id(Platform.SENSOR, DOMAIN, unique_id):
+            _LOGGER.debug("Removing per sensor API entity %s", entity_id)
+            ent_reg.async_remove(entity_id)
+
     # register legacy senors with legacy API
     if config.api_version == 0:
         config_entry.async_start_reauth(hass)
         return await _async_register_legacy_sensor(config, domain_data)
 
     if config.api_version == 1:
-        return await _async_register_v1_sensor(config, domain_data)
+        # options only change how the sensor is polled, which re-registering the
+        # sensor on reload picks up
+        config_entry.async_on_unload(
+            config_entry.add_update_listener(_async_update_options)
+        )
+        # sensors on the LAN are polled in seconds, and the rest in minutes
+        if config.api_key == LOCAL_API_KEY:
+            poll_interval = config_entry.options.get(
+                CONF_LOCAL_POLL_INTERVAL, DEFAULT_LOCAL_POLL_INTERVAL
+            )
+        else:
+            poll_interval = (
+                config_entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL) * 60
+            )
+        points_budget = config_entry.options.get(
+            CONF_POINTS_BUDGET, DEFAULT_POINTS_BUDGET
+        )
+        max_data_age = config_entry.options.get(CONF_MAX_DATA_AGE, DEFAULT_MAX_DATA_AGE)
+        backfill_history = config_entry.options.get(
+            CONF_BACKFILL_HISTORY, DEFAULT_BACKFILL_HISTORY
+        )
+
+        # only the fields of enabled entities are requested. enabling or disabling
+        # an entity reloads its entry, which registers the sensor with new fields.
+        return await _async_register_v1_sensor(
+            config,
+            domain_data,
+            poll_interval,
+            config_entry.entry_id,
+            points_budget,
+            _get_enabled_sensor_fields(hass, config.pa_sensor_id),
+            max_data_age * 60,
+            backfill_history,
+        )
 
     # default failure if api_version is not recognized
     return False
@@ -148,7 +225,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return all(
+    unloaded = all(
         await asyncio.gather(
             *[
                 hass.config_entries.async_forward_entry_unload(entry, component)
@@ -157,6 +234,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
+    # another entry of the key takes over the entities about its API
+    domain_data: PurpleAirDomainData = hass.data[DOMAIN]
+    if unloaded and (coordinator_v1 := domain_data.coordinator_v1):
+        coordinator_v1.release_api_entities(entry.entry_id)
+
+    return unloaded
+
+
+async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry to apply updated options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 
 async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Unregisters the sensor from the API when the entry is removed."""
@@ -216,7 +305,14 @@ async def _async_register_legacy_sensor(
 
 
 async def _async_register_v1_sensor(
-    config: PurpleAirConfigEntry, domain_data: PurpleAirDomainData
+    config: PurpleAirConfigEntry,
+    domain_data: PurpleAirDomainData,
+    poll_interval: int,
+    config_entry_id: str,
+    points_budget: int,
+    fields: set[str],
+    max_data_age: int,
+    backfill_history: bool,
 ) -> bool:
     coordinator_v1 = domain_data.coordinator_v1
 
@@ -233,6 +329,36 @@ async def _async_register_v1_sensor(
         config.title,
         config.hidden,
         config.key,
+        poll_interval,
+        config_entry_id,
+        points_budget,
+        fields,
+        max_data_age,
+        backfill_history,
     )
 
     return True
+
+
+def _get_enabled_sensor_fields(hass: HomeAssistant, pa_sensor_id: str) -> set[str]:
+    """Get the optional API fields used by the enabled sensors of a v1 sensor.
+
+    Sensors not in the entity registry yet will be enabled by default when their
+    description is.
+    """
+
+    ent_reg = er.async_get(hass)
+    fields: set[str] = set()
+
+    for description in SIMPLE_SENSOR_DESCRIPTIONS:
+        unique_id = f"{pa_sensor_id}_{description.key}"
+        if entity_id := ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id):
+            entry = ent_reg.async_get(entity_id)
+            enabled = entry is not None and not entry.disabled
+        else:
+            enabled = description.entity_registry_enabled_default
+
+        if enabled:
+            fields.update(description.api_fields)
+
+    return fields
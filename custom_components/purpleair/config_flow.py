@@ -2,30 +2,73 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 import logging
+import re
 from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 
 import voluptuous as vol
 
-from homeassistant.config_entries import CONN_CLASS_CLOUD_POLL, HANDLERS, ConfigFlow
+from homeassistant.config_entries import (
+    CONN_CLASS_CLOUD_POLL,
+    HANDLERS,
+    SOURCE_IMPORT,
+    ConfigEntry,
+    ConfigFlow,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_API_KEY, CONF_ID
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    CONF_BACKFILL_HISTORY,
+    CONF_LOCAL_POLL_INTERVAL,
+    CONF_MAX_DATA_AGE,
+    CONF_POINTS_BUDGET,
+    CONF_POLL_INTERVAL,
+    DEFAULT_BACKFILL_HISTORY,
+    DEFAULT_LOCAL_POLL_INTERVAL,
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_POINTS_BUDGET,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    LOCAL_API_KEY,
+    MAX_LOCAL_POLL_INTERVAL,
+    MAX_MAX_DATA_AGE,
+    MAX_POLL_INTERVAL,
+    MIN_LOCAL_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    NEARBY_SENSOR_COUNT,
+    NEARBY_SENSOR_RADIUS,
+)
 from .model import PurpleAirConfigEntry
+from .purple_air_api.local.util import get_local_sensor_config
 from .purple_air_api.v1.exceptions import PurpleAirApiConfigError
-from .purple_air_api.v1.util import get_api_sensor_config
+from .purple_air_api.v1.model import ApiConfigEntry
+from .purple_air_api.v1.util import (
+    get_api_nearby_sensors,
+    get_api_sensor_config,
+    get_api_sensor_configs,
+)
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
 
     from homeassistant.config_entries import ConfigFlowResult
 
+    from .purple_air_api.v1.discovery import SensorDistance
+
 _LOGGER = logging.getLogger(__name__)
 
+CONF_HOST: Final = "host"
 CONF_PA_SENSOR_READ_KEY: Final = "sensor_read_key"
+CONF_PA_SENSORS: Final = "sensors"
+
+# sensors in the bulk step are separated by commas or whitespace
+_SENSOR_LIST_SEPARATOR: Final = re.compile(r"[\s,]+")
 
 
 class UserInputSensorConfig(TypedDict):
@@ -36,6 +79,24 @@ class UserInputSensorConfig(TypedDict):
     sensor_read_key: str | None
 
 
+class UserInputSensorsConfig(TypedDict):
+    """Typed dictionary for "user_input" data of the bulk step."""
+
+    sensors: str
+
+
+class UserInputLocalConfig(TypedDict):
+    """Typed dictionary for "user_input" data of the local step."""
+
+    host: str
+
+
+class UserInputNearbyConfig(TypedDict):
+    """Typed dictionary for "user_input" data of the nearby step."""
+
+    sensors: list[str]
+
+
 @HANDLERS.register(DOMAIN)
 class PurpleAirConfigFlow(ConfigFlow):
     """Configuration flow for setting up a new PurpleAir Sensor."""
@@ -44,20 +105,42 @@ class PurpleAirConfigFlow(ConfigFlow):
     CONNECTION_CLASS = CONN_CLASS_CLOUD_POLL
 
     _api_key: str
+    _nearby_options: dict[str, str]
+    _nearby_sensors: dict[str, ApiConfigEntry]
     _new_config: PurpleAirConfigEntry
     _old_config: PurpleAirConfigEntry
     _session: ClientSession
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for the entry."""
+        return PurpleAirOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle setup user flow."""
 
-        # if we find an existing API key, send them to the "add_sensor" flow instead.
+        # if we find an existing API key, let them add one or many sensors with it.
         api_key = self._get_api_key()
         if api_key:
             self._api_key = api_key
-            return await self.async_step_add_sensor()
+            return self.async_show_menu(
+                step_id="add_menu",
+                menu_options=["add_sensor", "add_sensors", "add_nearby", "add_local"],
+            )
+
+        # sensors on the LAN don't need an API key, so offer them before asking
+        # for one
+        return self.async_show_menu(
+            step_id="setup_menu", menu_options=["api_sensor", "add_local"]
+        )
+
+    async def async_step_api_sensor(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding the first PA sensor along with its API key."""
 
         errors: dict[str, str] = {}
         if user_input is not None:
@@ -83,7 +166,7 @@ class PurpleAirConfigFlow(ConfigFlow):
         )
 
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="api_sensor", data_schema=data_schema, errors=errors
         )
 
     async def async_step_add_sensor(
@@ -117,6 +200,128 @@ class PurpleAirConfigFlow(ConfigFlow):
             step_id="add_sensor", data_schema=data_schema, errors=errors
         )
 
+    async def async_step_add_sensors(
+        self, user_input: UserInputSensorsConfig | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding many PA sensors at once with existing API key.
+
+        Every sensor is looked up together, then an entry is created for each
+        through the import step.
+        """
+
+        errors: dict[str, str] = {}
+        placeholders: dict[str, str] = {}
+        if user_input:
+            (configs, errors, placeholders) = await self._get_sensor_configs(
+                user_input[CONF_PA_SENSORS]
+            )
+
+            if configs and not errors:
+                return await self._create_entries(configs)
+
+        data = vol_data_dict(user_input)
+        data_schema = vol.Schema(
+            {vol.Required(CONF_PA_SENSORS, default=data[CONF_PA_SENSORS]): str}
+        )
+
+        return self.async_show_form(
+            step_id="add_sensors",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    async def async_step_add_nearby(
+        self, user_input: UserInputNearbyConfig | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding PA sensors found near the Home Assistant location.
+
+        The sensors around the location are fetched once and indexed, then the
+        nearest ones that are not configured yet are offered for selection.
+        """
+
+        errors: dict[str, str] = {}
+        if user_input and hasattr(self, "_nearby_sensors"):
+            if selected := user_input[CONF_PA_SENSORS]:
+                return await self._create_entries(
+                    [
+                        create_config_entry(self._api_key, self._nearby_sensors[s])
+                        for s in selected
+                    ]
+                )
+
+            errors[CONF_PA_SENSORS] = "sensors_none_selected"
+
+        if not hasattr(self, "_nearby_sensors"):
+            (nearby, errors) = await self._get_nearby_sensors()
+            if errors:
+                return self.async_show_form(step_id="add_nearby", errors=errors)
+
+            if not nearby:
+                return self.async_abort(
+                    reason="no_nearby_sensors",
+                    description_placeholders={"radius": str(NEARBY_SENSOR_RADIUS)},
+                )
+
+            self._nearby_sensors = {
+                sensor.pa_sensor_id: ApiConfigEntry(
+                    sensor.pa_sensor_id, sensor.name, hidden=False
+                )
+                for (_, sensor) in nearby
+            }
+            self._nearby_options = {
+                sensor.pa_sensor_id: (
+                    f"{sensor.name} ({distance:.1f} km"
+                    f"{'' if sensor.outdoor else ', inside'})"
+                )
+                for (distance, sensor) in nearby
+            }
+
+        data_schema = vol.Schema(
+            {vol.Required(CONF_PA_SENSORS): cv.multi_select(self._nearby_options)}
+        )
+
+        return self.async_show_form(
+            step_id="add_nearby",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={"radius": str(NEARBY_SENSOR_RADIUS)},
+        )
+
+    async def async_step_add_local(
+        self, user_input: UserInputLocalConfig | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding a PA sensor polled over the LAN by its host."""
+
+        errors: dict[str, str] = {}
+        if user_input:
+            (config, errors) = await self._get_local_sensor_config(user_input)
+
+            if config and not errors:
+                await self.async_set_unique_id(config.get_uniqueid())
+                self._abort_if_unique_id_configured()
+
+                return self.async_create_entry(title=config.title, data=config.asdict())
+
+        data = vol_data_dict(user_input)
+        data_schema = vol.Schema(
+            {vol.Required(CONF_HOST, default=data[CONF_HOST]): str}
+        )
+
+        return self.async_show_form(
+            step_id="add_local", data_schema=data_schema, errors=errors
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry for a sensor resolved by the bulk step."""
+
+        config = PurpleAirConfigEntry(**import_data)
+
+        await self.async_set_unique_id(config.get_uniqueid())
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(title=config.title, data=config.asdict())
+
     async def async_step_reauth(self, config_data: dict[str, Any]) -> ConfigFlowResult:
         """Handle reauthentication requests for PurpleAir sensors.
 
@@ -248,7 +453,8 @@ class PurpleAirConfigFlow(ConfigFlow):
         keys = {
             e.data.get("api_key")
             for e in entries
-            if e.data.get("api_version") == 1 and e.data.get("api_key")
+            if e.data.get("api_version") == 1
+            and e.data.get("api_key") not in (None, "", LOCAL_API_KEY)
         }
 
         # only set the key if one exists
@@ -278,25 +484,11 @@ class PurpleAirConfigFlow(ConfigFlow):
                 self._session, api_key, pa_sensor_id, pa_sensor_read_key
             )
 
-            config = PurpleAirConfigEntry(
-                pa_sensor_id=pa_sensor.pa_sensor_id,
-                title=pa_sensor.name,
-                key=pa_sensor.read_key,
-                hidden=pa_sensor.hidden,
-                api_key=api_key,
-                api_version=1,
-            )
+            config = create_config_entry(api_key, pa_sensor)
         except vol.Invalid:
             errors[vol_step] = f"{vol_step}_missing"
         except PurpleAirApiConfigError as error:
-            if error.param == "api_key":
-                errors["api_key"] = f"api_key_{error.extra}"
-            elif error.param == "pa_sensor_id":
-                errors["id"] = f"id_{error.extra}"
-            elif error.param == "bad_request":
-                errors["base"] = "bad_request"
-            elif error.param == "server_error":
-                errors["base"] = "bad_status"
+            errors.update(config_error_dict(error, "id"))
         except Exception as error:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "An unknown error occurred while setting up the PurpleAir Sensor",
@@ -309,6 +501,154 @@ class PurpleAirConfigFlow(ConfigFlow):
 
         return (None, errors)
 
+    async def _get_local_sensor_config(
+        self, user_input: UserInputLocalConfig
+    ) -> tuple[PurpleAirConfigEntry | None, dict[str, str]]:
+        """Create a new PurpleAirConfigEntry for the sensor at the host."""
+
+        errors: dict[str, str] = {}
+        try:
+            if not hasattr(self, "_session"):
+                self._session = async_get_clientsession(self.hass)
+
+            pa_sensor = await get_local_sensor_config(
+                self._session, user_input.get(CONF_HOST) or ""
+            )
+
+            config = create_config_entry(LOCAL_API_KEY, pa_sensor)
+        except PurpleAirApiConfigError as error:
+            errors.update(config_error_dict(error, CONF_HOST))
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "An unknown error occurred while setting up the local PurpleAir Sensor",
+                exc_info=error,
+            )
+            errors["base"] = "unknown"
+        else:
+            _LOGGER.debug("got local configuration: %s", config)
+            return (config, errors)
+
+        return (None, errors)
+
+    async def _get_sensor_configs(
+        self, sensor_list: str
+    ) -> tuple[list[PurpleAirConfigEntry], dict[str, str], dict[str, str]]:
+        """Create new PurpleAirConfigEntries from the bulk step's list of sensors.
+
+        Sensors that are already configured are skipped. Returns the new entries,
+        the errors and the placeholders for the error messages.
+        """
+
+        errors: dict[str, str] = {}
+        placeholders: dict[str, str] = {}
+
+        try:
+            sensors = parse_sensor_list(sensor_list)
+        except vol.Invalid as error:
+            errors[CONF_PA_SENSORS] = "sensors_invalid"
+            placeholders["sensors"] = str(error.msg)
+            return ([], errors, placeholders)
+
+        configured = self._async_current_ids(include_ignore=False)
+        sensors = {
+            pa_sensor_id: read_key
+            for pa_sensor_id, read_key in sensors.items()
+            if f"{DOMAIN}_{pa_sensor_id}" not in configured
+        }
+
+        if not sensors:
+            errors[CONF_PA_SENSORS] = "sensors_configured"
+            return ([], errors, placeholders)
+
+        try:
+            if not hasattr(self, "_session"):
+                self._session = async_get_clientsession(self.hass)
+
+            pa_sensors = await get_api_sensor_configs(
+                self._session, self._api_key, sensors
+            )
+        except PurpleAirApiConfigError as error:
+            errors.update(config_error_dict(error, CONF_PA_SENSORS, "base"))
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "An unknown error occurred while setting up the PurpleAir Sensors",
+                exc_info=error,
+            )
+            errors["base"] = "unknown"
+        else:
+            if missing := [s for s in sensors if s not in pa_sensors]:
+                errors[CONF_PA_SENSORS] = "sensors_not_found"
+                placeholders["sensors"] = ", ".join(missing)
+                return ([], errors, placeholders)
+
+            configs = [
+                create_config_entry(self._api_key, pa_sensor)
+                for pa_sensor in pa_sensors.values()
+            ]
+            _LOGGER.debug("got %s configurations: %s", len(configs), configs)
+            return (configs, errors, placeholders)
+
+        return ([], errors, placeholders)
+
+    async def _get_nearby_sensors(
+        self,
+    ) -> tuple[list[SensorDistance], dict[str, str]]:
+        """Get the nearest sensors to the Home Assistant location not yet added."""
+
+        errors: dict[str, str] = {}
+        try:
+            if not hasattr(self, "_session"):
+                self._session = async_get_clientsession(self.hass)
+
+            latitude = self.hass.config.latitude
+            longitude = self.hass.config.longitude
+            index = await get_api_nearby_sensors(
+                self._session, self._api_key, latitude, longitude, NEARBY_SENSOR_RADIUS
+            )
+        except PurpleAirApiConfigError as error:
+            errors.update(config_error_dict(error, "base", "base"))
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "An unknown error occurred while finding nearby PurpleAir Sensors",
+                exc_info=error,
+            )
+            errors["base"] = "unknown"
+        else:
+            configured = self._async_current_ids(include_ignore=False)
+            nearby = index.nearest(
+                latitude,
+                longitude,
+                NEARBY_SENSOR_COUNT + len(configured),
+                NEARBY_SENSOR_RADIUS,
+            )
+            nearby = [
+                (distance, sensor)
+                for (distance, sensor) in nearby
+                if f"{DOMAIN}_{sensor.pa_sensor_id}" not in configured
+            ]
+            return (nearby[:NEARBY_SENSOR_COUNT], errors)
+
+        return ([], errors)
+
+    async def _create_entries(
+        self, configs: list[PurpleAirConfigEntry]
+    ) -> ConfigFlowResult:
+        """Create an entry for each configuration through the import step."""
+
+        await asyncio.gather(
+            *(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=c.asdict()
+                )
+                for c in configs
+            )
+        )
+
+        return self.async_abort(
+            reason="bulk_add_success",
+            description_placeholders={"count": str(len(configs))},
+        )
+
     async def _migrate_legacy_config(
         self, new_config: PurpleAirConfigEntry
     ) -> ConfigFlowResult:
@@ -337,6 +677,138 @@ class PurpleAirConfigFlow(ConfigFlow):
         return self.async_abort(reason="legacy_migrate_success")
 
 
+class PurpleAirOptionsFlow(OptionsFlow):
+    """Options flow for changing how often a PurpleAir sensor is polled.
+
+    The points budget is shared by every sensor using the same API key, with the
+    smallest budget set on any of them applying to the key.
+    """
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the poll interval, points budget, data age and backfill options."""
+
+        # legacy sensors are all updated together by the v0 API
+        if self.config_entry.data.get("api_version") != 1:
+            return self.async_abort(reason="legacy_options")
+
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        points_budget = self.config_entry.options.get(
+            CONF_POINTS_BUDGET, DEFAULT_POINTS_BUDGET
+        )
+        max_data_age = self.config_entry.options.get(
+            CONF_MAX_DATA_AGE, DEFAULT_MAX_DATA_AGE
+        )
+        backfill_history = self.config_entry.options.get(
+            CONF_BACKFILL_HISTORY, DEFAULT_BACKFILL_HISTORY
+        )
+
+        # sensors on the LAN are polled in seconds, and the rest in minutes
+        if self.config_entry.data.get("api_key") == LOCAL_API_KEY:
+            poll_interval = self.config_entry.options.get(
+                CONF_LOCAL_POLL_INTERVAL, DEFAULT_LOCAL_POLL_INTERVAL
+            )
+            poll_interval_schema = {
+                vol.Required(CONF_LOCAL_POLL_INTERVAL, default=poll_interval): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_LOCAL_POLL_INTERVAL, max=MAX_LOCAL_POLL_INTERVAL),
+                )
+            }
+        else:
+            poll_interval = self.config_entry.options.get(
+                CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+            )
+            poll_interval_schema = {
+                vol.Required(CONF_POLL_INTERVAL, default=poll_interval): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL),
+                )
+            }
+
+        data_schema = vol.Schema(
+            {
+                **poll_interval_schema,
+                vol.Required(CONF_POINTS_BUDGET, default=points_budget): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
+                vol.Required(CONF_MAX_DATA_AGE, default=max_data_age): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_MAX_DATA_AGE)
+                ),
+                vol.Required(CONF_BACKFILL_HISTORY, default=backfill_history): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
+
+
+def create_config_entry(
+    api_key: str, pa_sensor: ApiConfigEntry
+) -> PurpleAirConfigEntry:
+    """Create a PurpleAirConfigEntry for a sensor configuration from the API."""
+
+    return PurpleAirConfigEntry(
+        pa_sensor_id=pa_sensor.pa_sensor_id,
+        title=pa_sensor.name,
+        key=pa_sensor.read_key,
+        hidden=pa_sensor.hidden,
+        api_key=api_key,
+        api_version=1,
+    )
+
+
+def config_error_dict(
+    error: PurpleAirApiConfigError, sensor_key: str, api_key_key: str = "api_key"
+) -> dict[str, str]:
+    """Map a configuration error to the errors of a form.
+
+    Sensor errors are reported on the `sensor_key` field of the form and API key
+    errors on the `api_key_key` field, which is "base" for forms without one.
+    """
+
+    if error.param == "api_key":
+        return {api_key_key: f"api_key_{error.extra}"}
+    if error.param in ("pa_sensor_id", "host"):
+        return {sensor_key: f"{sensor_key}_{error.extra}"}
+    if error.param == "bad_request":
+        return {"base": "bad_request"}
+    if error.param == "server_error":
+        return {"base": "bad_status"}
+
+    return {}
+
+
+def parse_sensor_list(sensor_list: str) -> dict[str, str | None]:
+    """Parse a list of sensors given as `id` or `id:read_key`.
+
+    Returns the read key of each sensor by ID, raising vol.Invalid with the
+    offending entry when one is not formatted correctly.
+
+    Example:
+    >>> parse_sensor_list("1234, 5678:ABCD 9012")
+    {'1234': None, '5678': 'ABCD', '9012': None}
+
+    """
+
+    sensors: dict[str, str | None] = {}
+    for entry in _SENSOR_LIST_SEPARATOR.split(sensor_list.strip()):
+        if not entry:
+            continue
+
+        (pa_sensor_id, _, read_key) = entry.partition(":")
+        if not pa_sensor_id.isdigit() or ":" in read_key:
+            raise vol.Invalid(entry)
+
+        sensors[pa_sensor_id] = read_key or None
+
+    if not sensors:
+        raise vol.Invalid(sensor_list)
+
+    return sensors
+
+
 def vol_data_dict(*args: Any) -> dict[str, Any]:
     """Create a helpful data dictionary for voluptuous schemas.
 
@@ -29,6 +29,85 @@ DOMAIN: Final = "purpleair"
 
 SCAN_INTERVAL: Final = 300
 
+# per sensor poll interval option, in minutes. PurpleAir only updates sensor data
+# every two minutes, so polling any faster would not return anything new.
+CONF_POLL_INTERVAL: Final = "poll_interval"
+DEFAULT_POLL_INTERVAL: Final = SCAN_INTERVAL // 60
+MIN_POLL_INTERVAL: Final = 2
+MAX_POLL_INTERVAL: Final = 1440
+
+# poll interval option of the sensors polled over the LAN, in seconds. a sensor
+# serves a live reading every few seconds, which the EPA averages downsample.
+CONF_LOCAL_POLL_INTERVAL: Final = "local_poll_interval"
+DEFAULT_LOCAL_POLL_INTERVAL: Final = 30
+MIN_LOCAL_POLL_INTERVAL: Final = 10
+MAX_LOCAL_POLL_INTERVAL: Final = 3600
+
+# monthly API points budget option for the key of a sensor, where 0 is unlimited.
+# keys over budget have their sensors polled less often to stay within it.
+CONF_POINTS_BUDGET: Final = "points_budget"
+DEFAULT_POINTS_BUDGET: Final = 0
+
+# per sensor option for the minutes the last good data of a sensor is kept while
+# polling it fails with a transient error, where 0 drops it right away
+CONF_MAX_DATA_AGE: Final = "max_data_age"
+DEFAULT_MAX_DATA_AGE: Final = 30
+MAX_MAX_DATA_AGE: Final = 1440
+
+# per sensor option to seed the EPA average of a new sensor from the last hour of
+# its history, which costs the API points of a history request
+CONF_BACKFILL_HISTORY: Final = "backfill_history"
+DEFAULT_BACKFILL_HISTORY: Final = False
+
+# retries of a poll failing with a transient error, and the base and most seconds
+# of the jittered exponential backoff between them
+API_RETRY_ATTEMPTS: Final = 2
+API_RETRY_BASE_DELAY: Final = 2
+API_RETRY_MAX_DELAY: Final = 15
+
+# consecutive transient failures of an API key that open its circuit breaker, and
+# the seconds it first stays open, doubling up to the most seconds
+BREAKER_FAILURE_THRESHOLD: Final = 5
+BREAKER_COOLDOWN: Final = 120
+BREAKER_MAX_COOLDOWN: Final = 1800
+
+# pool key of the sensors polled over the LAN, which are configured with it in
+# place of an API key
+LOCAL_API_KEY: Final = "local"
+
+# fewest seconds between coordinator ticks when spreading API keys across the
+# poll interval, unless a sensor is polled more often than that
+MIN_TICK_INTERVAL: Final = 30
+
+# seconds without another sensor registration before refreshing the new sensors
+REGISTRATION_REFRESH_DELAY: Final = 2
+
+# kilometers around the home location searched for sensors, and the number of
+# the nearest sensors offered when adding nearby sensors
+NEARBY_SENSOR_RADIUS: Final = 10
+NEARBY_SENSOR_COUNT: Final = 20
+
+# seconds without new data from a sensor before its AQI is unavailable
+STALE_SENSOR_AGE: Final = 5400
+
+# fleet store columns summarized in the diagnostics
+FLEET_DIAGNOSTICS_COLUMNS: Final = (
+    "pm2_5_atm",
+    "pm2_5_aqi_epa",
+    "humidity",
+    "temperature",
+)
+
+# persistence of the EPA average cache across restarts
+EPA_CACHE_SAVE_DELAY: Final = 60
+EPA_CACHE_STORAGE_KEY: Final = f"{DOMAIN}.epa_cache"
+EPA_CACHE_STORAGE_VERSION: Final = 1
+
+# persistence of the API points spent by each key across restarts
+POINTS_LEDGER_SAVE_DELAY: Final = 60
+POINTS_LEDGER_STORAGE_KEY: Final = f"{DOMAIN}.points_ledger"
+POINTS_LEDGER_STORAGE_VERSION: Final = 1
+
 
 SENSOR_TYPES: tuple[PurpleAirSensorEntityDescription, ...] = (
     PurpleAirSensorEntityDescription(
@@ -2,34 +2,80 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime
+import asyncio
+import calendar
+from collections.abc import Callable, Collection, Coroutine
+from datetime import datetime, timedelta
+import hashlib
+from http import HTTPStatus
 import logging
+import math
 from typing import TYPE_CHECKING, Any, Protocol
 
+from aiohttp import ClientError
+
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_COOLDOWN,
+    DEFAULT_BACKFILL_HISTORY,
+    DEFAULT_MAX_DATA_AGE,
+    DOMAIN,
+    EPA_CACHE_SAVE_DELAY,
+    EPA_CACHE_STORAGE_KEY,
+    EPA_CACHE_STORAGE_VERSION,
+    FLEET_DIAGNOSTICS_COLUMNS,
+    MAX_POLL_INTERVAL,
+    MIN_TICK_INTERVAL,
+    POINTS_LEDGER_SAVE_DELAY,
+    POINTS_LEDGER_STORAGE_KEY,
+    POINTS_LEDGER_STORAGE_VERSION,
+    REGISTRATION_REFRESH_DELAY,
+    SCAN_INTERVAL,
+    STALE_SENSOR_AGE,
+)
+from .purple_air_api.exceptions import PurpleAirApiError
+from .purple_air_api.resilience import CircuitBreaker, get_backoff_delay
+from .purple_air_api.v1.const import EPA_AVG_MAX_AGE
 from .purple_air_api.v1.exceptions import PurpleAirApiDataError, PurpleAirServerApiError
-from .purple_air_api.v1.model import NormalizedApiData
+from .purple_air_api.v1.model import (
+    ApiPointsLedger,
+    ApiUpdateStatsHistory,
+    EpaAvgValueCacheSnapshot,
+    NormalizedApiData,
+)
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
 
-    from homeassistant.config_entries import ConfigEntry
-
     from .model import PurpleAirDomainData
-    from .purple_air_api.v1.model import DeviceReading
+    from .purple_air_api.v1.fleet import SensorFleetStore
+    from .purple_air_api.v1.model import DeviceReading, SensorReading
 
 _LOGGER = logging.getLogger(__name__)
 
+# config entry id, device name, model and firmware version synced for a device
+DeviceFingerprint = tuple[str, str, str, str | None]
+
 
 class ApiProtocol(Protocol):
     """Define the protocol all API implementations must implement."""
 
+    fleet: SensorFleetStore
+    points_ledger: ApiPointsLedger
+    update_stats: ApiUpdateStatsHistory
+
     def get_sensor_count(self) -> int:
         """Get registered sensor count from the API."""
         ...  # pylint: disable=unnecessary-ellipsis
@@ -42,20 +88,86 @@ class ApiProtocol(Protocol):
     def unregister_sensor(self, pa_sensor_id: str) -> None:
         """Unregister a sensor from the API."""
 
+    def request_history_backfill(self, pa_sensor_id: str) -> None:
+        """Seed the EPA cache of the sensor from its history, if the API can."""
+
+    def set_sensor_fields(
+        self, pa_sensor_id: str, fields: Collection[str] | None
+    ) -> None:
+        """Set the optional fields wanted for the sensor, or None for all of them."""
+
+    def get_sensor_fields(self) -> dict[str, int]:
+        """Get the sensor fields requested by a poll."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+    def get_epa_cache_snapshot(self) -> EpaAvgValueCacheSnapshot:
+        """Get a snapshot of the EPA value cache for persisting."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+    def restore_epa_cache(self, pa_sensor_id: str, values: list[list[float]]) -> None:
+        """Restore persisted EPA values for the sensor."""
+
     async def async_update(
-        self, do_device_update: bool
+        self, do_device_update: bool, pa_sensor_ids: Collection[str] | None = None
     ) -> dict[str, NormalizedApiData]:
-        """Update method for the Data Update Coordinator to call."""
+        """Update method for the Data Update Coordinator to call.
+
+        Only the given sensors are updated when `pa_sensor_ids` is set. The
+        readings are kept in the `fleet` store, and sensors that did not change
+        since the last update must keep the same version there.
+        """
         ...  # pylint: disable=unnecessary-ellipsis
 
 
 class PurpleAirDataUpdateCoordinator(
     DataUpdateCoordinator[dict[str, NormalizedApiData]]
 ):
-    """Manage coordination between the API and DataUpdateCoordinator."""
+    """Manage coordination between the API and DataUpdateCoordinator.
+
+    Sensors are polled through a pool of API instances, one for each API key, so
+    every key has its own requests, update statistics and error state. A single
+    schedule polls the pool, spreading the keys across the poll interval.
+
+    The API points spent by each key are tallied by its API, and a key with a
+    monthly points budget has the poll intervals of its sensors stretched to spend
+    no more than what is left of the budget over the rest of the month.
+
+    Polls failing with a transient error (server errors, rate limits, timeouts and
+    connection errors) are retried with a jittered backoff, and each key has a
+    circuit breaker that stops polling it for a while after repeated transient
+    errors. Meanwhile the sensors of the key keep their last good data for up to
+    their max data age.
+    """
 
-    api: ApiProtocol | None
+    api_errors: dict[str, str]
+    apis: dict[str, ApiProtocol]
+    changed_sensor_ids: set[str]
+    stale_sensor_ids: set[str]
+    suppressed_writes: int
+    _api_entity_adders: dict[str, dict[str, CALLBACK_TYPE]]
+    _api_entity_entries: dict[str, str]
+    _api_keys: dict[str, str]
+    _breakers: dict[str, CircuitBreaker]
+    _key_points_budgets: dict[str, int]
+    _key_poll_rates: dict[str, float]
+    _config_entry_ids: dict[str, str]
+    _device_fingerprints: dict[str, DeviceFingerprint]
+    _epa_cache_snapshot: EpaAvgValueCacheSnapshot
+    _epa_cache_store: Store[EpaAvgValueCacheSnapshot]
     _last_device_refresh: datetime | None
+    _max_data_ages: dict[str, int]
+    _new_device_sensors: set[str]
+    _next_polls: dict[str, float]
+    _poll_intervals: dict[str, int]
+    _points_budgets: dict[str, int]
+    _points_ledger_snapshot: dict[str, dict[str, Any]]
+    _points_ledger_store: Store[dict[str, dict[str, Any]]]
+    _poll_phases: dict[str, float]
+    _poll_scales: dict[str, float]
+    _polled_at: dict[str, float]
+    _registration_refresh: Debouncer[Coroutine[Any, Any, None]]
+    _remove_sensor_listeners: CALLBACK_TYPE | None
+    _sensor_listeners: dict[str, list[CALLBACK_TYPE]]
 
     def __init__(
         self,
@@ -72,9 +184,63 @@ class PurpleAirDataUpdateCoordinator(
         super().__init__(*args, **kwargs)
 
         self.data: dict[str, NormalizedApiData] = {}
-        self.api = None
+        self.api_errors = {}
+        self.apis = {}
+        self.changed_sensor_ids = set()
+        self.stale_sensor_ids = set()
+        self.suppressed_writes = 0
+        self._api_entity_adders = {}
+        self._api_entity_entries = {}
         self._api_factory = api_factory
+        self._api_keys = {}
+        self._breakers = {}
+        self._key_points_budgets = {}
+        self._key_poll_rates = {}
+        self._config_entry_ids = {}
+        self._device_fingerprints = {}
+        self._epa_cache_snapshot = {}
+        self._epa_cache_store = Store(
+            self.hass, EPA_CACHE_STORAGE_VERSION, EPA_CACHE_STORAGE_KEY
+        )
         self._last_device_refresh = None
+        self._max_data_ages = {}
+        self._new_device_sensors = set()
+        self._next_polls = {}
+        self._poll_intervals = {}
+        self._points_budgets = {}
+        self._points_ledger_snapshot = {}
+        self._points_ledger_store = Store(
+            self.hass, POINTS_LEDGER_STORAGE_VERSION, POINTS_LEDGER_STORAGE_KEY
+        )
+        self._poll_phases = {}
+        self._poll_scales = {}
+        self._polled_at = {}
+        self._registration_refresh = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=REGISTRATION_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+            background=True,
+        )
+        self._remove_sensor_listeners = None
+        self._sensor_listeners = {}
+
+    async def async_load_epa_cache(self) -> None:
+        """Load the persisted EPA value cache to restore sensors from."""
+
+        self._epa_cache_snapshot = await self._epa_cache_store.async_load() or {}
+        _LOGGER.debug(
+            "loaded persisted EPA cache for sensors: %s",
+            list(self._epa_cache_snapshot),
+        )
+
+    async def async_load_points_ledgers(self) -> None:
+        """Load the persisted API points ledgers to restore the APIs from."""
+
+        self._points_ledger_snapshot = (
+            await self._points_ledger_store.async_load() or {}
+        )
 
     def register_sensor(
         self,
@@ -83,61 +249,445 @@ class PurpleAirDataUpdateCoordinator(
         name: str,
         hidden: bool,
         read_key: str | None = None,
+        poll_interval: int = SCAN_INTERVAL,
+        config_entry_id: str | None = None,
+        points_budget: int = 0,
+        fields: Collection[str] | None = None,
+        max_data_age: int = DEFAULT_MAX_DATA_AGE * 60,
+        backfill_history: bool = DEFAULT_BACKFILL_HISTORY,
     ) -> None:
-        """Register the sensor with the coordinator and underlying API."""
+        """Register the sensor with the coordinator and the API for its key.
+
+        The sensor is polled every `poll_interval` seconds, starting with the next
+        refresh. Registering a sensor again changes its poll interval, and moves it
+        to the API of its new key when the key changed. The `config_entry_id` of
+        the sensor is used to sync its device data. The `points_budget` is the
+        monthly API points budget of the sensor's key, where 0 is unlimited. Only
+        the optional `fields` used by the sensor's enabled entities are requested,
+        or all of them when None. The last good data of the sensor is kept for up
+        to `max_data_age` seconds while polling it fails with a transient error or
+        the response leaves it out.
+        With `backfill_history`, a sensor without cached EPA values has them seeded
+        from its history on its first poll, which costs extra API points.
+
+        Once the sensors expected at startup are registered, registrations are
+        coalesced in to a single refresh that runs after none have been made for
+        REGISTRATION_REFRESH_DELAY seconds. That refresh only polls the new sensors
+        (along with any others that happen to be due) and fetches their device
+        data, rather than updating the whole fleet.
+        """
+
+        if self._api_keys.get(pa_sensor_id, api_key) != api_key:
+            self._remove_api_sensor(pa_sensor_id)
 
-        if not self.api:
+        if not (api := self.apis.get(api_key)):
             session = async_get_clientsession(self.hass)
-            self.api = self._api_factory(session, api_key)
+            api = self.apis[api_key] = self._api_factory(session, api_key)
+            self._breakers[api_key] = CircuitBreaker(
+                BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN
+            )
 
-        self.api.register_sensor(pa_sensor_id, name, hidden, read_key)
+            if ledger := self._points_ledger_snapshot.get(get_api_key_id(api_key)):
+                api.points_ledger.restore(ledger)
 
-        # clear the last device update so we fetch device data next refresh!
-        self._last_device_refresh = None
+        api.register_sensor(pa_sensor_id, name, hidden, read_key)
+        api.set_sensor_fields(pa_sensor_id, fields)
+        if backfill_history:
+            api.request_history_backfill(pa_sensor_id)
+
+        self._api_keys[pa_sensor_id] = api_key
+        self._poll_intervals[pa_sensor_id] = poll_interval
+        self._points_budgets[pa_sensor_id] = points_budget
+        self._max_data_ages[pa_sensor_id] = max_data_age
+        self._next_polls[pa_sensor_id] = 0.0
+        self._update_key_polling(api_key)
+        self._update_tick_interval()
+
+        if epa_values := self._epa_cache_snapshot.pop(pa_sensor_id, None):
+            try:
+                api.restore_epa_cache(pa_sensor_id, epa_values)
+            except (TypeError, ValueError) as err:
+                _LOGGER.warning(
+                    "Unable to restore EPA cache for sensor %s: %s", pa_sensor_id, err
+                )
+
+        # fetch device data for the new sensor on its first poll
+        self._new_device_sensors.add(pa_sensor_id)
+
+        if config_entry_id:
+            self._config_entry_ids[pa_sensor_id] = config_entry_id
 
         # request an update if we've had enough sensors register during startup or
         # we're adding a new one
         if self.get_sensor_count() >= self._domain_data.expected_entries_v1:
             self._domain_data.expected_entries_v1 = 0
-            self.hass.async_create_background_task(
-                self._async_refresh(
-                    True,  # log_failures
-                    False,  # raise_on_auth_failed
-                    False,  # scheduled
-                ),
-                "purpleair custom: coordinator._async_refresh",
-            )
+            self._registration_refresh.async_schedule_call()
 
     def unregister_sensor(self, pa_sensor_id: str) -> None:
-        """Unregister the sensor from the coordinator and underlying API."""
+        """Unregister the sensor from the coordinator and the API for its key."""
+
+        self._remove_api_sensor(pa_sensor_id)
+        self._poll_intervals.pop(pa_sensor_id, None)
+        self._points_budgets.pop(pa_sensor_id, None)
+        self._max_data_ages.pop(pa_sensor_id, None)
+        self._polled_at.pop(pa_sensor_id, None)
+        self._next_polls.pop(pa_sensor_id, None)
+        self._new_device_sensors.discard(pa_sensor_id)
+        self._config_entry_ids.pop(pa_sensor_id, None)
+        self._device_fingerprints.pop(pa_sensor_id, None)
+        self._update_tick_interval()
+
+        # drops the sensor from the data without polling anything that isn't due
+        self._registration_refresh.async_schedule_call()
 
-        if self.api:
-            self.api.unregister_sensor(pa_sensor_id)
+    def set_sensor_fields(
+        self, pa_sensor_id: str, fields: Collection[str] | None
+    ) -> None:
+        """Change the optional fields wanted for the sensor.
+
+        A sensor wanting fields it did not have before is polled on the next
+        refresh, so newly enabled entities get their data right away.
+        """
 
-        if self.get_sensor_count() == 0:
-            self.api = None
+        if not (api := self._get_sensor_api(pa_sensor_id)):
+            return
+
+        previous = api.get_sensor_fields()
+        api.set_sensor_fields(pa_sensor_id, fields)
+
+        if not api.get_sensor_fields().keys() <= previous.keys():
+            now = dt_util.utcnow().timestamp()
+            self._next_polls[pa_sensor_id] = min(self._next_polls[pa_sensor_id], now)
+            self._registration_refresh.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending refresh and shut down the coordinator."""
+
+        self._registration_refresh.async_shutdown()
+        await super().async_shutdown()
 
     def get_sensor_count(self) -> int:
-        """Get the registered sensor count from the underlying API."""
+        """Get the registered sensor count from the pool of APIs."""
+
+        return sum(api.get_sensor_count() for api in self.apis.values())
+
+    def claim_api_entities(
+        self, api_key: str, config_entry_id: str, add_entities: CALLBACK_TYPE
+    ) -> None:
+        """Claim the entities about the API of the key for the config entry.
+
+        The entities about an API are only created once for its key, by calling
+        `add_entities` of the first config entry of the key to claim them. When
+        that entry releases them, the next entry of the key creates them in its
+        place, without reloading it.
+        """
 
-        return self.api.get_sensor_count() if self.api else 0
+        adders = self._api_entity_adders.setdefault(api_key, {})
+        adders[config_entry_id] = add_entities
+
+        if self._api_entity_entries.setdefault(api_key, config_entry_id) == (
+            config_entry_id
+        ):
+            add_entities()
+
+    def release_api_entities(self, config_entry_id: str) -> None:
+        """Release the claim of the config entry, handing it over if it owned one."""
+
+        for api_key, adders in self._api_entity_adders.items():
+            if adders.pop(config_entry_id, None) is None:
+                continue
+
+            if self._api_entity_entries.get(api_key) == config_entry_id:
+                del self._api_entity_entries[api_key]
+                if adders:
+                    (owner, add_entities) = next(iter(adders.items()))
+                    self._api_entity_entries[api_key] = owner
+                    add_entities()
+
+            if not adders:
+                del self._api_entity_adders[api_key]
+
+            return
+
+    def get_api_update_stats(self, api_key: str) -> ApiUpdateStatsHistory | None:
+        """Get the rolling update statistics of the API for the key."""
+
+        api = self.apis.get(api_key)
+        return api.update_stats if api else None
+
+    def get_sensor_value(self, pa_sensor_id: str, name: str) -> Any:
+        """Get a SensorReading attribute of the sensor from its API's fleet store.
+
+        Returns None when the coordinator has no data for the sensor, such as
+        after polling it failed.
+        """
+
+        if pa_sensor_id not in self.data or not (
+            api := self._get_sensor_api(pa_sensor_id)
+        ):
+            return None
+
+        return api.fleet.get_value(pa_sensor_id, name)
+
+    def get_sensor_reading(self, pa_sensor_id: str) -> SensorReading | None:
+        """Get all the values of the sensor as a SensorReading."""
+
+        if pa_sensor_id not in self.data or not (
+            api := self._get_sensor_api(pa_sensor_id)
+        ):
+            return None
+
+        return api.fleet.get_reading(pa_sensor_id)
+
+    def get_data_age(self, pa_sensor_id: str) -> float | None:
+        """Get the seconds since the sensor was last polled successfully."""
+
+        if (polled_at := self._polled_at.get(pa_sensor_id)) is None:
+            return None
+
+        return max(dt_util.utcnow().timestamp() - polled_at, 0.0)
+
+    def get_points_usage(self, api_key: str) -> dict[str, Any] | None:
+        """Get the API points spent and budgeted by the key."""
+
+        if not (api := self.apis.get(api_key)):
+            return None
+
+        ledger = api.points_ledger
+        now = dt_util.utcnow()
+        points_per_row = ledger.get_points_per_row()
+
+        # spending continues at the current rate for the rest of the month
+        projected = None
+        if points_per_row is not None:
+            rate = self._get_points_demand(api_key, points_per_row)
+            scale = self._poll_scales.get(api_key, 1.0)
+            projected = round(
+                ledger.month_points + rate / scale * _get_month_seconds_left(now)
+            )
+
+        return {
+            **ledger.as_dict(),
+            "budget": self._get_points_budget(api_key),
+            "projected_month_points": projected,
+            "poll_scale": round(self._poll_scales.get(api_key, 1.0), 2),
+            "points_per_row": round(points_per_row, 1) if points_per_row else None,
+        }
+
+    def get_diagnostics(self, pa_sensor_id: str) -> dict[str, Any]:
+        """Get diagnostics data about the coordinator and the sensor's API."""
+
+        api = self._get_sensor_api(pa_sensor_id)
+        api_key = self._api_keys.get(pa_sensor_id)
+        return {
+            "sensor_count": self.get_sensor_count(),
+            "api_count": len(self.apis),
+            "failed_api_count": len(self.api_errors),
+            "last_update_success": self.last_update_success,
+            "changed_sensors": len(self.changed_sensor_ids),
+            "suppressed_writes": self.suppressed_writes,
+            "api_sensor_count": api.get_sensor_count() if api else None,
+            "api_error": self.api_errors.get(api_key) if api_key else None,
+            "api_breaker": breaker.state
+            if api_key and (breaker := self._breakers.get(api_key))
+            else None,
+            "stale_sensors": len(self.stale_sensor_ids),
+            "data_age": self.get_data_age(pa_sensor_id),
+            "points_usage": self.get_points_usage(api_key) if api_key else None,
+            "update_stats": api.update_stats.as_dict() if api else None,
+            "fleet": {
+                name: api.fleet.get_aggregates(name)
+                for name in FLEET_DIAGNOSTICS_COLUMNS
+            }
+            if api
+            else None,
+        }
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, or only for the updates of a sensor.
+
+        Listeners with a sensor id as their context are only called when that
+        sensor changed in the last update, other listeners are always called. After
+        a failed update every listener is called so entities can report they are
+        unavailable. Skipped sensor listeners count as suppressed writes.
+        """
+
+        if not isinstance(context, str):
+            return super().async_add_listener(update_callback, context)
+
+        # the sensor listeners are called through a single coordinator listener,
+        # which keeps the refresh scheduled while any of them are registered
+        if not self._sensor_listeners:
+            self._remove_sensor_listeners = super().async_add_listener(
+                self._async_update_sensor_listeners
+            )
+
+        self._sensor_listeners.setdefault(context, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._sensor_listeners[context]
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._sensor_listeners[context]
+
+            if not self._sensor_listeners and self._remove_sensor_listeners:
+                self._remove_sensor_listeners()
+                self._remove_sensor_listeners = None
+
+        return remove_listener
+
+    @callback
+    def _async_update_sensor_listeners(self) -> None:
+        if not self.last_update_success:
+            pa_sensor_ids: Collection[str] = list(self._sensor_listeners)
+        else:
+            pa_sensor_ids = self.changed_sensor_ids & self._sensor_listeners.keys()
+
+        called = 0
+        for pa_sensor_id in pa_sensor_ids:
+            for update_callback in list(self._sensor_listeners.get(pa_sensor_id, ())):
+                update_callback()
+                called += 1
+
+        self.suppressed_writes += (
+            sum(len(listeners) for listeners in self._sensor_listeners.values())
+            - called
+        )
 
     async def _async_update_data(self) -> dict[str, NormalizedApiData]:
-        if not self.api:
+        if not self.apis:
             return {}
 
-        try:
-            data = await self.api.async_update(self.should_update_devices)
-        except (PurpleAirApiDataError, PurpleAirServerApiError) as err:
-            raise UpdateFailed(str(err)) from err
+        # daily device updates poll every sensor so they all get current device
+        # data, otherwise device data is only fetched for newly registered sensors
+        refresh_devices = self.should_update_devices
+        now = dt_util.utcnow().timestamp()
+        due = (
+            list(self._next_polls) if refresh_devices else self._get_due_sensor_ids(now)
+        )
+
+        due_by_key: dict[str, list[str]] = {}
+        for pa_sensor_id in due:
+            due_by_key.setdefault(self._api_keys[pa_sensor_id], []).append(pa_sensor_id)
+
+        # each key is polled on its own, so one failing key doesn't hold up the rest
+        results = await asyncio.gather(
+            *(
+                self._async_update_api(api_key, pa_sensor_ids, refresh_devices)
+                for api_key, pa_sensor_ids in due_by_key.items()
+            ),
+            return_exceptions=True,
+        )
+
+        polled: dict[str, NormalizedApiData] = {}
+        failed: list[str] = []
+        retained: list[str] = []
+        for api_key in due_by_key:
+            self._update_poll_scale(api_key)
+
+        for (api_key, pa_sensor_ids), key_result in zip(
+            due_by_key.items(), results, strict=True
+        ):
+            if isinstance(key_result, BaseException):
+                if not isinstance(key_result, Exception):
+                    raise key_result
+
+                _LOGGER.exception(
+                    "Unexpected error updating PurpleAir sensors", exc_info=key_result
+                )
+                self.api_errors[api_key] = str(key_result) or type(key_result).__name__
+                key_result = (None, False)
+
+            (result, transient) = key_result
+            if result is None:
+                _LOGGER.debug("sensors of failed API key: %s", pa_sensor_ids)
+                failed.extend(pa_sensor_ids)
+                if transient:
+                    retained.extend(pa_sensor_ids)
+            else:
+                polled.update(result)
+                retained.extend(
+                    pa_sensor_id
+                    for pa_sensor_id in pa_sensor_ids
+                    if pa_sensor_id not in result
+                )
 
-        if [s["device"] for s in data.values() if s["device"]]:
+        # the next poll counts from when the sensor was due, so polling a tick early
+        # doesn't make it poll more often. a new sensor's first poll is followed by
+        # the phase of its key, spreading the keys across the interval. sensors
+        # missing from the response stay due and are retried on the next tick,
+        # while sensors of a failed key are retried after their interval. keys over
+        # their points budget have the interval stretched by their poll scale.
+        for pa_sensor_id in (polled.keys() | set(failed)) & self._poll_intervals.keys():
+            next_poll = self._next_polls[pa_sensor_id]
+            phase = 0.0 if next_poll else self._get_poll_phase(pa_sensor_id)
+            self._next_polls[pa_sensor_id] = (
+                max(next_poll, now) + self._get_poll_interval(pa_sensor_id) + phase
+            )
+
+        for pa_sensor_id in polled:
+            self._polled_at[pa_sensor_id] = now
+
+        _LOGGER.debug("polled %s of %s due sensors", len(polled), len(due))
+
+        # sensors that were not due keep their last data, as do the sensors of a key
+        # failing with a transient error and due sensors missing from a response,
+        # until their data is older than their max data age. otherwise the sensors
+        # of a failed key are dropped so their entities become unavailable.
+        kept = self._poll_intervals.keys() - set(due)
+        kept.update(
+            pa_sensor_id
+            for pa_sensor_id in retained
+            if now - self._polled_at.get(pa_sensor_id, -math.inf)
+            < self._max_data_ages.get(pa_sensor_id, 0)
+        )
+        data = {
+            pa_sensor_id: sensor_data
+            for pa_sensor_id, sensor_data in self.data.items()
+            if pa_sensor_id in kept
+        }
+        data.update(polled)
+
+        self.stale_sensor_ids = (
+            self.stale_sensor_ids.union(retained) & data.keys()
+        ) - polled.keys()
+
+        if self.api_errors.keys() >= self.apis.keys() and not data:
+            # nothing is left to serve, so entities don't keep their last data
+            self.data = data
+            raise UpdateFailed("; ".join(self.api_errors.values()))
+
+        if refresh_devices:
             self._last_device_refresh = dt_util.utcnow()
 
-            devices: dict[str, DeviceReading] = {}
-            for pa_sensor_id, api_data in data.items():
-                if device_data := api_data["device"]:
-                    devices[pa_sensor_id] = device_data
+            # sensors of a failed key get their device data once the key recovers
+            self._new_device_sensors.update(failed)
+
+        # stale sensors are updated so their entities report the growing data age
+        self.changed_sensor_ids = (
+            self._get_changed_sensor_ids(data) | self.stale_sensor_ids
+        )
+
+        # the store serializes and writes the snapshot in the executor, flushing any
+        # pending write when Home Assistant shuts down.
+        self._epa_cache_store.async_delay_save(
+            self._get_epa_cache_snapshot, EPA_CACHE_SAVE_DELAY
+        )
+        self._points_ledger_store.async_delay_save(
+            self._get_points_ledger_snapshot, POINTS_LEDGER_SAVE_DELAY
+        )
+
+        devices: dict[str, DeviceReading] = {}
+        for pa_sensor_id, api_data in polled.items():
+            if device_data := api_data["device"]:
+                devices[pa_sensor_id] = device_data
+
+        if devices:
+            self._new_device_sensors.difference_update(devices)
 
             self.hass.async_create_background_task(
                 self._async_update_devices(devices),
@@ -146,6 +696,270 @@ class PurpleAirDataUpdateCoordinator(
 
         return data
 
+    async def _async_update_api(
+        self, api_key: str, pa_sensor_ids: list[str], refresh_devices: bool
+    ) -> tuple[dict[str, NormalizedApiData] | None, bool]:
+        """Poll the sensors through the API of the key.
+
+        Returns the polled data, or None if the poll failed along with whether the
+        failure was transient. Transient errors are retried up to
+        API_RETRY_ATTEMPTS times with a jittered backoff while the key's circuit
+        breaker allows. The error of a failed key is kept in `api_errors` until
+        its next success.
+        """
+
+        api = self.apis[api_key]
+        breaker = self._breakers[api_key]
+        do_device_update = refresh_devices or not self._new_device_sensors.isdisjoint(
+            pa_sensor_ids
+        )
+
+        for attempt in range(API_RETRY_ATTEMPTS + 1):
+            if not breaker.allow_request():
+                _LOGGER.debug(
+                    "skipping poll of %s sensors, circuit breaker open for %.0fs",
+                    len(pa_sensor_ids),
+                    breaker.get_retry_after(),
+                )
+                self.api_errors.setdefault(api_key, "circuit breaker open")
+                return (None, True)
+
+            try:
+                polled = await api.async_update(do_device_update, pa_sensor_ids)
+            except Exception as err:  # noqa: BLE001
+                transient = _is_transient_error(err)
+
+                # the server answered a request it won't take, so it isn't down
+                if isinstance(err, PurpleAirApiDataError) and not transient:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+
+                if transient and attempt < API_RETRY_ATTEMPTS:
+                    delay = get_backoff_delay(
+                        attempt, API_RETRY_BASE_DELAY, API_RETRY_MAX_DELAY
+                    )
+                    _LOGGER.debug("retrying poll in %.1fs after error: %s", delay, err)
+                    await asyncio.sleep(delay)
+                    continue
+
+                if api_key not in self.api_errors:
+                    _LOGGER.warning(
+                        "Unable to update %s PurpleAir sensors: %s",
+                        len(pa_sensor_ids),
+                        err,
+                        exc_info=not isinstance(
+                            err, (PurpleAirApiError, ClientError, TimeoutError)
+                        ),
+                    )
+
+                self.api_errors[api_key] = str(err) or type(err).__name__
+                return (None, transient)
+            finally:
+                # a cancelled poll records nothing, so it must give back its trial
+                breaker.release_trial()
+
+            breaker.record_success()
+            break
+
+        if self.api_errors.pop(api_key, None):
+            _LOGGER.info("PurpleAir sensors are updating again")
+
+        return (polled, False)
+
+    def _get_sensor_api(self, pa_sensor_id: str) -> ApiProtocol | None:
+        """Get the API polling the sensor."""
+
+        api_key = self._api_keys.get(pa_sensor_id)
+        return self.apis.get(api_key) if api_key else None
+
+    def _get_poll_phase(self, pa_sensor_id: str) -> float:
+        """Get the seconds the sensor's key is offset from the start of a poll."""
+
+        api_key = self._api_keys.get(pa_sensor_id)
+        return self._poll_phases.get(api_key, 0.0) if api_key else 0.0
+
+    def _remove_api_sensor(self, pa_sensor_id: str) -> None:
+        """Remove the sensor from its API, dropping the API once it is empty."""
+
+        if not (api_key := self._api_keys.pop(pa_sensor_id, None)):
+            return
+
+        if api := self.apis.get(api_key):
+            api.unregister_sensor(pa_sensor_id)
+
+            if api.get_sensor_count() == 0:
+                del self.apis[api_key]
+                self.api_errors.pop(api_key, None)
+                self._breakers.pop(api_key, None)
+                self._poll_scales.pop(api_key, None)
+
+        self._update_key_polling(api_key)
+
+    def _get_poll_interval(self, pa_sensor_id: str) -> float:
+        """Get the seconds until the sensor's next poll, stretched to its budget."""
+
+        api_key = self._api_keys.get(pa_sensor_id)
+        scale = self._poll_scales.get(api_key, 1.0) if api_key else 1.0
+        return min(self._poll_intervals[pa_sensor_id] * scale, MAX_POLL_INTERVAL * 60)
+
+    def _get_points_budget(self, api_key: str) -> int:
+        """Get the monthly points budget of the key, or 0 if it is unlimited."""
+        return self._key_points_budgets.get(api_key, 0)
+
+    def _get_points_demand(self, api_key: str, points_per_row: float) -> float:
+        """Get the points per second spent polling the key's sensors unscaled."""
+        return points_per_row * self._key_poll_rates.get(api_key, 0.0)
+
+    def _update_key_polling(self, api_key: str) -> None:
+        """Update the points budget and poll rate cached for the key.
+
+        Sensors sharing a key can have different budgets, in which case the
+        smallest one applies to the key. The poll rate is the number of sensor
+        polls a second at the configured intervals. Both are read whenever the
+        points of the key are checked, so they are only summed up from the
+        sensors of the key when one registers or unregisters.
+        """
+
+        pa_sensor_ids = [
+            pa_sensor_id
+            for pa_sensor_id, sensor_api_key in self._api_keys.items()
+            if sensor_api_key == api_key
+        ]
+        if not pa_sensor_ids:
+            self._key_points_budgets.pop(api_key, None)
+            self._key_poll_rates.pop(api_key, None)
+            return
+
+        budgets = [
+            budget
+            for pa_sensor_id in pa_sensor_ids
+            if (budget := self._points_budgets.get(pa_sensor_id, 0))
+        ]
+        self._key_points_budgets[api_key] = min(budgets, default=0)
+        self._key_poll_rates[api_key] = sum(
+            1 / interval
+            for pa_sensor_id in pa_sensor_ids
+            if (interval := self._poll_intervals.get(pa_sensor_id, 0))
+        )
+
+    def _update_poll_scale(self, api_key: str) -> None:
+        """Scale the poll intervals of the key to stay within its points budget.
+
+        The points left in the budget are spread evenly over the rest of the
+        month, and the intervals are stretched by how far polling every sensor at
+        its interval would spend faster than that. Intervals are never shortened
+        below the configured ones, so the scale shrinks back to 1 as the budget
+        allows.
+        """
+
+        if not (api := self.apis.get(api_key)) or not (
+            budget := self._get_points_budget(api_key)
+        ):
+            self._poll_scales.pop(api_key, None)
+            return
+
+        if (points_per_row := api.points_ledger.get_points_per_row()) is None:
+            return
+
+        left = max(budget - api.points_ledger.month_points, 0)
+        available = left / _get_month_seconds_left(dt_util.utcnow())
+        demand = self._get_points_demand(api_key, points_per_row)
+
+        scale = max(demand / available, 1.0) if available else math.inf
+        if scale != self._poll_scales.get(api_key, 1.0):
+            _LOGGER.debug("poll scale for API key budget changed to %s", scale)
+
+        self._poll_scales[api_key] = scale
+
+    def _get_due_sensor_ids(self, now: float) -> list[str]:
+        """Get the sensors due to be polled at this tick.
+
+        Sensors due within half a tick are included, so a sensor is polled on the
+        tick closest to its due time rather than always on the tick after it. All
+        the due sensors are requested together, sharing the same requests.
+        """
+
+        tick = self.update_interval.total_seconds() if self.update_interval else 0
+        due_by = now + tick / 2
+        return [
+            pa_sensor_id
+            for pa_sensor_id, next_poll in self._next_polls.items()
+            if next_poll <= due_by
+        ]
+
+    def _update_tick_interval(self) -> None:
+        """Tick often enough to poll each key in turn within the shortest interval.
+
+        Each key is given an evenly spaced phase within the shortest poll interval
+        of the registered sensors and the coordinator ticks once per phase, though
+        no more often than every MIN_TICK_INTERVAL seconds unless a sensor is polled
+        more often than that, like a sensor on the LAN.
+        """
+
+        interval = min(self._poll_intervals.values(), default=SCAN_INTERVAL)
+        spacing = interval / max(len(self.apis), 1)
+
+        self._poll_phases = {
+            api_key: index * spacing for index, api_key in enumerate(self.apis)
+        }
+        self.update_interval = timedelta(
+            seconds=max(spacing, min(interval, MIN_TICK_INTERVAL))
+        )
+
+    def _get_changed_sensor_ids(self, data: dict[str, NormalizedApiData]) -> set[str]:
+        """Get the sensors whose data changed from the last successful update.
+
+        The API keeps the version of unchanged sensors, so a new version means new
+        data. After a failed update every sensor is treated as changed to
+        bring their entities back. Stale sensors are included so their entities
+        can check if they became unavailable.
+        """
+
+        previous = self.data if self.last_update_success else {}
+        stale = dt_util.utcnow() - timedelta(seconds=STALE_SENSOR_AGE)
+
+        changed = previous.keys() - data.keys()
+        for pa_sensor_id, sensor_data in data.items():
+            last = previous.get(pa_sensor_id)
+            if (
+                not last
+                or last["version"] != sensor_data["version"]
+                or (
+                    (api := self._get_sensor_api(pa_sensor_id))
+                    and (last_seen := api.fleet.get_value(pa_sensor_id, "last_seen"))
+                    and last_seen < stale
+                )
+            ):
+                changed.add(pa_sensor_id)
+
+        _LOGGER.debug("sensors changed since last update: %s", changed)
+        return changed
+
+    def _get_epa_cache_snapshot(self) -> EpaAvgValueCacheSnapshot:
+        """Get the snapshot to persist, keeping values not restored yet."""
+
+        snapshot = dict(self._epa_cache_snapshot)
+        for api in self.apis.values():
+            snapshot.update(api.get_epa_cache_snapshot())
+
+        # don't keep sensors around that have nothing left worth restoring
+        oldest = dt_util.utcnow().timestamp() - EPA_AVG_MAX_AGE
+        return {
+            pa_sensor_id: values
+            for pa_sensor_id, values in snapshot.items()
+            if values and values[-1][0] >= oldest
+        }
+
+    def _get_points_ledger_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the points ledgers to persist, keeping ledgers not restored yet."""
+
+        snapshot = dict(self._points_ledger_snapshot)
+        for api_key, api in self.apis.items():
+            snapshot[get_api_key_id(api_key)] = api.points_ledger.as_dict()
+
+        return snapshot
+
     @property
     def should_update_devices(self) -> bool:
         """Indicate if this update should include device data."""
@@ -161,48 +975,110 @@ class PurpleAirDataUpdateCoordinator(
         return self.hass.data[DOMAIN]  # type: ignore[no-any-return]
 
     async def _async_update_devices(self, devices: dict[str, DeviceReading]) -> None:
-        _LOGGER.info("Device update! %s", devices)
+        """Sync the device registry with the device data of the sensors.
 
-        config_entries = self.hass.config_entries.async_entries(DOMAIN)
-
-        def find_entry(pa_sensor_id: str) -> ConfigEntry | None:
-            if not pa_sensor_id:
-                return None
+        Config entries are found through the index kept by register_sensor, and a
+        device is only written when its fingerprint (config entry, name, model and
+        firmware) differs from the last one synced or from the registered device.
+        """
 
-            for config_entry in config_entries:
-                if (
-                    config_entry.data.get("api_version") == 1
-                    and config_entry.data.get("pa_sensor_id") == pa_sensor_id
-                ):
-                    return config_entry
+        _LOGGER.info("Device update! %s", devices)
 
-            return None
+        if not self._config_entry_ids.keys() >= devices.keys():
+            self._index_config_entries()
 
         registry = dr.async_get(self.hass)
+        written = 0
 
         for pa_sensor_id, device_data in devices.items():
-            config_entry = find_entry(pa_sensor_id)
+            config_entry = None
+            if entry_id := self._config_entry_ids.get(pa_sensor_id):
+                config_entry = self.hass.config_entries.async_get_entry(entry_id)
+
             if not config_entry:
                 _LOGGER.debug(
                     "could not find matching config for pa_sensor_id: %s", pa_sensor_id
                 )
                 continue
 
-            _LOGGER.debug(
-                "updating device data for pa_sensor_id: %s, config entry: %s",
-                pa_sensor_id,
+            fingerprint: DeviceFingerprint = (
                 config_entry.entry_id,
+                config_entry.title,
+                f"{device_data.model} {device_data.hardware}",
+                device_data.firmware_version,
             )
+            if self._device_fingerprints.get(pa_sensor_id) == fingerprint:
+                continue
 
-            # async_get_or_create will also update the device all
-            # in one call, so we don't need the device itself
-            registry.async_get_or_create(
-                config_entry_id=config_entry.entry_id,
-                identifiers={(DOMAIN, pa_sensor_id)},
-                name=config_entry.title,
-                model=f"{device_data.model} {device_data.hardware}",
-                sw_version=device_data.firmware_version,
-                manufacturer="PurpleAir",
-            )
+            (_, name, model, sw_version) = fingerprint
+            identifiers = {(DOMAIN, pa_sensor_id)}
+            device = registry.async_get_device(identifiers=identifiers)
+            if (
+                not device
+                or config_entry.entry_id not in device.config_entries
+                or device.name != name
+                or device.model != model
+                or device.sw_version != sw_version
+            ):
+                _LOGGER.debug(
+                    "updating device data for pa_sensor_id: %s, config entry: %s",
+                    pa_sensor_id,
+                    config_entry.entry_id,
+                )
+
+                # async_get_or_create will also update the device all
+                # in one call, so we don't need the device itself
+                registry.async_get_or_create(
+                    config_entry_id=config_entry.entry_id,
+                    identifiers=identifiers,
+                    name=name,
+                    model=model,
+                    sw_version=sw_version,
+                    manufacturer="PurpleAir",
+                )
+                written += 1
+
+            self._device_fingerprints[pa_sensor_id] = fingerprint
+
+        _LOGGER.debug("updated %s of %s devices", written, len(devices))
+
+    def _index_config_entries(self) -> None:
+        """Index the v1 config entries by sensor id."""
+
+        for config_entry in self.hass.config_entries.async_entries(DOMAIN):
+            if config_entry.data.get("api_version") == 1 and (
+                pa_sensor_id := config_entry.data.get("pa_sensor_id")
+            ):
+                self._config_entry_ids[pa_sensor_id] = config_entry.entry_id
+
+
+def _is_transient_error(err: Exception) -> bool:
+    """Check if a failed poll is worth retrying.
+
+    Server errors, rate limiting, timeouts and connection errors are transient,
+    while other client errors (such as a revoked API key) won't go away on retry,
+    and neither will unexpected errors.
+    """
+
+    if isinstance(err, PurpleAirApiDataError):
+        return err.status == HTTPStatus.TOO_MANY_REQUESTS
+
+    return isinstance(err, (PurpleAirServerApiError, ClientError, TimeoutError))
+
+
+def get_api_key_id(api_key: str) -> str:
+    """Get a stable id for the API key which doesn't reveal the key.
+
+    Points ledgers are persisted under this id, and it identifies the entities
+    about the API of the key.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _get_month_seconds_left(now: datetime) -> float:
+    """Get the seconds left in the (UTC) month, at least one."""
 
-            _LOGGER.debug("updated device for pa_sensor_id: %s", pa_sensor_id)
+    days = calendar.monthrange(now.year, now.month)[1]
+    month_end = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_end += timedelta(days=days)
+    return max((month_end - now).total_seconds(), 1.0)
@@ -0,0 +1,36 @@
+"""Diagnostics support for the PurpleAir integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import DOMAIN
+from .model import PurpleAirConfigEntry, PurpleAirDomainData
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+TO_REDACT = {"api_key", "key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Get diagnostics for a config entry."""
+
+    config = PurpleAirConfigEntry(**config_entry.data)
+    domain_data: PurpleAirDomainData = hass.data[DOMAIN]
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(config.asdict(), TO_REDACT),
+    }
+
+    if config.api_version == 1 and (coordinator := domain_data.coordinator_v1):
+        reading = coordinator.get_sensor_reading(config.pa_sensor_id)
+        diagnostics["coordinator"] = coordinator.get_diagnostics(config.pa_sensor_id)
+        diagnostics["sensor"] = asdict(reading) if reading else None
+
+    return diagnostics
@@ -25,14 +25,14 @@ class PurpleAirConfigEntry:
     - key (str):
           API key needed to access hidden sensor.
     - pa_sensor_id (str):
-          Unique id for the sensor.
+          Unique id for the sensor, or its host for sensors polled on the LAN.
     - title (str):
           User provided title of the sensor.
     - api_version (int):
           Version of PA API being used.
     - api_key (str):
-          Api key used to access the API for this sensor.
-          Required if api_version >= 1.
+          Api key used to access the API for this sensor, or "local" for
+          sensors polled on the LAN. Required if api_version >= 1.
 
     """
 
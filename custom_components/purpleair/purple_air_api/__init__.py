@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 import logging
+import time
 from urllib.parse import parse_qs, urlsplit
 
 from aiohttp import ClientSession
 
-from .const import PRIVATE_URL, PUBLIC_URL
+from .const import (
+    MAX_CONCURRENT_REQUESTS,
+    MAX_REQUEST_BURST,
+    MAX_REQUESTS_PER_SECOND,
+    PRIVATE_URL,
+    PUBLIC_URL,
+)
 from .exceptions import (
     PurpleAirApiInvalidResponseError,
     PurpleAirApiStatusError,
     PurpleAirApiUrlError,
 )
-from .model import EpaAvgValueCache, PurpleAirApiConfigEntry, PurpleAirApiSensorData
+from .model import (
+    EpaAvgValueCache,
+    PurpleAirApiConfigEntry,
+    PurpleAirApiSensorData,
+    RequestTiming,
+)
+from .rate_limit import TokenBucket
 from .util import (
     add_aqi_calculations,
     build_sensors,
@@ -28,19 +42,23 @@ _LOGGER = logging.getLogger(__name__)
 class PurpleAirApi:
     """Provides the API capable of communicating with PurpleAir."""
 
+    request_timings: list[RequestTiming]
     sensors: dict[str, PurpleAirApiConfigEntry]
     session: ClientSession
     _api_issues: bool
     _cache: EpaAvgValueCache
+    _rate_limiter: TokenBucket
 
     def __init__(self, session: ClientSession) -> None:
         """Create a new PurpleAirApi instance."""
 
+        self.request_timings = []
         self.sensors = {}
         self.session = session
 
         self._api_issues = False
         self._cache = create_epa_value_cache()
+        self._rate_limiter = TokenBucket(MAX_REQUESTS_PER_SECOND, MAX_REQUEST_BURST)
 
     def get_sensor_count(self) -> int:
         """Get the number of sensors registered with this instance."""
@@ -132,19 +150,49 @@ class PurpleAirApi:
         return urls
 
     async def _fetch_data(self, urls: list[str]) -> list[dict]:
-        """Fetch data from the PurpleAir API endpoint."""
+        """Fetch data from the PurpleAir API endpoint.
+
+        The URLs are fetched concurrently, limited by the shared rate limiter to be
+        nice to the free API, and the results are merged as the responses arrive.
+        The timings of each request are available in `request_timings` afterwards.
+        """
 
         if not urls:
             _LOGGER.debug("no sensors provided")
+            self.request_timings = []
             return []
 
-        results = []
-        for url in urls:
-            _LOGGER.debug("fetching url: %s", url)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        tasks = [asyncio.create_task(self._fetch_url(url, semaphore)) for url in urls]
+
+        results: list[dict] = []
+        timings: list[RequestTiming] = []
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                (url_results, timing) = await next_response
+                timings.append(timing)
+                results += url_results
+        finally:
+            # don't leave requests running if one of them failed
+            for task in tasks:
+                task.cancel()
+
+        self.request_timings = timings
+        return results
+
+    async def _fetch_url(
+        self, url: str, semaphore: asyncio.Semaphore
+    ) -> tuple[list[dict], RequestTiming]:
+        """Fetch the results from a single URL, returning them and the timing."""
 
-            # be nice to the free API when fetching multiple URLs
-            await asyncio.sleep(0.5)
+        async with semaphore:
+            wait = await self._rate_limiter.acquire()
+            started = datetime.now(tz=UTC)
+            start_time = time.perf_counter()
 
+            _LOGGER.debug("fetching url: %s", url)
+
+            results: list[dict] = []
             async with self.session.get(url) as response:
                 if response.status != 200:
                     if not self._api_issues:
@@ -155,17 +203,24 @@ class PurpleAirApi:
                             url,
                             await response.text(),
                         )
+                else:
+                    if self._api_issues:
+                        self._api_issues = False
+                        _LOGGER.info("PurpleAir API responding normally")
+
+                    json = await response.json()
+                    results = json["results"]
+
+            timing = RequestTiming(
+                url=url,
+                status=response.status,
+                started=started,
+                wait=wait,
+                duration=time.perf_counter() - start_time,
+            )
 
-                    continue
-
-                if self._api_issues:
-                    self._api_issues = False
-                    _LOGGER.info("PurpleAir API responding normally")
-
-                json = await response.json()
-                results += json["results"]
-
-        return results
+        _LOGGER.debug("fetched url: %s", timing)
+        return (results, timing)
 
 
 async def get_sensor_configuration(
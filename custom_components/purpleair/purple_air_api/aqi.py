@@ -0,0 +1,110 @@
+"""Provides AQI calculations shared by the PurpleAir APIs."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+import logging
+from typing import Protocol
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AqiBreakpointLike(Protocol):
+    """Describes the attributes needed from an AQI breakpoint."""
+
+    pm_low: float
+    pm_high: float
+    aqi_low: float
+    aqi_high: float
+
+
+class AqiBreakpointTable:
+    """Precomputed AQI breakpoints for fast lookups.
+
+    The breakpoints are de-duplicated and sorted by their low PM value in to
+    parallel boundary and slope arrays, so a value's breakpoint is found with a
+    binary search rather than scanning every breakpoint.
+
+    Attributes:
+        pm_lows  -- The low end of particulate matter for each breakpoint
+        pm_highs -- The high end of particulate matter for each breakpoint
+        aqi_lows -- The low end of the calculated AQI for each breakpoint
+        slopes   -- The AQI change per ugm3 of particulate matter for each breakpoint
+
+    """
+
+    pm_lows: list[float]
+    pm_highs: list[float]
+    aqi_lows: list[float]
+    slopes: list[float]
+
+    def __init__(self, breakpoints: Iterable[AqiBreakpointLike]) -> None:
+        """Create a new AqiBreakpointTable from the breakpoints."""
+
+        unique = sorted(
+            {(bp.pm_low, bp.pm_high, bp.aqi_low, bp.aqi_high) for bp in breakpoints}
+        )
+
+        self.pm_lows = [pm_low for (pm_low, _, _, _) in unique]
+        self.pm_highs = [pm_high for (_, pm_high, _, _) in unique]
+        self.aqi_lows = [aqi_low for (_, _, aqi_low, _) in unique]
+        self.slopes = [
+            (aqi_high - aqi_low) / (pm_high - pm_low)
+            for (pm_low, pm_high, aqi_low, aqi_high) in unique
+        ]
+
+    def calc_aqi(self, value: float) -> int | None:
+        """Calculate the AQI for the value, or None if it's out of range."""
+        return self.calc_aqi_batch((value,))[0]
+
+    def calc_aqi_batch(self, values: Sequence[float]) -> list[int | None]:
+        """Calculate the AQI for each of the values.
+
+        Values that do not fall in a breakpoint (including gaps between
+        breakpoints) result in None.
+        """
+
+        pm_lows = self.pm_lows
+        pm_highs = self.pm_highs
+        aqi_lows = self.aqi_lows
+        slopes = self.slopes
+
+        results: list[int | None] = []
+        for value in values:
+            index = bisect_right(pm_lows, value) - 1
+
+            # NOTE: written so NaN values also fail the range check
+            if index < 0 or not pm_lows[index] <= value <= pm_highs[index]:
+                results.append(None)
+                continue
+
+            aqi_c = value - pm_lows[index]
+            results.append(round(slopes[index] * aqi_c + aqi_lows[index]))
+
+        return results
+
+
+def calc_aqi_batch(
+    values: Sequence[float], index: str, tables: Mapping[str, AqiBreakpointTable]
+) -> list[int | None]:
+    """Calculate the air quality index for each of the values.
+
+    Each value resolves its breakpoint with a binary search over the `index`
+    breakpoint table of `tables`. Values without a valid AQI result in None.
+    """
+
+    if not (table := tables.get(index)):
+        _LOGGER.debug("calc_aqi requested for unknown type: %s", index)
+        return [None] * len(values)
+
+    aqis = table.calc_aqi_batch(values)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for value, aqi in zip(values, aqis, strict=True):
+            if aqi is None:
+                _LOGGER.debug(
+                    "value %s did not fall in valid range for type %s", value, index
+                )
+
+    return aqis
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from typing import Final
 
+from .aqi import AqiBreakpointTable
 from .model import AqiBreakpoint
 
 AQI_BREAKPOINTS = {
     "pm2_5": [
-        AqiBreakpoint(pm_low=500.5, pm_high=999.9, aqi_low=501, aqi_high=999),
         AqiBreakpoint(pm_low=500.5, pm_high=999.9, aqi_low=501, aqi_high=999),
         AqiBreakpoint(pm_low=350.5, pm_high=500.4, aqi_low=401, aqi_high=500),
         AqiBreakpoint(pm_low=250.5, pm_high=350.4, aqi_low=301, aqi_high=400),
@@ -20,6 +20,11 @@ AQI_BREAKPOINTS = {
     ],
 }
 
+AQI_BREAKPOINT_TABLES = {
+    index: AqiBreakpointTable(breakpoints)
+    for index, breakpoints in AQI_BREAKPOINTS.items()
+}
+
 API_ATTR_PM1: Final = "pm1_0_atm"
 API_ATTR_PM10: Final = "pm10_0_atm"
 API_ATTR_PM25: Final = "pm2_5_atm"
@@ -40,6 +45,11 @@ JSON_PROPERTIES: Final = [
     API_ATTR_PRESSURE,
 ]
 
+# limits for being nice to the free API when fetching multiple URLs
+MAX_CONCURRENT_REQUESTS: Final = 4
+MAX_REQUESTS_PER_SECOND: Final = 2
+MAX_REQUEST_BURST: Final = 2
+
 MAX_PM_READING: Final = 1000
 
 PM_PROPERTIES: Final = [API_ATTR_PM25_CF1, API_ATTR_PM1, API_ATTR_PM25, API_ATTR_PM10]
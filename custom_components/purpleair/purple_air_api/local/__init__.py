@@ -0,0 +1 @@
+"""PurpleAir local sensor API."""
@@ -0,0 +1,267 @@
+"""PurpleAir local sensor API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection
+from datetime import UTC, datetime
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientSession
+
+from ..v1.const import API_SENSOR_FIELDS, API_UPDATE_STATS_SAMPLES  # noqa: TID252
+from ..v1.fleet import SensorFleetStore  # noqa: TID252
+from ..v1.model import (  # noqa: TID252
+    ApiConfigEntry,
+    ApiPointsLedger,
+    ApiUpdateStats,
+    ApiUpdateStatsHistory,
+    EpaAvgValueCache,
+    EpaAvgValueCacheSnapshot,
+    NormalizedApiData,
+)
+from ..v1.util import (  # noqa: TID252
+    add_aqi_calculations,
+    apply_sensor_corrections,
+    create_epa_fast_value_cache,
+    create_epa_value_cache,
+    dump_epa_value_cache,
+    restore_epa_values,
+)
+from .const import LOCAL_MAX_CONCURRENT_REQUESTS
+from .util import get_local_sensor_json, read_local_device, read_local_sensor_values
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PurpleAirApiLocal:
+    """Provides access to PurpleAir sensors over the LAN.
+
+    Each sensor serves its own readings as JSON, so sensors are registered by
+    their host and polled directly without an API key or API points. Sensors are
+    polled concurrently through the pooled connections of the session, and their
+    readings are normalized in to the same fleet store and models as the v1 API,
+    with the same corrections and AQI calculations.
+    """
+
+    fleet: SensorFleetStore
+    points_ledger: ApiPointsLedger
+    sensors: dict[str, ApiConfigEntry]
+    session: ClientSession
+    update_stats: ApiUpdateStatsHistory
+    _cache: EpaAvgValueCache
+    _fast_cache: EpaAvgValueCache
+    _failed_hosts: set[str]
+    _last_times: dict[str, str]
+    _request_semaphore: asyncio.Semaphore
+
+    def __init__(self, session: ClientSession) -> None:
+        """Create a new instance of the PurpleAirApiLocal API."""
+
+        self.fleet = SensorFleetStore()
+        self.points_ledger = ApiPointsLedger()
+        self.sensors = {}
+        self.session = session
+        self.update_stats = ApiUpdateStatsHistory(API_UPDATE_STATS_SAMPLES)
+        self._cache = create_epa_value_cache(bucketed=True)
+        self._fast_cache = create_epa_fast_value_cache()
+        self._failed_hosts = set()
+        self._last_times = {}
+        self._request_semaphore = asyncio.Semaphore(LOCAL_MAX_CONCURRENT_REQUESTS)
+
+    def get_sensor_count(self) -> int:
+        """Get the number of sensors registered with this instance."""
+        return len(self.sensors)
+
+    def register_sensor(
+        self, pa_sensor_id: str, name: str, hidden: bool, read_key: str | None = None
+    ) -> None:
+        """Register the sensor at the host `pa_sensor_id` with this instance."""
+
+        if pa_sensor_id in self.sensors:
+            _LOGGER.debug("detected duplicate registration: %s", pa_sensor_id)
+            return
+
+        self.sensors[pa_sensor_id] = ApiConfigEntry(
+            pa_sensor_id=pa_sensor_id, name=name, hidden=hidden, read_key=read_key
+        )
+        self.fleet.add(pa_sensor_id)
+        _LOGGER.debug("registered new local sensor: %s", pa_sensor_id)
+
+    def unregister_sensor(self, pa_sensor_id: str) -> None:
+        """Unregister a sensor from this instance."""
+
+        if pa_sensor_id not in self.sensors:
+            _LOGGER.debug("detected non-existent unregistration: %s", pa_sensor_id)
+            return
+
+        del self.sensors[pa_sensor_id]
+        self.fleet.remove(pa_sensor_id)
+        self._cache.pop(pa_sensor_id, None)
+        self._fast_cache.pop(pa_sensor_id, None)
+        self._failed_hosts.discard(pa_sensor_id)
+        self._last_times.pop(pa_sensor_id, None)
+        _LOGGER.debug("unregistered local sensor: %s", pa_sensor_id)
+
+    def request_history_backfill(self, pa_sensor_id: str) -> None:
+        """Ignore the backfill, as sensors on the LAN don't keep a history."""
+
+    def set_sensor_fields(
+        self, pa_sensor_id: str, fields: Collection[str] | None
+    ) -> None:
+        """Ignore the wanted fields, as sensors always serve all of their data."""
+
+    def get_sensor_fields(self) -> dict[str, int]:
+        """Get the sensor fields read from every sensor."""
+        return API_SENSOR_FIELDS.copy()
+
+    def get_epa_cache_snapshot(self) -> EpaAvgValueCacheSnapshot:
+        """Get a compact snapshot of the EPA value cache for persisting."""
+        return dump_epa_value_cache(self._cache)
+
+    def restore_epa_cache(self, pa_sensor_id: str, values: list[list[float]]) -> None:
+        """Restore persisted EPA values for the sensor, if it has none cached."""
+
+        if self._cache.get(pa_sensor_id):
+            _LOGGER.debug("not restoring EPA values over cache: %s", pa_sensor_id)
+            return
+
+        count = restore_epa_values(self._cache[pa_sensor_id], values)
+        _LOGGER.debug("restored %s EPA values for sensor: %s", count, pa_sensor_id)
+
+    async def async_update(
+        self, do_device_update: bool, pa_sensor_ids: Collection[str] | None = None
+    ) -> dict[str, NormalizedApiData]:
+        """Poll the registered sensors over the LAN.
+
+        Every registered sensor is polled unless `pa_sensor_ids` is given, in which
+        case only the registered sensors among them are polled. Sensors that fail
+        are left out, and the first error is only raised when every
+        sensor failed. Sensors whose reading time has not changed since the last
+        update keep the version of their row in the fleet store.
+        """
+
+        stats = ApiUpdateStats(started=datetime.now(UTC))
+        started = time.perf_counter()
+
+        try:
+            return await self._async_update(do_device_update, pa_sensor_ids, stats)
+        finally:
+            stats.duration = time.perf_counter() - started
+            self.update_stats.append(stats)
+            _LOGGER.debug("update stats: %s", stats)
+
+    async def _async_update(
+        self,
+        do_device_update: bool,
+        pa_sensor_ids: Collection[str] | None,
+        stats: ApiUpdateStats,
+    ) -> dict[str, NormalizedApiData]:
+        hosts = [
+            pa_sensor_id
+            for pa_sensor_id in (
+                self.sensors if pa_sensor_ids is None else pa_sensor_ids
+            )
+            if pa_sensor_id in self.sensors
+        ]
+
+        # every attempt counts as a request, like the cloud API counts them
+        async def fetch_sensor(host: str) -> dict[str, Any]:
+            async with self._request_semaphore:
+                stats.requests += 1
+                (data, size) = await get_local_sensor_json(self.session, host)
+
+            stats.response_bytes += size
+            return data
+
+        with stats.time_stage("network"):
+            results = await asyncio.gather(
+                *(fetch_sensor(host) for host in hosts), return_exceptions=True
+            )
+
+        changed: dict[str, dict[str, Any]] = {}
+        sensor_data: dict[str, NormalizedApiData] = {}
+        errors: list[Exception] = []
+        for host, result in zip(hosts, results, strict=True):
+            if isinstance(result, Exception):
+                # only log when a sensor becomes unreachable, not on every poll
+                if host not in self._failed_hosts:
+                    self._failed_hosts.add(host)
+                    _LOGGER.warning(
+                        "Unable to reach local PurpleAir sensor %s: %s", host, result
+                    )
+                errors.append(result)
+                continue
+
+            if isinstance(result, BaseException):
+                raise result
+
+            if host in self._failed_hosts:
+                self._failed_hosts.discard(host)
+                _LOGGER.info("Local PurpleAir sensor %s is reachable again", host)
+
+            stats.rows += 1
+            device = read_local_device(host, result) if do_device_update else None
+            reading_time = str(result.get("DateTime"))
+            if self._last_times.get(host) == reading_time and (
+                version := self.fleet.get_version(host)
+            ):
+                sensor_data[host] = {"version": version, "device": device}
+            else:
+                changed[host] = result
+                sensor_data[host] = {"version": 0, "device": device}
+
+        if errors and not sensor_data:
+            raise errors[0]
+
+        self._read_changed(changed, sensor_data, stats)
+
+        _LOGGER.debug("local sensor data: %s", sensor_data)
+        return sensor_data
+
+    def _read_changed(
+        self,
+        changed: dict[str, dict[str, Any]],
+        sensor_data: dict[str, NormalizedApiData],
+        stats: ApiUpdateStats,
+    ) -> None:
+        """Write the changed sensor JSON to the fleet store.
+
+        The values are corrected and the AQI is calculated in the store, before the
+        rows are committed and their versions are set in `sensor_data`.
+        """
+
+        if not changed:
+            return
+
+        stats.decoded_rows += len(changed)
+        with stats.time_stage("json_decode"):
+            rows = [self.fleet.add(host) for host in changed]
+            self.fleet.clear(rows)
+
+            values = [read_local_sensor_values(data) for data in changed.values()]
+            for attr in values[0]:
+                self.fleet.set_column(attr, rows, [v[attr] for v in values])
+
+        with stats.time_stage("corrections"):
+            apply_sensor_corrections(self.fleet, rows)
+
+        with stats.time_stage("aqi"):
+            add_aqi_calculations(
+                self.fleet, rows, cache=self._cache, fast_cache=self._fast_cache
+            )
+
+        self.fleet.commit(rows)
+
+        versions = self.fleet.versions
+        for (host, data), row in zip(changed.items(), rows, strict=True):
+            self._last_times[host] = str(data.get("DateTime"))
+            sensor_data[host]["version"] = versions[row]
+
+            # only registered sensors keep a row, including any unregistered
+            # while the requests were running
+            if host not in self.sensors:
+                self.fleet.remove(host)
+                self._last_times.pop(host, None)
@@ -0,0 +1,37 @@
+"""Constants for the PurpleAir local sensor API."""
+
+from __future__ import annotations
+
+from typing import Final
+
+# JSON served by a sensor on the LAN, with its live reading in place of the
+# averages of the last two minutes
+URL_LOCAL_SENSOR_JSON: Final = "http://{host}/json?live=true"
+
+# most sensors polled at once, and the seconds to wait for a sensor to answer
+LOCAL_MAX_CONCURRENT_REQUESTS: Final = 8
+LOCAL_REQUEST_TIMEOUT: Final = 10
+
+# format of the "DateTime" a reading was taken at, in UTC
+LOCAL_DATETIME_FORMAT: Final = "%Y/%m/%dT%H:%M:%Sz"
+
+# sensor JSON fields by the SensorReading attribute read from them
+LOCAL_SENSOR_FIELDS: Final = {
+    "rssi": "rssi",
+    "uptime": "uptime",
+    "analog_input": "Adc",
+    "humidity": "current_humidity",
+    "temperature": "current_temp_f",
+    "pressure": "pressure",
+}
+
+# laser counter fields by the SensorReading attribute read from them. dual laser
+# sensors report channel B with a "_b" suffix, and the channels are averaged like
+# the cloud API does.
+LOCAL_CHANNEL_FIELDS: Final = {
+    "pm1_0_atm": "pm1_0_atm",
+    "pm2_5_atm": "pm2_5_atm",
+    "pm2_5_cf_1": "pm2_5_cf_1",
+    "pm10_0_atm": "pm10_0_atm",
+}
+LOCAL_CHANNEL_B_SUFFIX: Final = "_b"
@@ -0,0 +1,173 @@
+"""Utility functions for the PurpleAir local sensor API."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import json
+import logging
+import math
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from ..v1.exceptions import (  # noqa: TID252
+    PurpleAirApiConfigError,
+    PurpleAirApiDataError,
+    PurpleAirServerApiError,
+)
+from ..v1.model import ApiConfigEntry, DeviceReading  # noqa: TID252
+from .const import (
+    LOCAL_CHANNEL_B_SUFFIX,
+    LOCAL_CHANNEL_FIELDS,
+    LOCAL_DATETIME_FORMAT,
+    LOCAL_REQUEST_TIMEOUT,
+    LOCAL_SENSOR_FIELDS,
+    URL_LOCAL_SENSOR_JSON,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def normalize_host(host: str) -> str:
+    """Get the host of a sensor without any scheme, path or surrounding spaces.
+
+    Example:
+    >>> normalize_host(" http://192.168.1.20/json ")
+    '192.168.1.20'
+
+    """
+
+    host = host.strip()
+    (_, _, rest) = host.rpartition("://")
+    return rest.split("/", 1)[0]
+
+
+async def get_local_sensor_json(
+    session: ClientSession, host: str
+) -> tuple[dict[str, Any], int]:
+    """Get the JSON served by the sensor at the host, and its size in bytes.
+
+    Connection errors and timeouts are raised as is, while an error status raises
+    a PurpleAirServerApiError and a response that isn't sensor JSON raises a
+    PurpleAirApiDataError.
+    """
+
+    url = URL_LOCAL_SENSOR_JSON.format(host=host)
+    timeout = ClientTimeout(total=LOCAL_REQUEST_TIMEOUT)
+    async with session.get(url, timeout=timeout) as resp:
+        reason = str(resp.reason) if resp.reason else "Unknown"
+        if not resp.ok:
+            raise PurpleAirServerApiError(resp.status, reason)
+
+        body = await resp.read()
+
+    try:
+        data = json.loads(body)
+    except ValueError as err:
+        raise PurpleAirApiDataError(
+            resp.status, reason, "Invalid sensor JSON", str(err)
+        ) from err
+
+    if not isinstance(data, dict) or "SensorId" not in data:
+        raise PurpleAirApiDataError(
+            resp.status, reason, "Missing sensor data", "SensorId"
+        )
+
+    return (data, len(body))
+
+
+async def get_local_sensor_config(session: ClientSession, host: str) -> ApiConfigEntry:
+    """Get a new configuration for the sensor at the host on the LAN.
+
+    The sensor is identified by its host, and named by the name it gives itself.
+    Raises a PurpleAirApiConfigError with a `host` param and an extra of
+    `missing`, `unreachable` or `invalid_response` if the sensor can't be used.
+    """
+
+    if not (host := normalize_host(host)):
+        raise PurpleAirApiConfigError("host", "missing")
+
+    try:
+        (data, _) = await get_local_sensor_json(session, host)
+    except (ClientError, TimeoutError, PurpleAirServerApiError) as err:
+        _LOGGER.debug("unable to reach local sensor %s: %s", host, err)
+        raise PurpleAirApiConfigError("host", "unreachable") from err
+    except PurpleAirApiDataError as err:
+        _LOGGER.debug("invalid response from local sensor %s: %s", host, err)
+        raise PurpleAirApiConfigError("host", "invalid_response") from err
+
+    name = str(data.get("Geo") or data["SensorId"])
+    return ApiConfigEntry(pa_sensor_id=host, name=name, hidden=False)
+
+
+def read_local_sensor_values(data: dict[str, Any]) -> dict[str, Any]:
+    """Read the values of sensor JSON by their SensorReading attribute.
+
+    Missing or invalid values are None. The laser counter values are the average
+    of the channels that have a value.
+    """
+
+    values: dict[str, Any] = {
+        attr: _to_float(data.get(field)) for attr, field in LOCAL_SENSOR_FIELDS.items()
+    }
+
+    for attr, field in LOCAL_CHANNEL_FIELDS.items():
+        channels = [
+            value
+            for value in (
+                _to_float(data.get(field)),
+                _to_float(data.get(f"{field}{LOCAL_CHANNEL_B_SUFFIX}")),
+            )
+            if value is not None
+        ]
+        values[attr] = sum(channels) / len(channels) if channels else None
+
+    values["last_seen"] = _to_datetime(data.get("DateTime"))
+    return values
+
+
+def read_local_device(pa_sensor_id: str, data: dict[str, Any]) -> DeviceReading:
+    """Read the device data of sensor JSON.
+
+    Sensors don't report their model, so it is told apart by the number of laser
+    counters.
+    """
+
+    dual_laser = f"pm2_5_atm{LOCAL_CHANNEL_B_SUFFIX}" in data
+    return DeviceReading(
+        pa_sensor_id,
+        latitude=_to_float(data.get("lat")),
+        longitude=_to_float(data.get("lon")),
+        model="PA-II" if dual_laser else "PA-I",
+        hardware=str(data["hardwarediscovered"])
+        if data.get("hardwarediscovered")
+        else None,
+        firmware_version=str(data["version"]) if data.get("version") else None,
+        location_type=str(data["place"]) if data.get("place") else None,
+    )
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert a value to a float, or None if it is missing or not a number."""
+
+    if value is None or isinstance(value, bool):
+        return None
+
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+
+    return number if math.isfinite(number) else None
+
+
+def _to_datetime(value: Any) -> datetime | None:
+    """Convert the time of a reading to a datetime, or None if it is invalid."""
+
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return datetime.strptime(value, LOCAL_DATETIME_FORMAT).replace(tzinfo=UTC)
+    except ValueError:
+        return None
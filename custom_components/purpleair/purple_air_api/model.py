@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
+import time
 
 
 @dataclass
@@ -25,7 +26,7 @@ class PurpleAirApiConfigEntry:
     key: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PurpleAirApiSensorReading:
     """Represents individual sensor data properties from a PurpleAir Sensor.
 
@@ -149,7 +150,7 @@ class PurpleAirApiSensorReading:
             self.confidence[attr] = confidence
 
 
-@dataclass
+@dataclass(slots=True)
 class PurpleAirApiSensorData:
     """Represents parsed individual sensor information from the PurpleAir API.
 
@@ -205,20 +206,40 @@ class AqiBreakpoint:
     aqi_high: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EpaAvgValue:
     """Provides values for the EPA value cache.
 
     Attributes:
         hum  -- List of last humidity readings
         pm25 -- List of last PM2.5 CF=1 readings
-        timestamp -- Date the value reading was created
+        timestamp -- Time the value reading was created, in epoch seconds
 
     """
 
     hum: float
     pm25: float
-    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class RequestTiming:
+    """Describes the timing of a single request to the PurpleAir API.
+
+    Attributes:
+        url      -- The URL that was requested
+        status   -- HTTP status returned by the server
+        started  -- Date and time the request was started
+        wait     -- Seconds spent waiting on the rate limiter before sending
+        duration -- Seconds spent on the request, from sending to reading the body
+
+    """
+
+    url: str
+    status: int
+    started: datetime
+    wait: float
+    duration: float
 
 
 EpaAvgValueCache = dict[str, deque[EpaAvgValue]]
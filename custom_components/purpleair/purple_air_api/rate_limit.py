@@ -0,0 +1,61 @@
+"""Provides request rate limiting for the PurpleAir APIs."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket rate limiter for outgoing API requests.
+
+    Tokens are refilled continuously at `rate` tokens per second, up to a maximum
+    of `capacity` tokens. Each request takes one token, waiting for a token to be
+    refilled if the bucket is empty. This allows short bursts of `capacity`
+    requests while holding the long term request rate to `rate`.
+
+    Attributes:
+        rate     -- Number of tokens added to the bucket per second
+        capacity -- Maximum number of tokens the bucket can hold
+
+    """
+
+    rate: float
+    capacity: float
+    _tokens: float
+    _updated: float
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a new, full TokenBucket."""
+
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Take a token from the bucket, waiting for one if needed.
+
+        Returns the number of seconds spent waiting for the token.
+        """
+
+        started = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+        return time.monotonic() - started
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
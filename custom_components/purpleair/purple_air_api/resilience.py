@@ -0,0 +1,123 @@
+"""Provides retry backoff and circuit breaking for the PurpleAir APIs."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+def get_backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Get the seconds to wait before retrying a failed request.
+
+    Uses exponential backoff with full jitter, so the delay before retry number
+    `attempt` (from 0) is random between 0 and `base * 2 ** attempt`, capped at
+    `cap` seconds. The jitter keeps clients that failed together from retrying in
+    lockstep.
+    """
+
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class CircuitBreaker:
+    """Circuit breaker stopping requests to an API that keeps failing.
+
+    The breaker opens after `threshold` consecutive failures, rejecting requests
+    for `cooldown` seconds. Once the cooldown has passed the breaker is half open
+    and lets a single trial request through: a success closes the breaker, while a
+    failure opens it again for twice as long, up to `max_cooldown` seconds.
+
+    Attributes:
+        threshold    -- Consecutive failures that open the breaker
+        cooldown     -- Seconds the breaker first stays open
+        max_cooldown -- Most seconds the breaker stays open
+        failures     -- Consecutive failures recorded
+
+    """
+
+    threshold: int
+    cooldown: float
+    max_cooldown: float
+    failures: int
+    _open_for: float
+    _opened: float | None
+    _trial: bool
+
+    def __init__(self, threshold: int, cooldown: float, max_cooldown: float) -> None:
+        """Create a new, closed CircuitBreaker."""
+
+        if threshold < 1 or cooldown <= 0 or max_cooldown < cooldown:
+            raise ValueError("threshold must be at least 1 and cooldowns positive")
+
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self._open_for = cooldown
+        self._opened = None
+        self._trial = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the state of the breaker."""
+
+        if self._opened is None:
+            return "closed"
+
+        if time.monotonic() - self._opened < self._open_for:
+            return "open"
+
+        return "half_open"
+
+    def allow_request(self) -> bool:
+        """Check if a request may be made, taking the trial when half open."""
+
+        state = self.state
+        if state == "closed":
+            return True
+
+        if state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+
+        self.failures = 0
+        self._open_for = self.cooldown
+        self._opened = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker if it failed too often."""
+
+        self.failures += 1
+
+        if self._trial:
+            # the trial failed, so stay open for longer
+            self._open_for = min(self._open_for * 2, self.max_cooldown)
+            self._opened = time.monotonic()
+            self._trial = False
+        elif self._opened is None and self.failures >= self.threshold:
+            self._opened = time.monotonic()
+
+    def release_trial(self) -> None:
+        """Give back the trial of a request that ended without success or failure.
+
+        A cancelled trial request records neither, so without this the breaker
+        would stay half open with its trial taken, rejecting every request.
+        """
+
+        self._trial = False
+
+    def get_retry_after(self) -> float:
+        """Get the seconds until the breaker lets a trial request through."""
+
+        if self._opened is None:
+            return 0.0
+
+        return max(self._opened + self._open_for - time.monotonic(), 0.0)
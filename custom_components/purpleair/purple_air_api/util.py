@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 import logging
 from math import fsum
+import sys
+import time
 from typing import Any
 
+from .aqi import calc_aqi_batch
 from .const import (
     API_ATTR_PM25,
     API_ATTR_PM25_AQI,
     API_ATTR_PM25_AQI_RAW,
-    AQI_BREAKPOINTS,
+    AQI_BREAKPOINT_TABLES,
     JSON_PROPERTIES,
     MAX_PM_READING,
     PM_PROPERTIES,
@@ -46,14 +49,18 @@ def add_aqi_calculations(
             cache = create_epa_value_cache()
             setattr(add_aqi_calculations, "cache", cache)
 
+    raw_readings: list[tuple[PurpleAirApiSensorReading, str]] = []
+    raw_values: list[float] = []
+    epa_readings: list[tuple[PurpleAirApiSensorData, str, str, float, float]] = []
+    epa_values: list[float] = []
+
     for pa_sensor in pa_sensors.values():
         readings = pa_sensor.readings
 
         confidence = readings.get_confidence(API_ATTR_PM25)
         if pm25atm := readings.pm2_5_atm:
-            readings.set_value(
-                API_ATTR_PM25_AQI_RAW, calc_aqi(pm25atm, "pm2_5"), confidence
-            )
+            raw_readings.append((readings, confidence))
+            raw_values.append(pm25atm)
 
         # If we have the PM2.5 CF=1 and humidity data, we can calculate AQI using the EPA
         # corrections that were identified to better calibrate PurpleAir sensors to the EPA NowCast
@@ -77,24 +84,39 @@ def add_aqi_calculations(
             pm25_corrected = round(
                 (0.534 * pm25cf1_avg) - (0.0844 * humidity_avg) + 5.604, 1
             )
-            pm25_corrected_aqi = calc_aqi(pm25_corrected, "pm2_5")
-
-            _LOGGER.debug(
-                "(%s): EPA correction: (pm25: %s, hum: %s, corrected: %s, aqi: %s)",
-                pa_sensor.pa_sensor_id,
-                pm25cf1_avg,
-                humidity_avg,
-                pm25_corrected,
-                pm25_corrected_aqi,
-            )
 
             aqi_status = "stable"
             count = len(epa_avg)
             if count < 12:
                 aqi_status = f"calculating ({(12 - count) * 5} mins left)"
 
-            readings.set_value(API_ATTR_PM25_AQI, pm25_corrected_aqi, confidence)
-            readings.set_status(API_ATTR_PM25_AQI, aqi_status)
+            epa_readings.append(
+                (pa_sensor, confidence, aqi_status, pm25cf1_avg, humidity_avg)
+            )
+            epa_values.append(pm25_corrected)
+
+    raw_aqis = calc_aqi_batch(raw_values, "pm2_5", AQI_BREAKPOINT_TABLES)
+    for (readings, confidence), raw_aqi in zip(raw_readings, raw_aqis, strict=True):
+        readings.set_value(API_ATTR_PM25_AQI_RAW, raw_aqi, confidence)
+
+    epa_aqis = calc_aqi_batch(epa_values, "pm2_5", AQI_BREAKPOINT_TABLES)
+    for epa_reading, pm25_corrected, pm25_corrected_aqi in zip(
+        epa_readings, epa_values, epa_aqis, strict=True
+    ):
+        (pa_sensor, confidence, aqi_status, pm25cf1_avg, humidity_avg) = epa_reading
+
+        _LOGGER.debug(
+            "(%s): EPA correction: (pm25: %s, hum: %s, corrected: %s, aqi: %s)",
+            pa_sensor.pa_sensor_id,
+            pm25cf1_avg,
+            humidity_avg,
+            pm25_corrected,
+            pm25_corrected_aqi,
+        )
+
+        readings = pa_sensor.readings
+        readings.set_value(API_ATTR_PM25_AQI, pm25_corrected_aqi, confidence)
+        readings.set_status(API_ATTR_PM25_AQI, aqi_status)
 
 
 def apply_corrections(readings: PurpleAirApiSensorReading) -> None:
@@ -144,9 +166,11 @@ def build_sensors(results: list[dict[str, Any]]) -> dict[str, PurpleAirApiSensor
                 label=str(result.get("Label")),
                 last_seen=datetime.fromtimestamp(result["LastSeen"], UTC),
                 last_update=datetime.fromtimestamp(result["LastUpdateCheck"], UTC),
-                device_location=str(result.get("DEVICE_LOCATIONTYPE", "unknown")),
-                version=str(result.get("Version", "unknown")),
-                type=str(result.get("Type", "unknown")),
+                device_location=sys.intern(
+                    str(result.get("DEVICE_LOCATIONTYPE", "unknown"))
+                ),
+                version=sys.intern(str(result.get("Version", "unknown"))),
+                type=sys.intern(str(result.get("Type", "unknown"))),
                 lat=float(result.get("Lat", 0)) or None,
                 lon=float(result.get("Lon", 0)) or None,
                 rssi=float(result.get("RSSI", 0)),
@@ -174,21 +198,7 @@ def calc_aqi(value: float, index: str) -> int | None:
     See AQI_BREAKPOINTS in const.py.
     """
 
-    if index not in AQI_BREAKPOINTS:
-        _LOGGER.debug("calc_aqi requested for unknown type: %s", index)
-        return None
-
-    aqi_bp_index = AQI_BREAKPOINTS[index]
-    aqi_bp = next((bp for bp in aqi_bp_index if bp.pm_low <= value <= bp.pm_high), None)
-
-    if not aqi_bp:
-        _LOGGER.debug("value %s did not fall in valid range for type %s", value, index)
-        return None
-
-    aqi_range = aqi_bp.aqi_high - aqi_bp.aqi_low
-    pm_range = aqi_bp.pm_high - aqi_bp.pm_low
-    aqi_c = value - aqi_bp.pm_low
-    return round((aqi_range / pm_range) * aqi_c + aqi_bp.aqi_low)
+    return calc_aqi_batch((value,), index, AQI_BREAKPOINT_TABLES)[0]
 
 
 def calculate_sensor_values(sensors: dict[str, PurpleAirApiSensorData]) -> None:
@@ -307,7 +317,7 @@ def _clean_expired_cache_entries(
     pa_sensor: PurpleAirApiSensorData, epa_avg: deque[EpaAvgValue]
 ) -> None:
     """Clean out any old cache entries older than an hour."""
-    hour_ago = datetime.now(tz=UTC) - timedelta(seconds=3600)
+    hour_ago = time.time() - 3600
     expired_count = sum(1 for v in epa_avg if v.timestamp < hour_ago)
     if expired_count:
         _LOGGER.info(
@@ -2,33 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Collection, Iterable
 from datetime import UTC, datetime
 from http import HTTPStatus
+import json
 import logging
-from typing import cast
+import time
+from typing import Any, cast
+from urllib.parse import urlencode
 
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession
 
 from .const import (
+    API_DECODE_BLOCK_ROWS,
     API_DEVICE_FIELDS,
-    API_FLOAT_VALUES,
-    API_INT_VALUES,
+    API_HISTORY_FIELDS,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_REQUIRED_SENSOR_FIELDS,
     API_SENSOR_FIELDS,
-    API_SPECIAL_VALUES,
-    API_STRING_VALUES,
-    API_TIMESTAMP_VALUES,
+    API_UPDATE_STATS_SAMPLES,
+    URL_API_V1_SENSOR_HISTORY,
     URL_API_V1_SENSORS,
 )
+from .decoder import LOOKUP_TABLES, DecodedSensorBatch, SensorDataDecoder
 from .exceptions import PurpleAirApiDataError, PurpleAirServerApiError
+from .fleet import SensorFleetStore
 from .model import (
     ApiConfigEntry,
+    ApiPointsLedger,
+    ApiSensorBatch,
+    ApiUpdateStats,
+    ApiUpdateStatsHistory,
     DeviceReading,
     EpaAvgValueCache,
+    EpaAvgValueCacheSnapshot,
     NormalizedApiData,
-    SensorReading,
 )
-from .responses import ApiErrorResponse, ApiResponse, ApiSensorResponse
-from .util import add_aqi_calculations, apply_sensor_corrections, create_epa_value_cache
+from .parser import SensorResponseParser
+from .responses import ApiErrorResponse, ApiSensorHistoryResponse, ApiSensorResponse
+from .util import (
+    add_aqi_calculations,
+    apply_sensor_corrections,
+    create_epa_fast_value_cache,
+    create_epa_value_cache,
+    downsample_epa_values,
+    dump_epa_value_cache,
+    estimate_request_points,
+    plan_sensor_batches,
+    read_epa_history_values,
+    restore_epa_values,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,26 +61,46 @@ class PurpleAirApiV1:
     """Provides access to the PurpleAir v1 API."""
 
     api_key: str
+    fleet: SensorFleetStore
+    points_ledger: ApiPointsLedger
     sensors: dict[str, ApiConfigEntry]
     session: ClientSession
+    update_stats: ApiUpdateStatsHistory
     _api_issues: bool
+    _backfill_sensors: set[str]
     _cache: EpaAvgValueCache
+    _fast_cache: EpaAvgValueCache
+    _decoders: dict[tuple[tuple[tuple[str, int], ...], bool], SensorDataDecoder]
     _headers: dict[str, str]
     _last_device_refresh: datetime | None
+    _last_rows: dict[str, tuple[SensorDataDecoder, list[Any]]]
+    _request_semaphore: asyncio.Semaphore
+    _sensor_fields: dict[str, int] | None
     _warn_missing_fields: bool
 
     def __init__(self, session: ClientSession, api_key: str) -> None:
         """Create a new instance of the PurpleAirApiV1 API."""
 
         self.api_key = api_key
+        self.fleet = SensorFleetStore()
+        self.points_ledger = ApiPointsLedger()
         self.sensors = {}
         self.session = session
+        self.update_stats = ApiUpdateStatsHistory(API_UPDATE_STATS_SAMPLES)
         self._api_issues = False
-        self._cache = create_epa_value_cache()
+        self._backfill_sensors = set()
+        # a poll interval under the window's sample interval would otherwise fill
+        # the window with less than an hour of readings
+        self._cache = create_epa_value_cache(bucketed=True)
+        self._fast_cache = create_epa_fast_value_cache()
+        self._decoders = {}
         self._headers = {
             "Accept": "application/json",
             "X-API-Key": api_key,
         }
+        self._last_rows = {}
+        self._request_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._sensor_fields = None
         self._warn_missing_fields = False
 
         _LOGGER.debug("Created v1 API instance for API key: %s", self.api_key)
@@ -82,6 +126,8 @@ class PurpleAirApiV1:
         )
 
         self.sensors[pa_sensor_id] = sensor
+        self.fleet.add(pa_sensor_id)
+        self._sensor_fields = None
         self._last_device_refresh = None
         _LOGGER.debug("registered new sensor: %s", sensor)
 
@@ -93,31 +139,316 @@ class PurpleAirApiV1:
             return
 
         del self.sensors[pa_sensor_id]
+        self.fleet.remove(pa_sensor_id)
+        self._sensor_fields = None
+        self._backfill_sensors.discard(pa_sensor_id)
+        self._cache.pop(pa_sensor_id, None)
+        self._fast_cache.pop(pa_sensor_id, None)
+        self._last_rows.pop(pa_sensor_id, None)
         _LOGGER.debug("unregistered sensor: %s", pa_sensor_id)
 
+    def request_history_backfill(self, pa_sensor_id: str) -> None:
+        """Seed the EPA cache of the sensor from its history on the next update.
+
+        This saves waiting for an hour of updates to fill the cache, at the cost
+        of the API points of a history request. Sensors that have cached values
+        by the next update (such as values restored after a restart) are skipped.
+        """
+
+        if pa_sensor_id not in self.sensors:
+            _LOGGER.debug("not backfilling unregistered sensor: %s", pa_sensor_id)
+            return
+
+        self._backfill_sensors.add(pa_sensor_id)
+
+    def set_sensor_fields(
+        self, pa_sensor_id: str, fields: Collection[str] | None
+    ) -> None:
+        """Set the optional sensor fields wanted for the sensor.
+
+        Polls request the required fields of API_REQUIRED_SENSOR_FIELDS along with
+        the fields wanted by any registered sensor, where None wants every field.
+        """
+
+        if not (sensor := self.sensors.get(pa_sensor_id)):
+            _LOGGER.debug("not setting fields of unregistered sensor: %s", pa_sensor_id)
+            return
+
+        sensor.fields = frozenset(fields) if fields is not None else None
+        self._sensor_fields = None
+
+    def get_sensor_fields(self) -> dict[str, int]:
+        """Get the sensor fields requested by a poll, by their unmapped position."""
+
+        if self._sensor_fields is None:
+            wanted: set[str] = set(API_REQUIRED_SENSOR_FIELDS)
+            for sensor in self.sensors.values():
+                if sensor.fields is None:
+                    wanted.update(API_SENSOR_FIELDS)
+                    break
+
+                wanted.update(sensor.fields)
+
+            # keep the order of API_SENSOR_FIELDS so the layouts stay comparable
+            self._sensor_fields = {
+                field: index
+                for field, index in API_SENSOR_FIELDS.items()
+                if field in wanted
+            }
+            _LOGGER.debug("requesting sensor fields: %s", list(self._sensor_fields))
+
+        return self._sensor_fields.copy()
+
+    def get_epa_cache_snapshot(self) -> EpaAvgValueCacheSnapshot:
+        """Get a compact snapshot of the EPA value cache for persisting."""
+        return dump_epa_value_cache(self._cache)
+
+    def restore_epa_cache(self, pa_sensor_id: str, values: list[list[float]]) -> None:
+        """Restore persisted EPA values for the sensor, if it has none cached."""
+
+        if self._cache.get(pa_sensor_id):
+            _LOGGER.debug("not restoring EPA values over cache: %s", pa_sensor_id)
+            return
+
+        count = restore_epa_values(self._cache[pa_sensor_id], values)
+        _LOGGER.debug("restored %s EPA values for sensor: %s", count, pa_sensor_id)
+
     async def async_update(
-        self, do_device_update: bool
+        self, do_device_update: bool, pa_sensor_ids: Collection[str] | None = None
     ) -> dict[str, NormalizedApiData]:
-        """Handle updating data from the v1 PurpleAir API."""
+        """Handle updating data from the v1 PurpleAir API.
+
+        Every registered sensor is updated unless `pa_sensor_ids` is given, in
+        which case only the registered sensors among them are requested. The
+        sensors are split in to batches that keep the request URLs
+        and row counts bounded, which are requested concurrently and merged back
+        together. If only some of the batches fail, the data from the successful
+        batches is still returned. Any pending history backfill is requested
+        alongside the batches so it is in the cache before the AQI is calculated.
+
+        Each response is decoded in to a staging store, and only once every batch
+        has been read are the decoded rows copied to the `fleet` store, where the
+        corrections and AQI are calculated for every changed sensor at once before
+        their rows are committed with a new version. A batch that fails leaves the
+        rows of its sensors as they were. The readings are read from
+        the store by row, and sensors whose data has not changed since the last
+        update keep the version of their row, so callers can detect changes by
+        comparing versions.
+
+        The time spent in each stage of the update is added to `update_stats`,
+        whether the update succeeds or not.
+        """
+
+        stats = ApiUpdateStats(started=datetime.now(UTC))
+        started = time.perf_counter()
+
+        try:
+            return await self._async_update(do_device_update, pa_sensor_ids, stats)
+        finally:
+            stats.duration = time.perf_counter() - started
+            self.update_stats.append(stats)
+            _LOGGER.debug("update stats: %s", stats)
+
+    async def _async_update(
+        self,
+        do_device_update: bool,
+        pa_sensor_ids: Collection[str] | None,
+        stats: ApiUpdateStats,
+    ) -> dict[str, NormalizedApiData]:
+        with stats.time_stage("request_build"):
+            fields = self.get_sensor_fields()
+
+            # add device fields when requested to do a device update
+            if do_device_update:
+                fields.update(API_DEVICE_FIELDS)
+
+            base_url_length = len(URL_API_V1_SENSORS) + len(
+                f"?{urlencode({'fields': ','.join(fields)})}"
+            )
+            sensors: Iterable[ApiConfigEntry] = self.sensors.values()
+            if pa_sensor_ids is not None:
+                sensors = [
+                    self.sensors[pa_sensor_id]
+                    for pa_sensor_id in pa_sensor_ids
+                    if pa_sensor_id in self.sensors
+                ]
+
+            batches = plan_sensor_batches(sensors, base_url_length)
+
+        backfill_sensors = self._backfill_sensors
+        self._backfill_sensors = set()
+
+        async def fetch_batch(batch: ApiSensorBatch) -> DecodedSensorBatch:
+            async with self._request_semaphore:
+                return await self._async_fetch_batch(
+                    batch, fields.copy(), do_device_update, stats
+                )
 
-        sensor_ids = {s.pa_sensor_id for s in self.sensors.values()}
-        read_keys = {
-            s.read_key for s in self.sensors.values() if s.hidden and s.read_key
-        }
+        (results, _) = await asyncio.gather(
+            asyncio.gather(
+                *(fetch_batch(batch) for batch in batches), return_exceptions=True
+            ),
+            self._async_backfill_epa_cache(backfill_sensors),
+        )
+
+        decoded: list[DecodedSensorBatch] = []
+        errors: list[Exception] = []
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Failed to update PurpleAir sensors %s: %s",
+                    batch.pa_sensor_ids,
+                    result,
+                )
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                decoded.append(result)
+
+        if errors and not decoded:
+            raise errors[0]
+
+        # the decoded rows are copied in, corrected and committed without yielding,
+        # so readers of the fleet store only ever see committed readings
+        changed_devices: dict[str, DeviceReading | None] = {}
+        unchanged_data: dict[str, NormalizedApiData] = {}
+        for result in decoded:
+            self.fleet.copy_from(result.store)
+            self._last_rows.update(result.raw_rows)
+            changed_devices.update(result.devices)
+            unchanged_data.update(result.unchanged)
+
+        # corrections and AQI are only calculated for new readings, unchanged sensors
+        # already hold the results from when they were read
+        rows = [self.fleet.rows[pa_sensor_id] for pa_sensor_id in changed_devices]
+        with stats.time_stage("corrections"):
+            apply_sensor_corrections(self.fleet, rows)
+
+        with stats.time_stage("aqi"):
+            add_aqi_calculations(
+                self.fleet, rows, cache=self._cache, fast_cache=self._fast_cache
+            )
+
+        self.fleet.commit(rows)
+
+        sensor_data: dict[str, NormalizedApiData] = {}
+        versions = self.fleet.versions
+        for (pa_sensor_id, device), row in zip(
+            changed_devices.items(), rows, strict=True
+        ):
+            sensor_data[pa_sensor_id] = {"version": versions[row], "device": device}
+
+            # only registered sensors keep a row, including any unregistered
+            # while the requests were running
+            if pa_sensor_id not in self.sensors:
+                self.fleet.remove(pa_sensor_id)
+                self._last_rows.pop(pa_sensor_id, None)
+
+        _LOGGER.debug(
+            "sensor data: %s, unchanged sensors: %s", sensor_data, list(unchanged_data)
+        )
+        sensor_data.update(unchanged_data)
+        return sensor_data
+
+    async def _async_backfill_epa_cache(self, pa_sensor_ids: set[str]) -> None:
+        """Seed the EPA cache of the sensors from the last hour of their history.
+
+        Sensors that already have cached values (such as values restored after a
+        restart) are skipped. Failures are logged and otherwise ignored, leaving
+        the cache to fill from regular updates.
+        """
 
-        fields = API_SENSOR_FIELDS.copy()
+        sensors = [
+            self.sensors[pa_sensor_id]
+            for pa_sensor_id in pa_sensor_ids
+            if pa_sensor_id in self.sensors and not self._cache.get(pa_sensor_id)
+        ]
 
-        # add device fields when requested to do a device update
-        if do_device_update:
-            fields.update(API_DEVICE_FIELDS)
+        if sensors:
+            await asyncio.gather(*(self._async_backfill_sensor(s) for s in sensors))
 
+    async def _async_backfill_sensor(self, sensor: ApiConfigEntry) -> None:
+        """Seed the EPA cache of a single sensor from its history."""
+
+        pa_sensor_id = sensor.pa_sensor_id
+        window = self._cache[pa_sensor_id]
+        now = datetime.now(tz=UTC)
+
+        url = URL_API_V1_SENSOR_HISTORY.format(pa_sensor_id=pa_sensor_id)
         params = {
-            "fields": ",".join(fields),
-            "show_only": ",".join(sensor_ids),
+            "start_timestamp": str(int((now - window.max_age).timestamp())),
+            "end_timestamp": str(int(now.timestamp())),
+            "average": "0",
+            "fields": ",".join(API_HISTORY_FIELDS),
         }
 
-        if read_keys:
-            params["read_keys"] = ",".join(read_keys)
+        if sensor.hidden and sensor.read_key:
+            params["read_key"] = sensor.read_key
+
+        try:
+            async with (
+                self._request_semaphore,
+                self.session.get(url, headers=self._headers, params=params) as resp,
+            ):
+                if not resp.ok:
+                    _LOGGER.warning(
+                        "Unable to backfill EPA readings for sensor %s: HTTP %s %s",
+                        pa_sensor_id,
+                        resp.status,
+                        resp.reason,
+                    )
+                    return
+
+                data: ApiSensorHistoryResponse = await resp.json()
+
+            values = read_epa_history_values(data)
+
+            # history rows are not sensor rows, so the backfill only adds to the
+            # points spent polling the sensors
+            self.points_ledger.record(
+                estimate_request_points(data["fields"], len(data["data"])), 0, now
+            )
+        except (ClientError, TimeoutError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning(
+                "Unable to backfill EPA readings for sensor %s: %s", pa_sensor_id, err
+            )
+            return
+
+        # history is reported more often than we update, so match the window rate
+        for value in downsample_epa_values(values, window.sample_interval):
+            window.append(value)
+
+        window.expire(now)
+        _LOGGER.debug(
+            "backfilled %s EPA values from %s history readings for sensor: %s",
+            len(window),
+            len(values),
+            pa_sensor_id,
+        )
+
+    async def _async_fetch_batch(
+        self,
+        batch: ApiSensorBatch,
+        fields: dict[str, int],
+        do_device_update: bool,
+        stats: ApiUpdateStats,
+    ) -> DecodedSensorBatch:
+        """Request and decode the data for a single batch of sensors.
+
+        Returns the sensors that changed, whose values were decoded in to the
+        staging store of the batch, along with the previous data of sensors that
+        did not.
+        """
+
+        with stats.time_stage("request_build"):
+            params = {
+                "fields": ",".join(fields),
+                "show_only": ",".join(batch.pa_sensor_ids),
+            }
+
+            if batch.read_keys:
+                params["read_keys"] = ",".join(batch.read_keys)
 
         _LOGGER.debug(
             "calling api %s with headers %s and params %s",
@@ -126,35 +457,179 @@ class PurpleAirApiV1:
             params,
         )
 
-        async with self.session.get(
-            URL_API_V1_SENSORS, headers=self._headers, params=params
-        ) as resp:
+        stats.requests += 1
+        with stats.time_stage("network"):
+            resp = await self.session.get(
+                URL_API_V1_SENSORS, headers=self._headers, params=params
+            )
+
+        async with resp:
             if resp.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
                 reason = str(resp.reason) if resp.reason else "Unknown"
                 raise PurpleAirServerApiError(resp.status, reason)
 
-            raw_data: ApiResponse = await resp.json()
-
             if not resp.ok:
-                error_data = cast("ApiErrorResponse", raw_data)
+                with stats.time_stage("network"):
+                    body = await resp.read()
+
+                stats.response_bytes += len(body)
+                reason = str(resp.reason) if resp.reason else "Unknown"
+                try:
+                    error_data: ApiErrorResponse = json.loads(body)
+                    description = error_data["description"]
+                    error = error_data["error"]
+                except (KeyError, TypeError, ValueError) as err:
+                    raise PurpleAirApiDataError(
+                        resp.status, reason, "Invalid error response", str(err)
+                    ) from err
+
+                raise PurpleAirApiDataError(resp.status, reason, description, error)
+
+            # a body that isn't valid JSON or doesn't have the expected layout is
+            # reported like any other bad response from the API
+            try:
+                decoded = await self._async_read_sensor_response(
+                    resp, fields, do_device_update, stats
+                )
+            except (IndexError, KeyError, TypeError, ValueError) as err:
                 reason = str(resp.reason) if resp.reason else "Unknown"
                 raise PurpleAirApiDataError(
                     resp.status,
                     reason,
-                    error_data["description"],
-                    error_data["error"],
+                    "Invalid sensor response",
+                    str(err) or type(err).__name__,
+                ) from err
+
+        rows = len(decoded.devices) + len(decoded.unchanged)
+        self.points_ledger.record(
+            estimate_request_points(fields, rows), rows, datetime.now(UTC)
+        )
+
+        return decoded
+
+    async def _async_read_sensor_response(
+        self,
+        resp: ClientResponse,
+        fields: dict[str, int],
+        do_device_update: bool,
+        stats: ApiUpdateStats,
+    ) -> DecodedSensorBatch:
+        """Read and decode a sensor response as the body is received.
+
+        Once the fields and lookup tables ahead of the data have been read, rows
+        are decoded in blocks while the rest of the body is still being received.
+        If the response only sends them after the data, the rows are held until
+        the whole body has been read.
+        """
+
+        parser = SensorResponseParser()
+        header = cast("ApiSensorResponse", parser.header)
+        tables = {table for field, table in LOOKUP_TABLES.items() if field in fields}
+        decoder: SensorDataDecoder | None = None
+        pending: list[list[Any]] = []
+        decoded = DecodedSensorBatch()
+
+        def decode_pending() -> None:
+            nonlocal decoder, pending
+
+            if not decoder:
+                with stats.time_stage("fields_position"):
+                    self._update_fields_position(fields, header["fields"])
+
+                decoder = self._get_decoder(fields, do_device_update)
+
+            with stats.time_stage("read_sensor_data"):
+                decoded_rows = self._decode_changed(
+                    decoder, header, pending, fields.get("last_seen"), decoded
                 )
 
-        _LOGGER.debug("raw data: %s", raw_data)
+            stats.rows += len(pending)
+            stats.decoded_rows += decoded_rows
+            pending = []
+
+        while True:
+            with stats.time_stage("network"):
+                chunk = await resp.content.readany()
+
+            if not chunk:
+                break
+
+            stats.response_bytes += len(chunk)
+            with stats.time_stage("json_decode"):
+                pending.extend(parser.feed(chunk))
+
+            if (
+                len(pending) >= API_DECODE_BLOCK_ROWS
+                and parser.in_data
+                and "fields" in header
+                and tables.issubset(header)
+            ):
+                decode_pending()
+
+        with stats.time_stage("json_decode"):
+            pending.extend(parser.close())
+
+        decode_pending()
+
+        _LOGGER.debug("read %s rows with response header: %s", stats.rows, header)
+        return decoded
+
+    def _decode_changed(
+        self,
+        decoder: SensorDataDecoder,
+        data: ApiSensorResponse,
+        rows: list[list[Any]],
+        last_seen_column: int | None,
+        decoded: DecodedSensorBatch,
+    ) -> int:
+        """Decode the rows of the response that changed since the last update.
+
+        A row is unchanged when it was decoded with the same decoder and both the
+        last seen time and raw row values match the previous committed update.
+        Those sensors keep the reading committed to their row rather than being
+        decoded again. Device updates always decode every row. Changed rows are
+        decoded in to the staging store of the batch, returning how many were.
+        """
+
+        index_column = decoder.index_column
+        changed_rows: list[list[Any]] = []
+        unchanged = decoded.unchanged
+
+        for row in rows:
+            pa_sensor_id = str(row[index_column])
+            previous = self._last_rows.get(pa_sensor_id)
+            decoded.raw_rows[pa_sensor_id] = (decoder, row)
+
+            if (
+                not decoder.include_device_data
+                and previous
+                and previous[0] is decoder
+                and (
+                    last_seen_column is None
+                    or previous[1][last_seen_column] == row[last_seen_column]
+                )
+                and previous[1] == row
+                and (version := self.fleet.get_version(pa_sensor_id))
+            ):
+                unchanged[pa_sensor_id] = {"version": version, "device": None}
+            else:
+                changed_rows.append(row)
 
-        data = cast("ApiSensorResponse", raw_data)
-        self._update_fields_position(fields, data["fields"])
-        sensor_data = _read_sensor_data(fields, data, do_device_update)
-        apply_sensor_corrections(sensor_data)
-        add_aqi_calculations(sensor_data, cache=self._cache)
+        decoded.devices.update(decoder.decode(data, changed_rows, decoded.store))
+        return len(changed_rows)
 
-        _LOGGER.debug("sensor data: %s", sensor_data)
-        return sensor_data
+    def _get_decoder(
+        self, fields: dict[str, int], include_device_data: bool
+    ) -> SensorDataDecoder:
+        """Get the compiled decoder for the field layout, compiling it if needed."""
+
+        layout = (tuple(fields.items()), include_device_data)
+        if not (decoder := self._decoders.get(layout)):
+            decoder = SensorDataDecoder(fields, include_device_data)
+            self._decoders[layout] = decoder
+            _LOGGER.debug("compiled decoder for field layout: %s", layout)
+
+        return decoder
 
     def _update_fields_position(
         self, fields: dict[str, int], api_fields: list[str]
@@ -179,61 +654,3 @@ class PurpleAirApiV1:
         elif self._warn_missing_fields:
             _LOGGER.info("API is now returning all expected fields")
             self._warn_missing_fields = False
-
-
-def _read_sensor_data(
-    fields: dict[str, int], data: ApiSensorResponse, include_device_data: bool = False
-) -> dict[str, NormalizedApiData]:
-    processed_data: dict[str, NormalizedApiData] = {}
-
-    for raw_sensor in data["data"]:
-        pa_sensor_id = str(raw_sensor[fields["sensor_index"]])
-        sensor_data = SensorReading(pa_sensor_id)
-        device_data = DeviceReading(pa_sensor_id) if include_device_data else None
-
-        for field, index in fields.items():
-            # skip over the sensor index field
-            if field == "sensor_index":
-                continue
-
-            value = None
-
-            if field in API_INT_VALUES:
-                value = raw_sensor[index]
-                value = int(value) if value else None
-
-            if field in API_FLOAT_VALUES:
-                value = raw_sensor[index]
-                value = float(value) if value else 0.0
-
-            if field in API_STRING_VALUES:
-                value = raw_sensor[index]
-                value = str(value) if value else ""
-
-            if field in API_TIMESTAMP_VALUES:
-                value = raw_sensor[index]
-                value = datetime.fromtimestamp(value, UTC) if value else None
-
-            if field in API_SPECIAL_VALUES:
-                special_index = raw_sensor[index]
-                value = None
-                if field == "location_type":
-                    value = str(data["location_types"][special_index])
-                elif field == "private":
-                    value = raw_sensor[index] == "1"
-                elif field == "channel_state":
-                    value = str(data["channel_states"][special_index])
-                elif field == "channel_flags":
-                    value = str(data["channel_flags"][special_index])
-
-            sensor_data.set_value(field, value)
-
-            if device_data:
-                device_data.set_value(field, value)
-
-        processed_data[pa_sensor_id] = {
-            "sensor": sensor_data,
-            "device": device_data,
-        }
-
-    return processed_data
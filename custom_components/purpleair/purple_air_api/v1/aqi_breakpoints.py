@@ -3,11 +3,11 @@
 # required to prevent circular dependency
 from __future__ import annotations
 
+from ..aqi import AqiBreakpointTable  # noqa: TID252
 from .model import AqiBreakpoint
 
 AQI_BREAKPOINTS = {
     "pm2_5": [
-        AqiBreakpoint(pm_low=500.5, pm_high=999.9, aqi_low=501, aqi_high=999),
         AqiBreakpoint(pm_low=500.5, pm_high=999.9, aqi_low=501, aqi_high=999),
         AqiBreakpoint(pm_low=350.5, pm_high=500.4, aqi_low=401, aqi_high=500),
         AqiBreakpoint(pm_low=250.5, pm_high=350.4, aqi_low=301, aqi_high=400),
@@ -18,3 +18,8 @@ AQI_BREAKPOINTS = {
         AqiBreakpoint(pm_low=0, pm_high=12.0, aqi_low=0, aqi_high=50),
     ],
 }
+
+AQI_BREAKPOINT_TABLES = {
+    index: AqiBreakpointTable(breakpoints)
+    for index, breakpoints in AQI_BREAKPOINTS.items()
+}
@@ -8,8 +8,59 @@ URL_API_V1_KEYS_URL: Final = "https://api.purpleair.com/v1/keys"
 
 URL_API_V1_SENSOR: Final = "https://api.purpleair.com/v1/sensors/{pa_sensor_id}"
 
+URL_API_V1_SENSOR_HISTORY: Final = (
+    "https://api.purpleair.com/v1/sensors/{pa_sensor_id}/history"
+)
+
 URL_API_V1_SENSORS: Final = "https://api.purpleair.com/v1/sensors"
 
+# rolling window used to average readings for the EPA corrected AQI
+EPA_AVG_MAX_AGE: Final = 3600
+EPA_AVG_MAX_SAMPLES: Final = 12
+
+# short rolling window of one minute buckets for the fast reacting EPA AQI
+EPA_FAST_AVG_MAX_AGE: Final = 600
+EPA_FAST_AVG_MAX_SAMPLES: Final = 10
+
+# fields requested from the history endpoint to seed the EPA average cache
+API_HISTORY_FIELDS: Final = ["humidity", "pm2.5_cf_1"]
+
+# limits used when splitting the registered sensors in to multiple requests
+API_MAX_BATCH_ROWS: Final = 100
+API_MAX_CONCURRENT_REQUESTS: Final = 4
+API_MAX_URL_LENGTH: Final = 2000
+
+# rows of a streamed response decoded together while the rest is received
+API_DECODE_BLOCK_ROWS: Final = 500
+
+# number of updates kept to calculate the rolling update timing percentiles
+API_UPDATE_STATS_SAMPLES: Final = 100
+
+# estimated API points charged for a request, and for each field of each row it
+# returns. fields not listed cost API_POINTS_PER_FIELD, while the sensor index
+# returned with every row is free.
+API_POINTS_PER_REQUEST: Final = 1
+API_POINTS_PER_FIELD: Final = 1
+API_FIELD_POINTS: Final = {"sensor_index": 0, "time_stamp": 0}
+
+# fields needed to configure a sensor
+API_CONFIG_FIELDS: Final = ["name", "primary_key_a", "private"]
+
+# fields needed to list the sensors near a location
+API_DISCOVERY_FIELDS: Final = ["name", "latitude", "longitude", "location_type"]
+
+# seconds the sensors found in an area are cached
+DISCOVERY_CACHE_TTL: Final = 900
+
+# size in degrees of the cells sensors are indexed in, about 5.5 km of latitude
+DISCOVERY_GRID_CELL_SIZE: Final = 0.05
+
+# seconds a validated API key is cached, and an invalid or non-READ key
+API_KEY_CACHE_TTL: Final = 3600
+API_KEY_NEGATIVE_CACHE_TTL: Final = 300
+
+# every sensor field that can be requested, though only the required fields and
+# the fields wanted by the registered sensors are requested in a poll
 API_SENSOR_FIELDS: Final = {
     "sensor_index": -1,
     "rssi": -1,
@@ -28,6 +79,20 @@ API_SENSOR_FIELDS: Final = {
     "uptime": -1,
 }
 
+# fields requested for every sensor: the sensor index, and the fields the EPA AQI
+# and its attributes are calculated from
+API_REQUIRED_SENSOR_FIELDS: Final = frozenset(
+    {
+        "sensor_index",
+        "rssi",
+        "analog_input",
+        "last_seen",
+        "humidity",
+        "pm2.5_cf_1",
+        "uptime",
+    }
+)
+
 API_DEVICE_FIELDS: Final = {
     "model": -1,
     "hardware": -1,
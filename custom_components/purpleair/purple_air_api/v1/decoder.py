@@ -0,0 +1,207 @@
+"""Decoder for the data matrix returned by the v1 /sensors endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field as dataclass_field, fields as dataclass_fields
+from datetime import UTC, datetime
+import logging
+import sys
+from typing import Any, Final
+
+from .const import (
+    API_FLOAT_VALUES,
+    API_INT_VALUES,
+    API_STRING_VALUES,
+    API_TIMESTAMP_VALUES,
+)
+from .fleet import FLEET_LABEL_COLUMNS, FLEET_NUMERIC_COLUMNS, SensorFleetStore
+from .model import DeviceReading, NormalizedApiData, SensorReading
+from .responses import ApiSensorResponse
+
+ValueConverter = Callable[[Any], Any]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _to_int(value: Any) -> int | None:
+    return int(value) if value else None
+
+
+def _to_float(value: Any) -> float:
+    return float(value) if value else 0.0
+
+
+def _to_str(value: Any) -> str:
+    # the string values repeat across sensors and updates, so share a single copy
+    return sys.intern(str(value)) if value else ""
+
+
+def _to_timestamp(value: Any) -> datetime | None:
+    return datetime.fromtimestamp(value, UTC) if value else None
+
+
+def _to_private(value: Any) -> bool:
+    return value == "1"
+
+
+STATIC_CONVERTERS: Final[dict[str, ValueConverter]] = {
+    **dict.fromkeys(API_INT_VALUES, _to_int),
+    **dict.fromkeys(API_FLOAT_VALUES, _to_float),
+    **dict.fromkeys(API_STRING_VALUES, _to_str),
+    **dict.fromkeys(API_TIMESTAMP_VALUES, _to_timestamp),
+    "private": _to_private,
+}
+
+# fields whose values are indexes in to a lookup table sent with the response
+LOOKUP_TABLES: Final = {
+    "location_type": "location_types",
+    "channel_state": "channel_states",
+    "channel_flags": "channel_flags",
+}
+
+SENSOR_READING_FIELDS: Final = frozenset(
+    f.name for f in dataclass_fields(SensorReading)
+)
+DEVICE_READING_FIELDS: Final = frozenset(
+    f.name for f in dataclass_fields(DeviceReading)
+)
+
+
+@dataclass
+class DecoderColumn:
+    """Describes how a single column of the data matrix is decoded.
+
+    Attributes:
+      index: Position of the column in each data row.
+      field: API field name of the column.
+      sensor_attr: SensorReading attribute to write to, if any.
+      device_attr: DeviceReading attribute to write to, if any.
+
+    """
+
+    index: int
+    field: str
+    sensor_attr: str | None
+    device_attr: str | None
+
+    def get_converter(self, data: ApiSensorResponse) -> ValueConverter:
+        """Get the value converter for this column of the given response."""
+
+        if table_name := LOOKUP_TABLES.get(self.field):
+            names = [sys.intern(str(name)) for name in data[table_name]]  # type: ignore[literal-required]
+            return names.__getitem__
+
+        return STATIC_CONVERTERS[self.field]
+
+
+class SensorDataDecoder:
+    """Decodes v1 sensor data rows for a fixed field layout.
+
+    A decoder is compiled once per field layout into a table of columns holding
+    the converter and target attributes, so decoding a response walks each column
+    once and writes the converted values straight in to the fleet store.
+    """
+
+    include_device_data: bool
+    columns: list[DecoderColumn]
+    index_column: int
+    cleared_attrs: tuple[str, ...]
+
+    def __init__(self, fields: dict[str, int], include_device_data: bool) -> None:
+        """Compile a new decoder for the given field positions."""
+
+        self.include_device_data = include_device_data
+        self.columns = []
+        self.index_column = fields["sensor_index"]
+
+        for field, index in fields.items():
+            # skip over the sensor index field and any field we can't convert
+            if field == "sensor_index":
+                continue
+
+            if field not in STATIC_CONVERTERS and field not in LOOKUP_TABLES:
+                _LOGGER.debug("requested field, %s, has no known converter", field)
+                continue
+
+            # incoming field names may have sensor or device attributes
+            attr = field.replace(".", "_")
+            sensor_attr = attr if attr in SENSOR_READING_FIELDS else None
+            device_attr = (
+                attr if include_device_data and attr in DEVICE_READING_FIELDS else None
+            )
+
+            if sensor_attr or device_attr:
+                self.columns.append(
+                    DecoderColumn(index, field, sensor_attr, device_attr)
+                )
+
+        # store columns that no field is decoded in to are cleared instead
+        decoded_attrs = {column.sensor_attr for column in self.columns}
+        self.cleared_attrs = tuple(
+            attr
+            for attr in (*FLEET_NUMERIC_COLUMNS, *FLEET_LABEL_COLUMNS)
+            if attr not in decoded_attrs
+        )
+
+    def decode(
+        self,
+        data: ApiSensorResponse,
+        rows: list[list[Any]],
+        store: SensorFleetStore,
+    ) -> dict[str, DeviceReading | None]:
+        """Decode rows of the response in to the sensor fleet store.
+
+        The values of each row replace the values in the sensor's row of the
+        store, adding the sensor to the store if needed. Returns the device
+        readings of the decoded sensors, which are None when device data is not
+        included.
+        """
+
+        index_column = self.index_column
+        pa_sensor_ids = [str(row[index_column]) for row in rows]
+        store_rows = [store.add(pa_sensor_id) for pa_sensor_id in pa_sensor_ids]
+        store.clear(store_rows, self.cleared_attrs)
+
+        devices: list[DeviceReading | None] = (
+            [DeviceReading(pa_sensor_id) for pa_sensor_id in pa_sensor_ids]
+            if self.include_device_data
+            else [None] * len(rows)
+        )
+
+        for column in self.columns:
+            convert = column.get_converter(data)
+            index = column.index
+            values = [convert(row[index]) for row in rows]
+
+            if attr := column.sensor_attr:
+                store.set_column(attr, store_rows, values)
+
+            if attr := column.device_attr:
+                for device, value in zip(devices, values, strict=True):
+                    setattr(device, attr, value)
+
+        return dict(zip(pa_sensor_ids, devices, strict=True))
+
+
+@dataclass
+class DecodedSensorBatch:
+    """Sensor data decoded from a single response, ahead of being committed.
+
+    Rows are decoded in to a staging store of their own, so a response that fails
+    part way through leaves the fleet store untouched.
+
+    Attributes:
+      store: Staging store holding the decoded rows of the changed sensors.
+      devices: Device readings of the changed sensors, None without device data.
+      unchanged: Previous data of the sensors that did not change.
+      raw_rows: Raw data row of every sensor in the response, with its decoder.
+
+    """
+
+    store: SensorFleetStore = dataclass_field(default_factory=SensorFleetStore)
+    devices: dict[str, DeviceReading | None] = dataclass_field(default_factory=dict)
+    unchanged: dict[str, NormalizedApiData] = dataclass_field(default_factory=dict)
+    raw_rows: dict[str, tuple[SensorDataDecoder, list[Any]]] = dataclass_field(
+        default_factory=dict
+    )
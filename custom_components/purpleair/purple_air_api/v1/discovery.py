@@ -0,0 +1,262 @@
+"""Spatial index used to discover the sensors near a location."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import heapq
+import math
+import time
+from typing import Final
+
+from .const import DISCOVERY_GRID_CELL_SIZE
+from .model import DiscoveredSensor
+
+EARTH_RADIUS_KM: Final = 6371.0088
+
+# kilometers in one degree of latitude (and of longitude at the equator)
+KM_PER_DEGREE: Final = math.pi * EARTH_RADIUS_KM / 180
+
+BoundingBox = tuple[float, float, float, float]
+
+# (distance in km, sensor) results of index queries, nearest first
+SensorDistance = tuple[float, DiscoveredSensor]
+
+
+def get_bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> BoundingBox:
+    """Get the box around the location holding every point within the radius.
+
+    Returns the (north west latitude, north west longitude, south east latitude,
+    south east longitude) corners of the box, as taken by the /v1/sensors API. The
+    box is clamped to valid coordinates rather than wrapped around the poles or the
+    antimeridian.
+    """
+
+    lat_delta = radius_km / KM_PER_DEGREE
+    north = min(latitude + lat_delta, 90.0)
+    south = max(latitude - lat_delta, -90.0)
+
+    # a degree of longitude is shortest at the edge of the box closest to a pole
+    cos_lat = math.cos(math.radians(max(abs(north), abs(south))))
+    lon_delta = radius_km / (KM_PER_DEGREE * cos_lat) if cos_lat > 0 else 180.0
+    west = max(longitude - lon_delta, -180.0)
+    east = min(longitude + lon_delta, 180.0)
+
+    return (north, west, south, east)
+
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Get the great circle distance in kilometers between two locations."""
+
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class SensorGridIndex:
+    """Grid of sensor locations answering nearest and radius queries.
+
+    Sensors are bucketed in to square cells of `cell_size` degrees, so a query
+    only measures the distance to sensors in the cells around the location
+    rather than to every sensor. Nearest queries search rings of cells outward
+    from the location until no closer sensor can remain.
+
+    Attributes:
+        cell_size -- Size of each cell in degrees
+        cells     -- Sensors in each (latitude, longitude) cell
+
+    """
+
+    cell_size: float
+    cells: dict[tuple[int, int], list[DiscoveredSensor]]
+
+    def __init__(
+        self,
+        sensors: Iterable[DiscoveredSensor],
+        cell_size: float = DISCOVERY_GRID_CELL_SIZE,
+    ) -> None:
+        """Create a new SensorGridIndex of the sensors."""
+
+        self.cell_size = cell_size
+        self.cells = {}
+        self._count = 0
+
+        for sensor in sensors:
+            cell = self._get_cell(sensor.latitude, sensor.longitude)
+            self.cells.setdefault(cell, []).append(sensor)
+            self._count += 1
+
+        # bounds of the occupied cells, limiting how far nearest queries search
+        self._lat_cells = (
+            (min(lat for lat, _ in self.cells), max(lat for lat, _ in self.cells))
+            if self.cells
+            else (0, 0)
+        )
+        self._lon_cells = (
+            (min(lon for _, lon in self.cells), max(lon for _, lon in self.cells))
+            if self.cells
+            else (0, 0)
+        )
+
+    def __len__(self) -> int:
+        """Get the number of sensors in the index."""
+        return self._count
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+        max_distance: float | None = None,
+    ) -> list[SensorDistance]:
+        """Get the closest sensors to the location, nearest first.
+
+        Returns up to `count` sensors, leaving out any further than `max_distance`
+        kilometers when given.
+        """
+
+        if count <= 0 or not self.cells:
+            return []
+
+        (lat_cell, lon_cell) = self._get_cell(latitude, longitude)
+        max_ring = max(
+            lat_cell - self._lat_cells[0],
+            self._lat_cells[1] - lat_cell,
+            lon_cell - self._lon_cells[0],
+            self._lon_cells[1] - lon_cell,
+        )
+
+        # max heap of the closest sensors found so far by negated distance, with
+        # ties going to the sensor found first
+        found: list[tuple[float, int, DiscoveredSensor]] = []
+        order = 0
+        for ring in range(max_ring + 1):
+            # sensors in this ring are at least a ring (less a cell) away
+            bound = self._get_ring_distance(latitude, ring)
+            if len(found) == count and -found[0][0] <= bound:
+                break
+
+            if max_distance is not None and bound > max_distance:
+                break
+
+            for cell in self._iter_ring(lat_cell, lon_cell, ring):
+                for sensor in self.cells.get(cell, ()):
+                    distance = haversine_distance(
+                        latitude, longitude, sensor.latitude, sensor.longitude
+                    )
+                    if max_distance is not None and distance > max_distance:
+                        continue
+
+                    order -= 1
+                    item = (-distance, order, sensor)
+                    if len(found) < count:
+                        heapq.heappush(found, item)
+                    elif distance < -found[0][0]:
+                        heapq.heapreplace(found, item)
+
+        return sorted(
+            ((-distance, sensor) for (distance, _, sensor) in found),
+            key=lambda result: result[0],
+        )
+
+    def within(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> list[SensorDistance]:
+        """Get the sensors within the radius of the location, nearest first."""
+
+        (north, west, south, east) = get_bounding_box(latitude, longitude, radius_km)
+        (south_cell, west_cell) = self._get_cell(south, west)
+        (north_cell, east_cell) = self._get_cell(north, east)
+
+        # only search the occupied cells of a box larger than the index
+        lat_cells = range(
+            max(south_cell, self._lat_cells[0]), min(north_cell, self._lat_cells[1]) + 1
+        )
+        lon_cells = range(
+            max(west_cell, self._lon_cells[0]), min(east_cell, self._lon_cells[1]) + 1
+        )
+
+        results: list[SensorDistance] = []
+        for lat in lat_cells:
+            for lon in lon_cells:
+                for sensor in self.cells.get((lat, lon), ()):
+                    distance = haversine_distance(
+                        latitude, longitude, sensor.latitude, sensor.longitude
+                    )
+                    if distance <= radius_km:
+                        results.append((distance, sensor))
+
+        results.sort(key=lambda result: result[0])
+        return results
+
+    def _get_cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return (
+            math.floor(latitude / self.cell_size),
+            math.floor(longitude / self.cell_size),
+        )
+
+    def _get_ring_distance(self, latitude: float, ring: int) -> float:
+        """Get the shortest distance in kilometers to a sensor in the ring."""
+
+        if ring <= 1:
+            return 0.0
+
+        # longitude degrees are shortest at the edge of the ring closest to a pole
+        edge = min(abs(latitude) + ring * self.cell_size, 90.0)
+        span = (ring - 1) * self.cell_size * KM_PER_DEGREE
+        return span * min(1.0, math.cos(math.radians(edge)))
+
+    @staticmethod
+    def _iter_ring(
+        lat_cell: int, lon_cell: int, ring: int
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate the cells `ring` cells away from the cell."""
+
+        if ring == 0:
+            yield (lat_cell, lon_cell)
+            return
+
+        for lon in range(lon_cell - ring, lon_cell + ring + 1):
+            yield (lat_cell - ring, lon)
+            yield (lat_cell + ring, lon)
+
+        for lat in range(lat_cell - ring + 1, lat_cell + ring):
+            yield (lat, lon_cell - ring)
+            yield (lat, lon_cell + ring)
+
+
+class SensorDiscoveryCache:
+    """Caches the index of the sensors in an area for a limited time.
+
+    Attributes:
+        ttl     -- Seconds an index is cached
+        entries -- Cached (index, expires) by API key and bounding box
+
+    """
+
+    ttl: float
+    entries: dict[tuple[str, BoundingBox], tuple[SensorGridIndex, float]]
+
+    def __init__(self, ttl: float) -> None:
+        """Create a new, empty SensorDiscoveryCache."""
+
+        self.ttl = ttl
+        self.entries = {}
+
+    def get(self, api_key: str, bbox: BoundingBox) -> SensorGridIndex | None:
+        """Get the cached index of the area, if it has not expired."""
+
+        now = time.monotonic()
+        self.entries = {k: e for k, e in self.entries.items() if e[1] > now}
+
+        entry = self.entries.get((api_key, bbox))
+        return entry[0] if entry else None
+
+    def set(self, api_key: str, bbox: BoundingBox, index: SensorGridIndex) -> None:
+        """Cache the index of the area."""
+        self.entries[(api_key, bbox)] = (index, time.monotonic() + self.ttl)
@@ -0,0 +1,288 @@
+"""Columnar store holding the latest readings of every registered sensor."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import fields as dataclass_fields
+from datetime import UTC, datetime
+from itertools import count, repeat
+import math
+from typing import Any, Final
+
+from .const import API_INT_VALUES
+from .model import SensorReading
+
+# SensorReading attributes kept as float columns, missing values are NaN
+FLEET_NUMERIC_COLUMNS: Final = (
+    "rssi",
+    "uptime",
+    "confidence",
+    "humidity",
+    "temperature",
+    "analog_input",
+    "pm1_0_atm",
+    "pm2_5_atm",
+    "pm2_5_cf_1",
+    "pm10_0_atm",
+    "pressure",
+    "last_seen",
+    "pm2_5_aqi_instant",
+    "pm2_5_aqi_epa",
+    "pm2_5_aqi_epa_fast",
+)
+
+# SensorReading attributes kept as lists of (interned) strings
+FLEET_LABEL_COLUMNS: Final = (
+    "channel_flags",
+    "channel_state",
+    "pm2_5_aqi_epa_status",
+)
+
+FLEET_INT_COLUMNS: Final = frozenset(
+    {*API_INT_VALUES, "pm2_5_aqi_instant", "pm2_5_aqi_epa", "pm2_5_aqi_epa_fast"}
+)
+
+# SensorReading attributes after pa_sensor_id, in field order
+_READING_FIELDS: Final = tuple(f.name for f in dataclass_fields(SensorReading))[1:]
+
+# numeric columns holding datetimes as epoch seconds
+FLEET_TIMESTAMP_COLUMNS: Final = frozenset({"last_seen"})
+
+_INITIAL_CAPACITY: Final = 16
+
+_NAN: Final = math.nan
+
+# reading versions are unique across every store, so a sensor moving between
+# stores always gets a new version
+_VERSIONS: Final = count(1)
+
+
+class SensorFleetStore:
+    """Struct-of-arrays store of sensor readings for a whole fleet of sensors.
+
+    Every registered sensor is given a row, and each reading attribute is kept
+    in its own preallocated column, so an update writes values in place instead
+    of building new objects and fleet-wide calculations work on whole columns.
+    Readers get single values of a sensor from its row, and each row has a
+    version that changes whenever a new reading is committed to it.
+    Rows of unregistered sensors are cleared and reused by the next registration.
+
+    Attributes:
+        capacity -- Number of rows allocated in each column
+        columns  -- Numeric columns by SensorReading attribute, NaN when missing
+        labels   -- String columns by SensorReading attribute
+        ids      -- Sensor ID of each row, or None for a free row
+        rows     -- Row of each registered sensor ID
+        versions -- Version of the reading in each row, 0 if none was committed
+
+    """
+
+    capacity: int
+    columns: dict[str, array[float]]
+    labels: dict[str, list[str | None]]
+    ids: list[str | None]
+    rows: dict[str, int]
+    versions: list[int]
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        """Create a new, empty SensorFleetStore."""
+
+        self.capacity = capacity
+        self.columns = {
+            name: array("d", repeat(_NAN, capacity)) for name in FLEET_NUMERIC_COLUMNS
+        }
+        self.labels = {name: [None] * capacity for name in FLEET_LABEL_COLUMNS}
+        self.ids = [None] * capacity
+        self.rows = {}
+        self.versions = [0] * capacity
+        self._free_rows: list[int] = list(range(capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        """Get the number of sensors in the store."""
+        return len(self.rows)
+
+    def __contains__(self, pa_sensor_id: object) -> bool:
+        """Check if the sensor has a row in the store."""
+        return pa_sensor_id in self.rows
+
+    def add(self, pa_sensor_id: str) -> int:
+        """Get the row of the sensor, adding it to the store if needed."""
+
+        if (row := self.rows.get(pa_sensor_id)) is not None:
+            return row
+
+        if not self._free_rows:
+            self._grow()
+
+        row = self._free_rows.pop()
+        self.ids[row] = pa_sensor_id
+        self.rows[pa_sensor_id] = row
+        return row
+
+    def remove(self, pa_sensor_id: str) -> None:
+        """Remove the sensor from the store, freeing its row."""
+
+        if (row := self.rows.pop(pa_sensor_id, None)) is None:
+            return
+
+        self.clear((row,))
+        self.ids[row] = None
+        self._free_rows.append(row)
+
+    def clear(self, rows: Sequence[int], names: Iterable[str] | None = None) -> None:
+        """Clear the values of the columns in the rows, or every column if None.
+
+        The rows are left without a version until their new readings are
+        committed.
+        """
+
+        for row in rows:
+            self.versions[row] = 0
+
+        if names is None:
+            names = (*self.columns, *self.labels)
+
+        for name in names:
+            if (column := self.columns.get(name)) is not None:
+                for row in rows:
+                    column[row] = _NAN
+            else:
+                labels = self.labels[name]
+                for row in rows:
+                    labels[row] = None
+
+    def copy_from(self, other: SensorFleetStore) -> list[int]:
+        """Copy the rows of every sensor in another store in to this store.
+
+        Sensors are added to this store if needed, and their rows are returned
+        without a version until the copied readings are committed.
+        """
+
+        rows = [self.add(pa_sensor_id) for pa_sensor_id in other.rows]
+        pairs = list(zip(rows, other.rows.values(), strict=True))
+        for row in rows:
+            self.versions[row] = 0
+
+        for name, column in self.columns.items():
+            source = other.columns[name]
+            for row, other_row in pairs:
+                column[row] = source[other_row]
+
+        for name, labels in self.labels.items():
+            source_labels = other.labels[name]
+            for row, other_row in pairs:
+                labels[row] = source_labels[other_row]
+
+        return rows
+
+    def get_column(self, name: str, rows: Iterable[int]) -> list[float]:
+        """Get the values of a numeric column for the rows."""
+
+        column = self.columns[name]
+        return [column[row] for row in rows]
+
+    def set_column(self, name: str, rows: Iterable[int], values: Iterable[Any]) -> None:
+        """Set the values of a column for the rows.
+
+        Missing values may be given as None, and datetimes are stored as epoch
+        seconds in numeric columns.
+        """
+
+        if (labels := self.labels.get(name)) is not None:
+            for row, value in zip(rows, values, strict=True):
+                labels[row] = value
+            return
+
+        if name in FLEET_TIMESTAMP_COLUMNS:
+            values = [value.timestamp() if value else None for value in values]
+
+        column = self.columns[name]
+        for row, value in zip(rows, values, strict=True):
+            column[row] = _NAN if value is None else value
+
+    def commit(self, rows: Iterable[int]) -> None:
+        """Give the rows a new version, once their new readings are complete."""
+
+        versions = self.versions
+        for row in rows:
+            versions[row] = next(_VERSIONS)
+
+    def get_version(self, pa_sensor_id: str) -> int:
+        """Get the version of the sensor's reading, or 0 if it has none."""
+
+        if (row := self.rows.get(pa_sensor_id)) is None:
+            return 0
+
+        return self.versions[row]
+
+    def get_value(self, pa_sensor_id: str, name: str) -> Any:
+        """Get a SensorReading attribute of the sensor from its row.
+
+        Returns None if the sensor has no row or the value is missing, and the
+        integer and timestamp columns are converted back to their types.
+        """
+
+        if (row := self.rows.get(pa_sensor_id)) is None:
+            return None
+
+        if (labels := self.labels.get(name)) is not None:
+            return labels[row]
+
+        if math.isnan(value := self.columns[name][row]):
+            return None
+
+        if name in FLEET_TIMESTAMP_COLUMNS:
+            return datetime.fromtimestamp(value, UTC)
+
+        return int(value) if name in FLEET_INT_COLUMNS else value
+
+    def get_reading(self, pa_sensor_id: str) -> SensorReading | None:
+        """Create a SensorReading from the values in the sensor's row."""
+
+        if pa_sensor_id not in self.rows:
+            return None
+
+        return SensorReading(
+            pa_sensor_id,
+            *(self.get_value(pa_sensor_id, name) for name in _READING_FIELDS),
+        )
+
+    def get_aggregates(
+        self, name: str, rows: Sequence[int] | None = None
+    ) -> dict[str, float] | None:
+        """Get the count, minimum, mean and maximum of a numeric column.
+
+        Aggregates all sensors in the store unless rows are given. Missing values
+        are skipped, returning None when no rows have a value.
+        """
+
+        column = self.columns[name]
+        if rows is None:
+            rows = list(self.rows.values())
+
+        values = [value for row in rows if not math.isnan(value := column[row])]
+        if not values:
+            return None
+
+        return {
+            "count": len(values),
+            "min": min(values),
+            "mean": math.fsum(values) / len(values),
+            "max": max(values),
+        }
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+
+        added = self.capacity
+        for column in self.columns.values():
+            column.extend(repeat(_NAN, added))
+
+        for labels in self.labels.values():
+            labels.extend([None] * added)
+
+        self.ids.extend([None] * added)
+        self.versions.extend([0] * added)
+        self._free_rows.extend(range(self.capacity + added - 1, self.capacity - 1, -1))
+        self.capacity += added
@@ -3,21 +3,39 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime, timedelta
 import logging
-from typing import Literal, TypedDict
+import math
+import time
+from typing import Any, Literal, TypedDict
 
 from .const import API_VALUES
 
 SENSOR_READING_ADDITIONAL_ATTRIBUTES = [
     "pm2_5_aqi_instant",
     "pm2_5_aqi_epa",
+    "pm2_5_aqi_epa_fast",
     "pm2_5_aqi_epa_status",
 ]
 
 SensorReadingAdditionalAttrsType = Literal[
-    "pm2_5_aqi_instant", "pm2_5_aqi_epa", "pm2_5_aqi_epa_status"
+    "pm2_5_aqi_instant",
+    "pm2_5_aqi_epa",
+    "pm2_5_aqi_epa_fast",
+    "pm2_5_aqi_epa_status",
+]
+
+UpdateStage = Literal[
+    "request_build",
+    "network",
+    "json_decode",
+    "fields_position",
+    "read_sensor_data",
+    "corrections",
+    "aqi",
 ]
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +59,66 @@ class AqiBreakpoint:
     aqi_high: float
 
 
+@dataclass(slots=True)
+class ApiKeyCacheEntry:
+    """Describes the cached validation result of an API key.
+
+    Attributes:
+      error: Error extra of an invalid key (see PurpleAirApiConfigError), or None
+        if the key is a valid READ key.
+      expires: Monotonic time the entry expires at.
+
+    """
+
+    error: str | None
+    expires: float
+
+
+class ApiKeyCache:
+    """Caches API key validation results for a limited time.
+
+    Valid keys are kept for `ttl` seconds, while keys that are invalid or not READ
+    keys are kept for the shorter `negative_ttl` seconds so a fixed key is picked
+    up quickly. Transient failures are never cached.
+
+    Attributes:
+        ttl          -- Seconds a valid key is cached
+        negative_ttl -- Seconds an invalid key is cached
+        entries      -- Cached entries by API key
+
+    """
+
+    ttl: float
+    negative_ttl: float
+    entries: dict[str, ApiKeyCacheEntry]
+
+    def __init__(self, ttl: float, negative_ttl: float) -> None:
+        """Create a new, empty ApiKeyCache."""
+
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries = {}
+
+    def get(self, api_key: str) -> ApiKeyCacheEntry | None:
+        """Get the cached entry for the key, if it has not expired."""
+
+        if (entry := self.entries.get(api_key)) and entry.expires <= time.monotonic():
+            del self.entries[api_key]
+            return None
+
+        return entry
+
+    def set_valid(self, api_key: str) -> None:
+        """Cache the key as a valid READ key."""
+        self.entries[api_key] = ApiKeyCacheEntry(None, time.monotonic() + self.ttl)
+
+    def set_invalid(self, api_key: str, error: str) -> None:
+        """Cache the key as invalid with the error extra."""
+
+        expires = time.monotonic() + self.negative_ttl
+        self.entries[api_key] = ApiKeyCacheEntry(error, expires)
+
+
 @dataclass
 class ApiConfigEntry:
     """Describes a configuration entry for the PurpleAir v1 API.
@@ -50,6 +128,7 @@ class ApiConfigEntry:
       name: Name of the sensor.
       hidden: Flag indicating whether the sensor is private or public.
       read_key: Sensor read key used when retrieving data from a hidden sensor.
+      fields: Optional sensor fields wanted for the sensor, or None for all of them.
 
     """
 
@@ -57,9 +136,220 @@ class ApiConfigEntry:
     name: str
     hidden: bool
     read_key: str | None = None
+    fields: frozenset[str] | None = None
+
+
+@dataclass(slots=True)
+class DiscoveredSensor:
+    """Describes a public sensor found near a location by the v1 API.
+
+    Attributes:
+      pa_sensor_id: ID of the sensor.
+      name: Name of the sensor.
+      latitude: Latitude of the sensor.
+      longitude: Longitude of the sensor.
+      outdoor: Flag indicating whether the sensor is outside or inside.
+
+    """
+
+    pa_sensor_id: str
+    name: str
+    latitude: float
+    longitude: float
+    outdoor: bool
+
+
+@dataclass
+class ApiSensorBatch:
+    """Describes a batch of sensors requested together from the v1 API.
+
+    Attributes:
+      pa_sensor_ids: IDs of the sensors requested in this batch.
+      read_keys: Read keys needed by the hidden sensors in this batch.
+
+    """
+
+    pa_sensor_ids: list[str] = field(default_factory=list)
+    read_keys: list[str] = field(default_factory=list)
 
 
 @dataclass
+class ApiUpdateStats:
+    """Describes the timings and sizes recorded for a single update.
+
+    Stages run for each batch are summed across the batches, so with concurrent
+    requests the stages can add up to more than the update duration.
+
+    Attributes:
+      started: Date and time the update was started.
+      duration: Seconds spent on the whole update.
+      stages: Seconds spent in each stage of the update.
+      requests: Number of sensor requests made.
+      rows: Number of sensor rows returned by the API.
+      decoded_rows: Number of rows decoded because their data changed.
+      response_bytes: Total size of the response bodies.
+
+    """
+
+    started: datetime
+    duration: float = 0.0
+    stages: dict[UpdateStage, float] = field(default_factory=dict)
+    requests: int = 0
+    rows: int = 0
+    decoded_rows: int = 0
+    response_bytes: int = 0
+
+    @contextmanager
+    def time_stage(self, stage: UpdateStage) -> Iterator[None]:
+        """Add the time spent in the context to the stage."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stages[stage] = self.stages.get(stage, 0.0) + elapsed
+
+
+class ApiUpdateStatsHistory:
+    """Rolling history of update statistics.
+
+    Attributes:
+        max_updates -- Maximum number of updates kept in the history
+        updates     -- Statistics of the kept updates, oldest first
+
+    """
+
+    max_updates: int
+    updates: deque[ApiUpdateStats]
+
+    def __init__(self, max_updates: int) -> None:
+        """Create a new, empty ApiUpdateStatsHistory."""
+
+        self.max_updates = max_updates
+        self.updates = deque(maxlen=max_updates)
+
+    @property
+    def last(self) -> ApiUpdateStats | None:
+        """Get the statistics of the most recent update."""
+        return self.updates[-1] if self.updates else None
+
+    def append(self, stats: ApiUpdateStats) -> None:
+        """Add the statistics of an update, dropping the oldest when full."""
+        self.updates.append(stats)
+
+    def get_percentiles(self) -> dict[str, dict[str, float]]:
+        """Get the p50 and p95 seconds of the update duration and each stage."""
+
+        samples: dict[str, list[float]] = {
+            "duration": [stats.duration for stats in self.updates]
+        }
+        for stats in self.updates:
+            for stage, elapsed in stats.stages.items():
+                samples.setdefault(stage, []).append(elapsed)
+
+        return {
+            name: {"p50": _percentile(values, 50), "p95": _percentile(values, 95)}
+            for name, values in samples.items()
+            if values
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the last update and rolling percentiles as a dict."""
+
+        last = self.last
+        return {
+            "updates": len(self.updates),
+            "last": {
+                "started": last.started.isoformat(),
+                "duration": last.duration,
+                "stages": dict(last.stages),
+                "requests": last.requests,
+                "rows": last.rows,
+                "decoded_rows": last.decoded_rows,
+                "response_bytes": last.response_bytes,
+            }
+            if last
+            else None,
+            "percentiles": self.get_percentiles(),
+        }
+
+
+class ApiPointsLedger:
+    """Running tally of the API points spent by an API key.
+
+    Points are estimated from each request with estimate_request_points, and the
+    tally for the month is started over when a new (UTC) month begins.
+
+    Attributes:
+        month        -- Month being tallied, as "YYYY-MM"
+        month_points -- Points spent in the month
+        month_rows   -- Sensor rows polled in the month
+        requests     -- Requests made in the month
+        last_points  -- Points spent by the last request
+
+    """
+
+    month: str
+    month_points: int
+    month_rows: int
+    requests: int
+    last_points: int
+
+    def __init__(self) -> None:
+        """Create a new, empty ApiPointsLedger."""
+
+        self.month = ""
+        self.month_points = 0
+        self.month_rows = 0
+        self.requests = 0
+        self.last_points = 0
+
+    def record(self, points: int, rows: int, now: datetime) -> None:
+        """Add the points spent by a request polling `rows` sensor rows."""
+
+        if (month := f"{now.year:04}-{now.month:02}") != self.month:
+            self.restore({"month": month})
+
+        self.month_points += points
+        self.month_rows += rows
+        self.requests += 1
+        self.last_points = points
+
+    def get_points_per_row(self) -> float | None:
+        """Get the average points spent per sensor row, including request costs."""
+        return self.month_points / self.month_rows if self.month_rows else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the tally as a dict, as taken by restore."""
+
+        return {
+            "month": self.month,
+            "month_points": self.month_points,
+            "month_rows": self.month_rows,
+            "requests": self.requests,
+            "last_points": self.last_points,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the tally from a dict created by as_dict."""
+
+        self.month = str(data.get("month", ""))
+        self.month_points = int(data.get("month_points", 0))
+        self.month_rows = int(data.get("month_rows", 0))
+        self.requests = int(data.get("requests", 0))
+        self.last_points = int(data.get("last_points", 0))
+
+
+def _percentile(values: Sequence[float], percent: float) -> float:
+    """Get the nearest-rank percentile of the values."""
+
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass(slots=True)
 class DeviceReading:
     """Holds device data for a PurpleAir Sensor."""
 
@@ -93,33 +383,217 @@ class DeviceReading:
         setattr(self, normalized_value, value)
 
 
-@dataclass
+@dataclass(slots=True)
 class EpaAvgValue:
     """Provides values for the EPA value cache.
 
     Attributes:
         hum  -- List of last humidity readings
         pm25 -- List of last PM2.5 CF=1 readings
-        timestamp -- Date the value reading was created
+        timestamp -- Time the value reading was created, in epoch seconds
 
     """
 
     hum: float
     pm25: float
-    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+    timestamp: float = field(default_factory=time.time)
+
+
+class CompensatedSum:
+    """Running sum using Neumaier compensated summation.
+
+    Values can be added and removed in any order while keeping the accuracy
+    close to math.fsum over the values currently in the sum.
+    """
+
+    __slots__ = ("_compensation", "_total")
+
+    def __init__(self) -> None:
+        """Create a new, empty sum."""
+        self._total = 0.0
+        self._compensation = 0.0
+
+    @property
+    def value(self) -> float:
+        """Get the current value of the sum."""
+        return self._total + self._compensation
+
+    def add(self, value: float) -> None:
+        """Add the value to the sum."""
+
+        total = self._total + value
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
 
+        self._total = total
 
-EpaAvgValueCache = dict[str, deque[EpaAvgValue]]
+    def remove(self, value: float) -> None:
+        """Remove a previously added value from the sum."""
+        self.add(-value)
+
+    def reset(self) -> None:
+        """Reset the sum back to zero."""
+        self._total = 0.0
+        self._compensation = 0.0
+
+
+class EpaAvgWindow:
+    """Rolling window of EPA values with running averages.
+
+    Keeps up to `max_samples` values no older than `max_age` along with running
+    sums of the humidity and PM2.5 CF=1 readings, so the averages are available
+    without summing the whole window. Values must be added in time order, which
+    lets expired values be evicted from the head of the window.
+
+    A bucketed window downsamples values added faster than the sample interval,
+    folding every value in to the mean of its fixed time bucket (aligned to the
+    sample interval) before it enters the average. Each bucket then counts once
+    no matter how many values it holds, so memory stays bounded by `max_samples`
+    at any sample rate.
+
+    Attributes:
+        max_age     -- Maximum age of values kept in the window
+        max_samples -- Maximum number of values kept in the window
+        bucketed    -- Whether values are folded in to sample interval buckets
+        values      -- Values currently in the window, oldest first
+
+    """
+
+    max_age: timedelta
+    max_samples: int
+    bucketed: bool
+    values: deque[EpaAvgValue]
+
+    def __init__(
+        self, max_age: timedelta, max_samples: int, *, bucketed: bool = False
+    ) -> None:
+        """Create a new, empty EpaAvgWindow."""
+
+        self.max_age = max_age
+        self.max_samples = max_samples
+        self.bucketed = bucketed
+        self.values = deque()
+        self._hum_sum = CompensatedSum()
+        self._pm25_sum = CompensatedSum()
+        self._tail_count = 0
+
+    def __len__(self) -> int:
+        """Get the number of values in the window."""
+        return len(self.values)
+
+    @property
+    def hum_avg(self) -> float | None:
+        """Get the average humidity of the values in the window, if any."""
+        return self._hum_sum.value / len(self.values) if self.values else None
+
+    @property
+    def pm25_avg(self) -> float | None:
+        """Get the average PM2.5 CF=1 reading of the values in the window, if any."""
+        return self._pm25_sum.value / len(self.values) if self.values else None
+
+    @property
+    def sample_interval(self) -> timedelta:
+        """Get the expected time between values for a full window."""
+        return self.max_age / self.max_samples
+
+    @property
+    def samples_left(self) -> int:
+        """Get the number of samples still needed to fill the window.
+
+        A bucketed window counts the buckets spanned from its oldest value, so a
+        bucket missed by a late or early sample doesn't hold the window back.
+        """
+
+        if not self.bucketed or not self.values:
+            return max(self.max_samples - len(self.values), 0)
+
+        spanned = (
+            self._get_bucket(self.values[-1]) - self._get_bucket(self.values[0]) + 1
+        )
+        return max(self.max_samples - spanned, 0)
+
+    def append(self, value: EpaAvgValue) -> None:
+        """Add a value to the window, evicting the oldest value when full.
+
+        A bucketed window folds the value in to the newest value instead when they
+        share a bucket, which takes the time of the latest value folded in to it.
+        """
+
+        if (
+            self.bucketed
+            and self.values
+            and self._get_bucket(value) == self._get_bucket(tail := self.values[-1])
+        ):
+            count = self._tail_count
+            merged = EpaAvgValue(
+                hum=(tail.hum * count + value.hum) / (count + 1),
+                pm25=(tail.pm25 * count + value.pm25) / (count + 1),
+                timestamp=value.timestamp,
+            )
+            self.values[-1] = merged
+            self._hum_sum.remove(tail.hum)
+            self._hum_sum.add(merged.hum)
+            self._pm25_sum.remove(tail.pm25)
+            self._pm25_sum.add(merged.pm25)
+            self._tail_count = count + 1
+            return
+
+        if len(self.values) >= self.max_samples:
+            self._evict()
+
+        self.values.append(value)
+        self._hum_sum.add(value.hum)
+        self._pm25_sum.add(value.pm25)
+        self._tail_count = 1
+
+    def expire(self, now: datetime) -> int:
+        """Evict values older than the window, returning the number evicted."""
+
+        oldest = (now - self.max_age).timestamp()
+        count = 0
+        while self.values and self.values[0].timestamp < oldest:
+            self._evict()
+            count += 1
+
+        return count
+
+    def _get_bucket(self, value: EpaAvgValue) -> int:
+        return int(value.timestamp // self.sample_interval.total_seconds())
+
+    def _evict(self) -> None:
+        value = self.values.popleft()
+
+        # start fresh when empty so no rounding error carries over
+        if not self.values:
+            self._hum_sum.reset()
+            self._pm25_sum.reset()
+            self._tail_count = 0
+            return
+
+        self._hum_sum.remove(value.hum)
+        self._pm25_sum.remove(value.pm25)
+
+
+EpaAvgValueCache = dict[str, EpaAvgWindow]
+
+# compact snapshot of the cache: [timestamp (epoch seconds), humidity, pm2.5 cf=1]
+EpaAvgValueCacheSnapshot = dict[str, list[list[float]]]
 
 
 class NormalizedApiData(TypedDict):
-    """Holds normalized sensor data."""
+    """Holds normalized sensor data.
 
-    sensor: SensorReading
+    The readings of the sensor are kept in the fleet store of its API, where
+    `version` is the version of the sensor's row when it was polled.
+    """
+
+    version: int
     device: DeviceReading | None
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     """Holds sensor data for a PurpleAir Sensor."""
 
@@ -145,6 +619,7 @@ class SensorReading:
     # additional attributes
     pm2_5_aqi_instant: int | None = None
     pm2_5_aqi_epa: int | None = None
+    pm2_5_aqi_epa_fast: int | None = None
     pm2_5_aqi_epa_status: str | None = None
 
     def set_value(self, name: str, value: float | str | datetime | None) -> None:
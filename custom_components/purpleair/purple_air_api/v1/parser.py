@@ -0,0 +1,218 @@
+"""Incremental parser for the JSON body returned by the v1 /sensors endpoint."""
+
+from __future__ import annotations
+
+import codecs
+from enum import Enum, auto
+import json
+from json.scanner import make_scanner
+import re
+from typing import Any, Final
+
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+
+# consumed text is only trimmed from the buffer once it grows past this size
+_COMPACT_SIZE: Final = 65536
+
+_decoder = json.JSONDecoder()
+_scan_once = make_scanner(_decoder)  # type: ignore[arg-type]
+
+
+class _State(Enum):
+    START = auto()
+    KEY = auto()
+    NEXT_KEY = auto()
+    COLON = auto()
+    VALUE = auto()
+    AFTER_VALUE = auto()
+    DATA_START = auto()
+    ROW = auto()
+    NEXT_ROW = auto()
+    AFTER_ROW = auto()
+    END = auto()
+
+
+class SensorResponseParser:
+    """Parses a sensor response as it is received, yielding rows of data.
+
+    Chunks of the body are fed to the parser as they arrive. Every top level
+    value other than `data` (such as `fields` and the lookup tables) is collected
+    in `header`, while each row of the `data` matrix is returned from `feed` as
+    soon as it is complete rather than being held until the whole body is read.
+    Only the text of the value being parsed is buffered, so memory use does not
+    grow with the number of rows.
+
+    Attributes:
+        header -- Top level values of the response, except for `data`
+
+    """
+
+    header: dict[str, Any]
+
+    def __init__(self) -> None:
+        """Create a new SensorResponseParser."""
+
+        self.header = {}
+        self._buffer = ""
+        self._pos = 0
+        self._key = ""
+        self._state = _State.START
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    @property
+    def in_data(self) -> bool:
+        """Indicate if the parser has reached the data matrix."""
+        return self._state in (_State.ROW, _State.NEXT_ROW, _State.AFTER_ROW)
+
+    def feed(self, chunk: bytes) -> list[list[Any]]:
+        """Parse the next chunk of the body, returning the completed rows."""
+
+        self._buffer += self._text_decoder.decode(chunk)
+        rows = self._parse()
+
+        if self._pos > _COMPACT_SIZE:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        return rows
+
+    def close(self) -> list[list[Any]]:
+        """Finish parsing the body, returning any rows left to complete.
+
+        Raises a ValueError when the body ended before the response was complete.
+        """
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        rows = self._parse()
+
+        if self._state is not _State.END or self._buffer[self._pos :].strip():
+            raise ValueError("Incomplete or invalid sensor response")
+
+        return rows
+
+    def _parse(self) -> list[list[Any]]:
+        rows: list[list[Any]] = []
+        buffer = self._buffer
+
+        while True:
+            pos = self._skip_whitespace(buffer, self._pos)
+            if pos >= len(buffer):
+                self._pos = pos
+                return rows
+
+            char = buffer[pos]
+            state = self._state
+
+            if state is _State.START:
+                self._expect(char, "{", pos)
+                self._state = _State.KEY
+                pos += 1
+            elif state in (_State.KEY, _State.NEXT_KEY):
+                if char == "}" and state is _State.KEY:
+                    self._state = _State.END
+                    pos += 1
+                elif (result := self._decode(buffer, pos)) is None:
+                    return rows
+                else:
+                    (key, pos) = result
+                    if not isinstance(key, str):
+                        raise ValueError(f"Expected a key at {pos}, found {key!r}")
+                    self._key = key
+                    self._state = _State.COLON
+            elif state is _State.COLON:
+                self._expect(char, ":", pos)
+                self._state = _State.DATA_START if self._key == "data" else _State.VALUE
+                pos += 1
+            elif state is _State.VALUE:
+                if (result := self._decode(buffer, pos)) is None:
+                    return rows
+                (self.header[self._key], pos) = result
+                self._state = _State.AFTER_VALUE
+            elif state is _State.AFTER_VALUE:
+                self._state = _State.NEXT_KEY if char == "," else _State.END
+                self._expect(char, ",}", pos)
+                pos += 1
+            elif state is _State.DATA_START:
+                self._expect(char, "[", pos)
+                self._state = _State.ROW
+                pos += 1
+            elif state in (_State.ROW, _State.NEXT_ROW, _State.AFTER_ROW):
+                pos = self._parse_rows(buffer, pos, rows)
+                if self._state is not _State.AFTER_VALUE:
+                    self._pos = pos
+                    return rows
+            else:
+                raise ValueError(f"Unexpected data after sensor response at {pos}")
+
+            self._pos = pos
+
+    def _parse_rows(self, buffer: str, pos: int, rows: list[list[Any]]) -> int:
+        """Parse consecutive rows of the data matrix, returning the end position.
+
+        Rows are the bulk of the response, so they are parsed in this tighter loop
+        until the end of the matrix or the end of the buffer is reached.
+        """
+
+        scan_once = _scan_once
+        skip_whitespace = _WHITESPACE.match
+        length = len(buffer)
+        state = self._state
+
+        while (pos := skip_whitespace(buffer, pos).end()) < length:  # type: ignore[union-attr]
+            char = buffer[pos]
+
+            if state is _State.AFTER_ROW:
+                self._expect(char, ",]", pos)
+                state = _State.NEXT_ROW if char == "," else _State.AFTER_VALUE
+                pos += 1
+                if state is _State.AFTER_VALUE:
+                    break
+                continue
+
+            if char == "]" and state is _State.ROW:
+                state = _State.AFTER_VALUE
+                pos += 1
+                break
+
+            try:
+                (row, end) = scan_once(buffer, pos)
+            except (StopIteration, json.JSONDecodeError):
+                break
+
+            # the row may continue in the next chunk
+            if end >= length:
+                break
+
+            rows.append(row)
+            pos = end
+            state = _State.AFTER_ROW
+
+        self._state = state
+        return pos
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, pos: int) -> int:
+        return _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+
+    @staticmethod
+    def _expect(char: str, expected: str, pos: int) -> None:
+        if char not in expected:
+            raise ValueError(f"Expected one of {expected!r} at {pos}, found {char!r}")
+
+    @staticmethod
+    def _decode(buffer: str, pos: int) -> tuple[Any, int] | None:
+        """Decode the value at the position, or None if it may be incomplete.
+
+        A value is only complete once a character follows it, since a number at the
+        end of the buffer could continue in the next chunk.
+        """
+
+        try:
+            (value, end) = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            return None
+
+        if end >= len(buffer):
+            return None
+
+        return (value, end)
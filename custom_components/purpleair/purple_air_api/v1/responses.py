@@ -30,3 +30,15 @@ class ApiSensorResponse(ApiResponse):
     channel_states: list[str]
     channel_flags: list[str]
     data: list[list[Any]]
+
+
+class ApiSensorHistoryResponse(ApiResponse):
+    """Sensor history API response from v1 PA API."""
+
+    data_time_stamp: int
+    sensor_index: int
+    start_timestamp: int
+    end_timestamp: int
+    average: int
+    fields: list[str]
+    data: list[list[Any]]
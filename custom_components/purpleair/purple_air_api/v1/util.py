@@ -2,43 +2,103 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from http import HTTPStatus
 import logging
-from math import fsum
+from math import fsum, isnan, nan
+import time
+from typing import cast
+from urllib.parse import urlencode
 
 from aiohttp import ClientResponse, ClientSession
 
-from .aqi_breakpoints import AQI_BREAKPOINTS
-from .const import URL_API_V1_KEYS_URL, URL_API_V1_SENSOR
+from ..aqi import calc_aqi_batch  # noqa: TID252
+from .aqi_breakpoints import AQI_BREAKPOINT_TABLES
+from .const import (
+    API_CONFIG_FIELDS,
+    API_DISCOVERY_FIELDS,
+    API_FIELD_POINTS,
+    API_KEY_CACHE_TTL,
+    API_KEY_NEGATIVE_CACHE_TTL,
+    API_MAX_BATCH_ROWS,
+    API_MAX_URL_LENGTH,
+    API_POINTS_PER_FIELD,
+    API_POINTS_PER_REQUEST,
+    DISCOVERY_CACHE_TTL,
+    EPA_AVG_MAX_AGE,
+    EPA_AVG_MAX_SAMPLES,
+    EPA_FAST_AVG_MAX_AGE,
+    EPA_FAST_AVG_MAX_SAMPLES,
+    URL_API_V1_KEYS_URL,
+    URL_API_V1_SENSOR,
+    URL_API_V1_SENSORS,
+)
+from .discovery import SensorDiscoveryCache, SensorGridIndex, get_bounding_box
 from .exceptions import PurpleAirApiConfigError
+from .fleet import SensorFleetStore
 from .model import (
     ApiConfigEntry,
+    ApiKeyCache,
+    ApiSensorBatch,
+    DiscoveredSensor,
     EpaAvgValue,
     EpaAvgValueCache,
-    NormalizedApiData,
-    SensorReading,
+    EpaAvgValueCacheSnapshot,
+    EpaAvgWindow,
 )
+from .responses import ApiSensorHistoryResponse
 
 _LOGGER = logging.getLogger(__name__)
 
+# key validation results shared by every get_api_sensor_config call
+_api_key_cache = ApiKeyCache(API_KEY_CACHE_TTL, API_KEY_NEGATIVE_CACHE_TTL)
+
+# sensor indexes shared by every get_api_nearby_sensors call
+_discovery_cache = SensorDiscoveryCache(DISCOVERY_CACHE_TTL)
+
 
 def add_aqi_calculations(
-    sensors: dict[str, NormalizedApiData], *, cache: EpaAvgValueCache
+    store: SensorFleetStore,
+    rows: Sequence[int],
+    *,
+    cache: EpaAvgValueCache,
+    fast_cache: EpaAvgValueCache | None = None,
 ) -> None:
-    """Add AQI calculations as custom properties to the readings.
+    """Add AQI calculations to the rows of the fleet store.
 
     This computes the AQI values by calculating them based off the corrections
-    and breakpoints, providing a few variations depending what is available.
+    and breakpoints, providing a few variations depending what is available. The
+    PM values of the rows are gathered from the store columns first so the AQI
+    values are calculated in a single batch. When a `fast_cache` of short windows
+    is given, a fast reacting EPA AQI is calculated over those windows as well.
     """
 
-    for sensor_data in sensors.values():
-        sensor = sensor_data["sensor"]
-        if sensor.pm2_5_atm is not None:
-            instant_aqi = calc_aqi(sensor.pm2_5_atm, "pm2_5")
-            sensor.set_additional_value("pm2_5_aqi_instant", instant_aqi)
+    ids = store.ids
+    pm2_5_atm = store.columns["pm2_5_atm"]
+    pm2_5_cf_1 = store.columns["pm2_5_cf_1"]
+    humidity = store.columns["humidity"]
+    last_seen = store.columns["last_seen"]
+    now = time.time()
+
+    instant_rows = [row for row in rows if not isnan(pm2_5_atm[row])]
+    store.set_column(
+        "pm2_5_aqi_instant",
+        instant_rows,
+        calc_aqi_batch(
+            store.get_column("pm2_5_atm", instant_rows), "pm2_5", AQI_BREAKPOINT_TABLES
+        ),
+    )
+
+    epa_rows: list[int] = []
+    epa_sensors: list[tuple[str, str, float, float]] = []
+    epa_values: list[float] = []
+    fast_values: list[float] = []
 
+    for row in rows:
         # If we have the PM2.5 CF=1 and humidity data, we can calculate AQI using the EPA
         # corrections that were identified to better calibrate PurpleAir sensors to the EPA NowCast
         # AQI formula. This was identified during the 2020 wildfire season and better represents AQI
@@ -48,45 +108,89 @@ def add_aqi_calculations(
         # readings are provided. Readings over an hour old will be removed from the cache.
         #
         # The formula is identified as: PM2.5 corrected= 0.534*[PA_cf1(avgAB)] - 0.0844*RH +5.604
-        # NOTE: we check for None explicitly since 0 is a valid number
-        if sensor.pm2_5_cf_1 is not None and sensor.humidity is not None:
-            epa_avg = cache[sensor.pa_sensor_id]
-            epa_avg.append(EpaAvgValue(hum=sensor.humidity, pm25=sensor.pm2_5_cf_1))
-
-            _clean_expired_cache_entries(sensor, epa_avg)
+        # NOTE: missing values are NaN in the store, 0 is a valid number
+        if isnan(pm25 := pm2_5_cf_1[row]) or isnan(hum := humidity[row]):
+            continue
+
+        # values are timed by when the reading was taken, so polling faster than
+        # the sensor reads or a late response don't skew the buckets. a reading
+        # no newer than the last value was already averaged, and one older than
+        # the window, like the first poll of a sensor gone quiet, is left out.
+        pa_sensor_id = cast("str", ids[row])
+        epa_avg = cache[pa_sensor_id]
+        timestamp = now if isnan(seen := last_seen[row]) else seen
+        epa_value = EpaAvgValue(hum=hum, pm25=pm25, timestamp=timestamp)
+        is_new = timestamp >= now - epa_avg.max_age.total_seconds() and (
+            not epa_avg.values or timestamp > epa_avg.values[-1].timestamp
+        )
+        if is_new:
+            epa_avg.append(epa_value)
+
+        _clean_expired_cache_entries(pa_sensor_id, epa_avg)
+
+        # an empty window has no average, which leaves the EPA AQI missing
+        if (hum_avg := epa_avg.hum_avg) is None or (
+            pm25_avg := epa_avg.pm25_avg
+        ) is None:
+            continue
+
+        humidity_avg = round(hum_avg, 5)
+        pm25cf1_avg = round(pm25_avg, 5)
+        pm25_corrected = _correct_epa_pm25(pm25cf1_avg, humidity_avg)
+
+        aqi_status = "stable"
+        if samples_left := epa_avg.samples_left:
+            interval_mins = epa_avg.sample_interval.total_seconds() / 60
+            mins_left = round(samples_left * interval_mins)
+            aqi_status = f"calculating ({mins_left} mins left)"
+
+        if fast_cache is not None:
+            fast_avg = fast_cache[pa_sensor_id]
+            if is_new:
+                fast_avg.append(epa_value)
+            fast_avg.expire(datetime.now(tz=UTC))
+            if (fast_hum := fast_avg.hum_avg) is None or (
+                fast_pm25 := fast_avg.pm25_avg
+            ) is None:
+                fast_values.append(nan)
+            else:
+                fast_values.append(
+                    _correct_epa_pm25(round(fast_pm25, 5), round(fast_hum, 5))
+                )
 
-            humidity_avg = round(fsum(v.hum for v in epa_avg) / len(epa_avg), 5)
-            pm25cf1_avg = round(fsum(v.pm25 for v in epa_avg) / len(epa_avg), 5)
+        epa_rows.append(row)
+        epa_sensors.append((pa_sensor_id, aqi_status, pm25cf1_avg, humidity_avg))
+        epa_values.append(pm25_corrected)
 
-            # See https://www.epa.gov/sites/default/files/2021-05/documents/toolsresourceswebinar_purpleairsmoke_210519b.pdf
-            pm25_corrected = (0.52 * pm25cf1_avg) - (0.086 * humidity_avg) + 5.75
-            if pm25cf1_avg > 343:
-                pm25_corrected = (
-                    (0.46 * pm25cf1_avg) + (3.93e-4 * pm25cf1_avg * pm25cf1_avg) + 2.97
-                )
-            pm25_corrected = round(max(0, pm25_corrected), 1)
-            pm25_corrected_aqi = calc_aqi(pm25_corrected, "pm2_5")
+    epa_aqis = calc_aqi_batch(epa_values, "pm2_5", AQI_BREAKPOINT_TABLES)
+    store.set_column("pm2_5_aqi_epa", epa_rows, epa_aqis)
+    store.set_column(
+        "pm2_5_aqi_epa_status", epa_rows, [epa_sensor[1] for epa_sensor in epa_sensors]
+    )
+    if fast_cache is not None:
+        store.set_column(
+            "pm2_5_aqi_epa_fast",
+            epa_rows,
+            calc_aqi_batch(fast_values, "pm2_5", AQI_BREAKPOINT_TABLES),
+        )
 
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for epa_sensor, pm25_corrected, epa_aqi in zip(
+            epa_sensors, epa_values, epa_aqis, strict=True
+        ):
+            (pa_sensor_id, _, pm25cf1_avg, humidity_avg) = epa_sensor
             _LOGGER.debug(
                 "(%s): EPA correction: (pm25: %s, hum: %s, corrected: %s, aqi: %s)",
-                sensor.pa_sensor_id,
+                pa_sensor_id,
                 pm25cf1_avg,
                 humidity_avg,
                 pm25_corrected,
-                pm25_corrected_aqi,
+                epa_aqi,
             )
 
-            aqi_status = "stable"
-            count = len(epa_avg)
-            if count < 12:
-                aqi_status = f"calculating ({(12 - count) * 5} mins left)"
-
-            sensor.set_additional_value("pm2_5_aqi_epa", pm25_corrected_aqi)
-            sensor.set_additional_value("pm2_5_aqi_epa_status", aqi_status)
-
 
-def apply_sensor_corrections(sensors: dict[str, NormalizedApiData]) -> None:
-    """Apply corrections to incoming sensor data using known adjustment values.
+def apply_sensor_corrections(store: SensorFleetStore, rows: Sequence[int]) -> None:
+    """Apply corrections to the rows of the fleet store using known adjustment values.
 
     The sensors for temperature and humidity are known to be slightly outside of
     real values, this will apply a blanket correction of subtracting 8°F from the
@@ -102,21 +206,18 @@ def apply_sensor_corrections(sensors: dict[str, NormalizedApiData]) -> None:
         higher than ambient conditions. Null if not equipped.
     """
 
-    for sensor_data in sensors.values():
-        sensor = sensor_data["sensor"]
-        if temperature := sensor.temperature:
-            sensor.temperature = temperature - 8
-            _LOGGER.debug(
-                "applied temperature correction from %s to %s",
-                temperature,
-                sensor.temperature,
-            )
+    # missing values are NaN, which stay NaN, while 0 is left uncorrected
+    temperature = store.columns["temperature"]
+    humidity = store.columns["humidity"]
 
-        if humidity := sensor.humidity:
-            sensor.humidity = humidity + 4
-            _LOGGER.debug(
-                "applied humidity correction from %s to %s", humidity, sensor.humidity
-            )
+    for row in rows:
+        if temperature[row]:
+            temperature[row] -= 8
+
+        if humidity[row]:
+            humidity[row] += 4
+
+    _LOGGER.debug("applied temperature and humidity corrections to %s rows", len(rows))
 
 
 def calc_aqi(value: float, index: str) -> int | None:
@@ -125,37 +226,85 @@ def calc_aqi(value: float, index: str) -> int | None:
     This uses the sensors current Particulate Matter 2.5 value. Returns an AQI
     between 0 and 999 or None if the sensor reading is invalid.
 
-    See AQI_BREAKPOINTS in const.py.
+    See AQI_BREAKPOINTS in aqi_breakpoints.py.
     """
 
-    if index not in AQI_BREAKPOINTS:
-        _LOGGER.debug("calc_aqi requested for unknown type: %s", index)
-        return None
-
-    aqi_bp_index = AQI_BREAKPOINTS[index]
-    aqi_bp = next((bp for bp in aqi_bp_index if bp.pm_low <= value <= bp.pm_high), None)
+    return calc_aqi_batch((value,), index, AQI_BREAKPOINT_TABLES)[0]
 
-    if not aqi_bp:
-        _LOGGER.debug("value %s did not fall in valid range for type %s", value, index)
-        return None
 
-    aqi_range = aqi_bp.aqi_high - aqi_bp.aqi_low
-    pm_range = aqi_bp.pm_high - aqi_bp.pm_low
-    aqi_c = value - aqi_bp.pm_low
-    return round((aqi_range / pm_range) * aqi_c + aqi_bp.aqi_low)
+def create_epa_value_cache(
+    max_age: int = EPA_AVG_MAX_AGE,
+    max_samples: int = EPA_AVG_MAX_SAMPLES,
+    *,
+    bucketed: bool = False,
+) -> EpaAvgValueCache:
+    """Create a new, empty EPA value cache.
 
+    Each sensor gets a rolling window holding up to `max_samples` readings that
+    are no older than `max_age` seconds. With `bucketed`, readings arriving faster
+    than the window's sample interval are downsampled in to buckets of it.
+    """
 
-def create_epa_value_cache() -> EpaAvgValueCache:
-    """Create a new, empty EPA value cache."""
-    cache: EpaAvgValueCache = defaultdict(lambda: deque(maxlen=12))
+    window_age = timedelta(seconds=max_age)
+    cache: EpaAvgValueCache = defaultdict(
+        lambda: EpaAvgWindow(window_age, max_samples, bucketed=bucketed)
+    )
     return cache
 
 
+def create_epa_fast_value_cache() -> EpaAvgValueCache:
+    """Create a new, empty cache of the short windows for the fast EPA AQI."""
+    return create_epa_value_cache(
+        EPA_FAST_AVG_MAX_AGE, EPA_FAST_AVG_MAX_SAMPLES, bucketed=True
+    )
+
+
+def downsample_epa_values(
+    values: Iterable[EpaAvgValue], interval: timedelta
+) -> list[EpaAvgValue]:
+    """Average the values in to fixed time buckets of the given interval.
+
+    The buckets are aligned to the interval and each resulting value takes the
+    timestamp of the last value in its bucket. Returns the values in time order.
+    """
+
+    seconds = interval.total_seconds()
+    buckets: dict[int, list[EpaAvgValue]] = {}
+    for value in values:
+        bucket = int(value.timestamp // seconds)
+        buckets.setdefault(bucket, []).append(value)
+
+    downsampled: list[EpaAvgValue] = []
+    for _, bucket_values in sorted(buckets.items()):
+        count = len(bucket_values)
+        downsampled.append(
+            EpaAvgValue(
+                hum=fsum(v.hum for v in bucket_values) / count,
+                pm25=fsum(v.pm25 for v in bucket_values) / count,
+                timestamp=max(v.timestamp for v in bucket_values),
+            )
+        )
+
+    return downsampled
+
+
+def dump_epa_value_cache(cache: EpaAvgValueCache) -> EpaAvgValueCacheSnapshot:
+    """Create a compact, JSON serializable snapshot of the EPA value cache."""
+
+    return {
+        pa_sensor_id: [[v.timestamp, v.hum, v.pm25] for v in window.values]
+        for pa_sensor_id, window in cache.items()
+        if window.values
+    }
+
+
 async def get_api_sensor_config(
     session: ClientSession,
     api_key: str,
     pa_sensor_id: str,
     pa_sensor_read_key: str | None = None,
+    *,
+    key_cache: ApiKeyCache | None = None,
 ) -> ApiConfigEntry:
     """Get a new configuration for the sensor with the provided information.
 
@@ -165,6 +314,10 @@ async def get_api_sensor_config(
     a valid PurpleAirApiConfigEntry with the sensor configuration data or will
     raise a PurpleAirApiConfigError exception describing what went wrong.
 
+    The API key is checked at the same time as the sensor is looked up, and the
+    result of the check is kept in `key_cache` (a cache shared by all calls unless
+    one is given), so keys checked recently are not checked again.
+
     Possible error combinations:
 
     |--------------|--------------|----------------------------------------------|
@@ -194,11 +347,328 @@ async def get_api_sensor_config(
     if not isinstance(pa_sensor_id, str):
         raise PurpleAirApiConfigError("pa_sensor_id", "missing")
 
+    if key_cache is None:
+        key_cache = _api_key_cache
+
+    headers = {
+        "Accept": "application/json",
+        "X-API-Key": api_key,
+    }
+
+    url = URL_API_V1_SENSOR.format(pa_sensor_id=pa_sensor_id)
+    params = {"fields": ",".join(API_CONFIG_FIELDS)}
+
+    if pa_sensor_read_key:
+        params["read_key"] = str(pa_sensor_read_key)
+
+    async def get_sensor_data() -> dict:
+        async with session.get(url, headers=headers, params=params) as resp:
+            return await _get_sensor_data_from_api(resp)
+
+    (sensor_data,) = await _gather_with_key_check(
+        session, api_key, headers, key_cache, [get_sensor_data]
+    )
+
+    config = _create_config_entry(sensor_data)
+    _LOGGER.debug("(get_api_sensor_config) generated configuration: %s", config)
+
+    return config
+
+
+async def get_api_sensor_configs(
+    session: ClientSession,
+    api_key: str,
+    sensors: dict[str, str | None],
+    *,
+    key_cache: ApiKeyCache | None = None,
+) -> dict[str, ApiConfigEntry]:
+    """Get new configurations for many sensors at once.
+
+    `sensors` maps the id of each sensor to configure to its read key, if it is
+    private (hidden). Rather than a request per sensor, the sensors are looked up
+    with as few /v1/sensors requests as `plan_sensor_batches` allows, while the
+    API key is checked as in get_api_sensor_config. Returns the configurations by
+    sensor id, leaving out any sensors the API did not return. Raises the same
+    PurpleAirApiConfigError errors as get_api_sensor_config.
+    """
+
+    if not isinstance(api_key, str):
+        raise PurpleAirApiConfigError("api_key", "missing")
+
+    if key_cache is None:
+        key_cache = _api_key_cache
+
+    headers = {
+        "Accept": "application/json",
+        "X-API-Key": api_key,
+    }
+
+    fields = ",".join(API_CONFIG_FIELDS)
+    base_url_length = len(URL_API_V1_SENSORS) + len(f"?{urlencode({'fields': fields})}")
+    batches = plan_sensor_batches(
+        (
+            ApiConfigEntry(pa_sensor_id, "", bool(read_key), read_key)
+            for pa_sensor_id, read_key in sensors.items()
+        ),
+        base_url_length,
+    )
+
+    async def get_batch_data(batch: ApiSensorBatch) -> list[dict]:
+        params = {"fields": fields, "show_only": ",".join(batch.pa_sensor_ids)}
+        if batch.read_keys:
+            params["read_keys"] = ",".join(batch.read_keys)
+
+        async with session.get(
+            URL_API_V1_SENSORS, headers=headers, params=params
+        ) as resp:
+            data = await _get_config_data_from_api(resp)
+
+        return [dict(zip(data["fields"], row, strict=True)) for row in data["data"]]
+
+    batch_results = await _gather_with_key_check(
+        session,
+        api_key,
+        headers,
+        key_cache,
+        [partial(get_batch_data, batch) for batch in batches],
+    )
+
+    configs: dict[str, ApiConfigEntry] = {}
+    for result in batch_results:
+        for sensor_data in result:
+            config = _create_config_entry(sensor_data)
+            configs[config.pa_sensor_id] = config
+
+    _LOGGER.debug(
+        "(get_api_sensor_configs) generated %s configurations in %s requests",
+        len(configs),
+        len(batches),
+    )
+
+    return configs
+
+
+async def get_api_nearby_sensors(
+    session: ClientSession,
+    api_key: str,
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    *,
+    key_cache: ApiKeyCache | None = None,
+    discovery_cache: SensorDiscoveryCache | None = None,
+) -> SensorGridIndex:
+    """Get an index of the public sensors around the location.
+
+    The sensors in the box bounding `radius_km` kilometers around the location are
+    fetched with a single /v1/sensors request and indexed for `nearest` and
+    `within` queries. The index is kept in `discovery_cache` (a cache shared by all
+    calls unless one is given) so repeated queries around the same location do not
+    hit the API again. The API key is checked as in get_api_sensor_config, raising
+    the same api_key, server_error and bad_request PurpleAirApiConfigError errors.
+    """
+
+    if not isinstance(api_key, str):
+        raise PurpleAirApiConfigError("api_key", "missing")
+
+    if key_cache is None:
+        key_cache = _api_key_cache
+
+    if discovery_cache is None:
+        discovery_cache = _discovery_cache
+
+    bbox = get_bounding_box(round(latitude, 4), round(longitude, 4), radius_km)
+    if index := discovery_cache.get(api_key, bbox):
+        return index
+
     headers = {
         "Accept": "application/json",
         "X-API-Key": api_key,
     }
 
+    (nwlat, nwlng, selat, selng) = bbox
+    params = {
+        "fields": ",".join(API_DISCOVERY_FIELDS),
+        "nwlat": str(nwlat),
+        "nwlng": str(nwlng),
+        "selat": str(selat),
+        "selng": str(selng),
+    }
+
+    async def get_area_data() -> dict:
+        async with session.get(
+            URL_API_V1_SENSORS, headers=headers, params=params
+        ) as resp:
+            return await _get_config_data_from_api(resp)
+
+    (data,) = await _gather_with_key_check(
+        session, api_key, headers, key_cache, [get_area_data]
+    )
+
+    fields = data["fields"]
+    index = SensorGridIndex(
+        DiscoveredSensor(
+            pa_sensor_id=str(sensor_data["sensor_index"]),
+            name=str(sensor_data.get("name")),
+            latitude=float(sensor_data["latitude"]),
+            longitude=float(sensor_data["longitude"]),
+            outdoor=sensor_data.get("location_type") == 0,
+        )
+        for sensor_data in (dict(zip(fields, row, strict=True)) for row in data["data"])
+        if sensor_data.get("latitude") is not None
+        and sensor_data.get("longitude") is not None
+    )
+
+    _LOGGER.debug("(get_api_nearby_sensors) indexed %s sensors in %s", len(index), bbox)
+
+    discovery_cache.set(api_key, bbox, index)
+    return index
+
+
+def estimate_request_points(fields: Iterable[str], rows: int) -> int:
+    """Estimate the API points charged for a request.
+
+    Every request has a fixed cost, plus the cost of each requested field for
+    every row returned. See API_FIELD_POINTS for the costs of each field.
+    """
+
+    row_points = sum(
+        API_FIELD_POINTS.get(field_name, API_POINTS_PER_FIELD) for field_name in fields
+    )
+    return API_POINTS_PER_REQUEST + row_points * rows
+
+
+def plan_sensor_batches(
+    sensors: Iterable[ApiConfigEntry],
+    base_url_length: int,
+    *,
+    max_url_length: int = API_MAX_URL_LENGTH,
+    max_rows: int = API_MAX_BATCH_ROWS,
+) -> list[ApiSensorBatch]:
+    """Split the sensors in to batches that can each be requested in one call.
+
+    Each batch is bound to at most `max_rows` sensors and the request URL, starting
+    at `base_url_length` characters for the URL and fixed parameters, is kept under
+    `max_url_length` characters. Hidden sensors are grouped by their read key, so
+    each key is only sent with the batches holding the sensors that need it.
+    """
+
+    # separators are counted as their URL encoded length to be safe
+    separator_length = len("%2C")
+    start_length = base_url_length + len("&show_only=")
+
+    def get_added_length(
+        batch: ApiSensorBatch, pa_sensor_id: str, read_key: str | None
+    ) -> int:
+        added_length = len(pa_sensor_id) + separator_length
+        if read_key and read_key not in batch.read_keys:
+            added_length += len(read_key) + separator_length
+            if not batch.read_keys:
+                added_length += len("&read_keys=")
+
+        return added_length
+
+    groups: dict[str | None, list[str]] = {}
+    for sensor in sensors:
+        read_key = sensor.read_key if sensor.hidden and sensor.read_key else None
+        groups.setdefault(read_key, []).append(sensor.pa_sensor_id)
+
+    # keyed sensors first so public sensors fill in any remaining space
+    public_sensors = groups.pop(None, [])
+
+    batches: list[ApiSensorBatch] = []
+    batch = ApiSensorBatch()
+    url_length = start_length
+
+    for read_key, pa_sensor_ids in [*groups.items(), (None, public_sensors)]:
+        for pa_sensor_id in pa_sensor_ids:
+            added_length = get_added_length(batch, pa_sensor_id, read_key)
+            if batch.pa_sensor_ids and (
+                len(batch.pa_sensor_ids) >= max_rows
+                or url_length + added_length > max_url_length
+            ):
+                batches.append(batch)
+                batch = ApiSensorBatch()
+                url_length = start_length
+                added_length = get_added_length(batch, pa_sensor_id, read_key)
+
+            batch.pa_sensor_ids.append(pa_sensor_id)
+            if read_key and read_key not in batch.read_keys:
+                batch.read_keys.append(read_key)
+
+            url_length += added_length
+
+    if batch.pa_sensor_ids:
+        batches.append(batch)
+
+    _LOGGER.debug(
+        "planned %s batches for sensors: %s",
+        len(batches),
+        [b.pa_sensor_ids for b in batches],
+    )
+
+    return batches
+
+
+def read_epa_history_values(data: ApiSensorHistoryResponse) -> list[EpaAvgValue]:
+    """Read EPA values from a sensor history response, in time order.
+
+    The humidity is corrected the same as live readings are corrected in
+    `apply_sensor_corrections` so the values can be mixed in the cache.
+    """
+
+    fields = data["fields"]
+    timestamp_index = fields.index("time_stamp")
+    hum_index = fields.index("humidity")
+    pm25_index = fields.index("pm2.5_cf_1")
+
+    values: list[EpaAvgValue] = []
+    for row in data["data"]:
+        timestamp = row[timestamp_index]
+        hum = row[hum_index]
+        pm25 = row[pm25_index]
+
+        # NOTE: we check for None explicitly since 0 is a valid number
+        if timestamp is None or hum is None or pm25 is None:
+            continue
+
+        values.append(
+            EpaAvgValue(
+                hum=int(hum) + 4 if hum else 0,
+                pm25=float(pm25),
+                timestamp=float(timestamp),
+            )
+        )
+
+    values.sort(key=lambda v: v.timestamp)
+    return values
+
+
+def restore_epa_values(window: EpaAvgWindow, values: list[list[float]]) -> int:
+    """Restore snapshot values in to the window, dropping any that have expired.
+
+    Returns the number of values in the window after restoring.
+    """
+
+    for timestamp, hum, pm25 in sorted(values):
+        window.append(EpaAvgValue(hum=hum, pm25=pm25, timestamp=timestamp))
+
+    window.expire(datetime.now(tz=UTC))
+    return len(window)
+
+
+async def _check_api_key(
+    session: ClientSession,
+    api_key: str,
+    headers: dict[str, str],
+    key_cache: ApiKeyCache,
+) -> None:
+    """Check the API key is a valid READ key, caching the result.
+
+    Invalid and non-READ keys are cached as well, but server errors and other bad
+    statuses are not.
+    """
+
     async with session.get(URL_API_V1_KEYS_URL, headers=headers) as resp:
         if resp.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
             _LOGGER.error(
@@ -217,43 +687,72 @@ async def get_api_sensor_config(
                     api_key,
                     key_data,
                 )
+                key_cache.set_invalid(api_key, "forbidden")
                 raise PurpleAirApiConfigError("api_key", "forbidden")
 
             raise PurpleAirApiConfigError("api_key", "bad_status")
 
         if key_data.get("api_key_type") != "READ":
+            key_cache.set_invalid(api_key, "not_read_key")
             raise PurpleAirApiConfigError("api_key", "not_read_key")
 
-    config_fields = [
-        "name",
-        "primary_key_a",
-        "private",
-    ]
+    key_cache.set_valid(api_key)
 
-    url = URL_API_V1_SENSOR.format(pa_sensor_id=pa_sensor_id)
-    params = {"fields": ",".join(config_fields)}
 
-    if pa_sensor_read_key:
-        params["read_key"] = str(pa_sensor_read_key)
+async def _gather_with_key_check[_T](
+    session: ClientSession,
+    api_key: str,
+    headers: dict[str, str],
+    key_cache: ApiKeyCache,
+    lookups: Sequence[Callable[[], Awaitable[_T]]],
+) -> list[_T]:
+    """Run the lookups, checking the API key alongside them unless it is cached.
+
+    Key errors are raised first since they can cause the lookups to fail as well,
+    otherwise the first lookup error is raised.
+    """
+
+    if entry := key_cache.get(api_key):
+        if entry.error:
+            raise PurpleAirApiConfigError("api_key", entry.error)
+
+        return await asyncio.gather(*(lookup() for lookup in lookups))
+
+    (key_result, *results) = await asyncio.gather(
+        _check_api_key(session, api_key, headers, key_cache),
+        *(lookup() for lookup in lookups),
+        return_exceptions=True,
+    )
 
-    async with session.get(url, headers=headers, params=params) as resp:
-        sensor_data = await _get_sensor_data_from_api(resp)
+    if isinstance(key_result, BaseException):
+        raise key_result
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return cast("list[_T]", results)
+
+
+def _create_config_entry(sensor_data: dict) -> ApiConfigEntry:
+    """Create a configuration from the sensor data returned by the API."""
 
     hidden = int(sensor_data.get("private", 0)) == 1
 
-    config = ApiConfigEntry(
+    return ApiConfigEntry(
         pa_sensor_id=str(sensor_data.get("sensor_index")),
         name=str(sensor_data.get("name")),
         hidden=hidden,
         read_key=str(sensor_data.get("primary_key_a")) if hidden else None,
     )
 
-    _LOGGER.debug("(get_api_sensor_config) generated configuration: %s", config)
 
-    return config
+async def _get_sensor_data_from_api(resp: ClientResponse) -> dict:
+    data = await _get_config_data_from_api(resp)
+    return data.get("sensor")  # type: ignore[return-value]
 
 
-async def _get_sensor_data_from_api(resp: ClientResponse) -> dict:
+async def _get_config_data_from_api(resp: ClientResponse) -> dict:
     # don't parse as json if > HTTP 500
     if resp.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
         _LOGGER.error(
@@ -277,20 +776,29 @@ async def _get_sensor_data_from_api(resp: ClientResponse) -> dict:
             )
             raise PurpleAirApiConfigError("bad_request", data.get("description"))
 
-    return data.get("sensor")  # type: ignore[no-any-return]
+    return data  # type: ignore[no-any-return]
 
 
-def _clean_expired_cache_entries(
-    pa_sensor: SensorReading, epa_avg: deque[EpaAvgValue]
-) -> None:
-    """Clean out any old cache entries older than an hour."""
-    hour_ago = datetime.now(tz=UTC) - timedelta(seconds=3600)
-    expired_count = sum(1 for v in epa_avg if v.timestamp < hour_ago)
+def _correct_epa_pm25(pm25cf1_avg: float, humidity_avg: float) -> float:
+    """Correct the averaged PM2.5 CF=1 reading with the EPA formula.
+
+    See https://www.epa.gov/sites/default/files/2021-05/documents/toolsresourceswebinar_purpleairsmoke_210519b.pdf
+    """
+
+    pm25_corrected = (0.52 * pm25cf1_avg) - (0.086 * humidity_avg) + 5.75
+    if pm25cf1_avg > 343:
+        pm25_corrected = (
+            (0.46 * pm25cf1_avg) + (3.93e-4 * pm25cf1_avg * pm25cf1_avg) + 2.97
+        )
+    return round(max(0, pm25_corrected), 1)
+
+
+def _clean_expired_cache_entries(pa_sensor_id: str, epa_avg: EpaAvgWindow) -> None:
+    """Clean out any cache entries older than the window."""
+    expired_count = epa_avg.expire(datetime.now(tz=UTC))
     if expired_count:
         _LOGGER.info(
             'PuprleAir Sensor "%s" EPA readings contained %s old entries in cache',
-            pa_sensor.pa_sensor_id,
+            pa_sensor_id,
             expired_count,
         )
-        for _ in range(expired_count):
-            epa_avg.popleft()
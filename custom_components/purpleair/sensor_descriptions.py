@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,16 +14,57 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
     UnitOfPressure,
     UnitOfTemperature,
+    UnitOfTime,
 )
 
+from .purple_air_api.v1.model import ApiUpdateStats, ApiUpdateStatsHistory
+
 
 @dataclass(frozen=True)
 class PASensorDescription(SensorEntityDescription):
-    """Extra properties."""
+    """Extra properties.
+
+    The `api_fields` are the optional v1 API fields the sensor is calculated
+    from, which are only requested while the sensor is enabled.
+    """
 
     attr_name: str | None = None
+    api_fields: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class PAUpdateStatsSensorDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor for the v1 API update statistics."""
+
+    value_fn: Callable[[ApiUpdateStats], float | int]
+    attributes_fn: Callable[[ApiUpdateStatsHistory], dict[str, Any]]
+
+
+def _get_stage_percentiles(history: ApiUpdateStatsHistory) -> dict[str, Any]:
+    """Get the rolling percentiles of each stage in milliseconds."""
+
+    return {
+        f"{name}_{percentile}": round(seconds * 1000, 1)
+        for name, percentiles in history.get_percentiles().items()
+        for percentile, seconds in percentiles.items()
+    }
+
+
+def _get_response_counts(history: ApiUpdateStatsHistory) -> dict[str, Any]:
+    """Get the request and row counts of the last update."""
+
+    if not (last := history.last):
+        return {}
+
+    return {
+        "requests": last.requests,
+        "rows": last.rows,
+        "decoded_rows": last.decoded_rows,
+    }
 
 
 AqiSensorDescription = PASensorDescription(
@@ -45,6 +87,17 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=None,
         entity_registry_enabled_default=False,
         attr_name="pm2_5_aqi_instant",
+        api_fields=("pm2.5_atm",),
+    ),
+    PASensorDescription(
+        key="aqi_fast",
+        name="Air Quality Index (10 min)",
+        icon="mdi:weather-hazy",
+        device_class=SensorDeviceClass.AQI,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=None,
+        entity_registry_enabled_default=False,
+        attr_name="pm2_5_aqi_epa_fast",
     ),
     PASensorDescription(
         key="pm25",
@@ -55,6 +108,7 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
         entity_registry_enabled_default=False,
         attr_name="pm2_5_atm",
+        api_fields=("pm2.5_atm",),
     ),
     PASensorDescription(
         key="pm1",
@@ -65,6 +119,7 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
         entity_registry_enabled_default=False,
         attr_name="pm1_0_atm",
+        api_fields=("pm1.0_atm",),
     ),
     PASensorDescription(
         key="pm10",
@@ -75,6 +130,7 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
         entity_registry_enabled_default=False,
         attr_name="pm10_0_atm",
+        api_fields=("pm10.0_atm",),
     ),
     PASensorDescription(
         key="humidity",
@@ -85,6 +141,7 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=PERCENTAGE,
         entity_registry_enabled_default=False,
         attr_name="humidity",
+        api_fields=("humidity",),
     ),
     PASensorDescription(
         key="temp",
@@ -95,6 +152,7 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
         entity_registry_enabled_default=False,
         attr_name="temperature",
+        api_fields=("temperature",),
     ),
     PASensorDescription(
         key="pressure",
@@ -105,5 +163,43 @@ SIMPLE_SENSOR_DESCRIPTIONS: Final = [
         native_unit_of_measurement=UnitOfPressure.HPA,
         entity_registry_enabled_default=False,
         attr_name="pressure",
+        api_fields=("pressure",),
+    ),
+]
+
+UPDATE_STATS_SENSOR_DESCRIPTIONS: Final = [
+    PAUpdateStatsSensorDescription(
+        key="update_duration",
+        name="Update Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: round(stats.duration * 1000, 1),
+        attributes_fn=_get_stage_percentiles,
+    ),
+    PAUpdateStatsSensorDescription(
+        key="update_response_size",
+        name="Update Response Size",
+        icon="mdi:download-network-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.response_bytes,
+        attributes_fn=_get_response_counts,
     ),
 ]
+
+ApiPointsSensorDescription = SensorEntityDescription(
+    key="api_points",
+    name="API Points Used",
+    icon="mdi:counter",
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement="points",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
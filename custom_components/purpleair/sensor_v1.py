@@ -5,20 +5,22 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, LOCAL_API_KEY, STALE_SENSOR_AGE
+from .coordinator import PurpleAirDataUpdateCoordinator, get_api_key_id
 from .model import PurpleAirConfigEntry, PurpleAirDomainData
-from .purple_air_api.v1.model import NormalizedApiData
 from .sensor_descriptions import (
     SIMPLE_SENSOR_DESCRIPTIONS,
+    UPDATE_STATS_SENSOR_DESCRIPTIONS,
+    ApiPointsSensorDescription,
     AqiSensorDescription,
     PASensorDescription,
+    PAUpdateStatsSensorDescription,
 )
 
 if TYPE_CHECKING:
@@ -27,7 +29,6 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity import Entity
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .purple_air_api.v1.model import SensorReading
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,10 +57,31 @@ async def async_setup_entry(
 
     async_schedule_add_entities(entities, False)
 
+    # the API of a key is shared by its sensors, so only one entry of the key
+    # creates the entities about it
+    @callback
+    def _async_add_api_entities() -> None:
+        api_entities: list[Entity] = [
+            PurpleAirUpdateStatsSensor(config.api_key, coordinator, sensor_description)
+            for sensor_description in UPDATE_STATS_SENSOR_DESCRIPTIONS
+        ]
+
+        # sensors polled on the LAN don't spend any API points
+        if config.api_key != LOCAL_API_KEY:
+            api_entities.append(
+                PurpleAirApiPointsSensor(
+                    config.api_key, coordinator, ApiPointsSensorDescription
+                )
+            )
+
+        async_schedule_add_entities(api_entities, False)
+
+    coordinator.claim_api_entities(
+        config.api_key, config_entry.entry_id, _async_add_api_entities
+    )
 
-class PASensorBase(
-    CoordinatorEntity[DataUpdateCoordinator[dict[str, NormalizedApiData]]]
-):
+
+class PASensorBase(CoordinatorEntity[PurpleAirDataUpdateCoordinator]):
     """Provides the base for PurpleAir sensors."""
 
     _attr_attribution = "Data provided by PurpleAir"
@@ -70,12 +92,13 @@ class PASensorBase(
     def __init__(
         self,
         config: PurpleAirConfigEntry,
-        coordinator: DataUpdateCoordinator[dict[str, NormalizedApiData]],
+        coordinator: PurpleAirDataUpdateCoordinator,
         entity_description: PASensorDescription,
     ) -> None:
         """Initialize the base sensor."""
 
-        super().__init__(coordinator)
+        # only sensors with changed data are updated, see async_add_listener
+        super().__init__(coordinator, context=config.pa_sensor_id)
 
         self.entity_description = entity_description
         self.pa_sensor_id = config.pa_sensor_id
@@ -91,9 +114,9 @@ class PASensorBase(
 
         self._sensor_attr_name = entity_description.attr_name
 
-    def _get_sensor_data(self) -> SensorReading | None:
-        sensor_data = self.coordinator.data.get(self.pa_sensor_id)
-        return sensor_data["sensor"] if sensor_data else None
+    def _get_value(self, name: str) -> Any:
+        """Get a value of the sensor from the row of the sensor in the fleet store."""
+        return self.coordinator.get_sensor_value(self.pa_sensor_id, name)
 
     @property
     def available(self) -> bool:
@@ -108,8 +131,7 @@ class PASensorBase(
         if not self._sensor_attr_name:
             return None
 
-        data = self._get_sensor_data()
-        return getattr(data, self._sensor_attr_name) if data else None
+        return self._get_value(self._sensor_attr_name)
 
 
 class PurpleAirAqiSensor(PASensorBase, SensorEntity):
@@ -118,7 +140,7 @@ class PurpleAirAqiSensor(PASensorBase, SensorEntity):
     def __init__(
         self,
         config: PurpleAirConfigEntry,
-        coordinator: DataUpdateCoordinator[dict[str, NormalizedApiData]],
+        coordinator: PurpleAirDataUpdateCoordinator,
     ) -> None:
         """Initialize the AQI sensor."""
 
@@ -130,22 +152,20 @@ class PurpleAirAqiSensor(PASensorBase, SensorEntity):
     def available(self) -> bool:
         """Get the sensor availability."""
 
-        if not (data := self._get_sensor_data()):
-            return False
-
-        if data.pm2_5_aqi_epa is None or not data.last_seen:
+        last_seen = self._get_value("last_seen")
+        if self._get_value("pm2_5_aqi_epa") is None or not last_seen:
             return False
 
         now = dt_util.utcnow()
-        diff = now - data.last_seen
+        diff = now - last_seen
 
-        if diff.seconds > 5400:
+        if diff.seconds > STALE_SENSOR_AGE:
             if not self._warn_stale:
                 _LOGGER.warning(
                     'PurpleAir Sensor "%s" (%s) has not sent data over 90 mins. Last update was %s',
                     self.pa_sensor_name,
                     self.pa_sensor_id,
-                    dt_util.as_local(data.last_seen),
+                    dt_util.as_local(last_seen),
                 )
                 self._warn_stale = True
 
@@ -158,25 +178,128 @@ class PurpleAirAqiSensor(PASensorBase, SensorEntity):
     def extra_state_attributes(self) -> dict | None:
         """Get additional state information about the AQI."""
 
-        if not (data := self._get_sensor_data()):
+        if self.pa_sensor_id not in self.coordinator.data:
             return None
 
+        last_seen = self._get_value("last_seen")
+
         # only for 3.0 base release, these will be split out after to separate entties
         return {
-            "last_seen": dt_util.as_local(data.last_seen) if data.last_seen else None,
-            "adc": data.analog_input,
-            "rssi": data.rssi,
-            "status": data.pm2_5_aqi_epa_status,
-            "uptime": data.uptime,
+            "last_seen": dt_util.as_local(last_seen) if last_seen else None,
+            "adc": self._get_value("analog_input"),
+            "rssi": self._get_value("rssi"),
+            "status": self._get_value("pm2_5_aqi_epa_status"),
+            "uptime": self._get_value("uptime"),
+            "data_age": round(age)
+            if (age := self.coordinator.get_data_age(self.pa_sensor_id)) is not None
+            else None,
         }
 
     @property
     def native_value(self) -> int | None:
         """Get the AQI value."""
 
-        data = self._get_sensor_data()
-        return data.pm2_5_aqi_epa if data else None
+        return self._get_value("pm2_5_aqi_epa")  # type: ignore[no-any-return]
 
 
 class PurpleAirSimpleSensor(PASensorBase, SensorEntity):
     """Provide a sensor representing simple data from the PurpleAir sensor."""
+
+
+class PAApiSensorBase(CoordinatorEntity[PurpleAirDataUpdateCoordinator]):
+    """Provides the base for sensors about the API of a key."""
+
+    _attr_attribution = "Data provided by PurpleAir"
+
+    def __init__(
+        self,
+        api_key: str,
+        coordinator: PurpleAirDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the base API sensor."""
+
+        # registered without a sensor id so it is updated after every refresh
+        super().__init__(coordinator)
+
+        self.entity_description = entity_description
+        self.api_key = api_key
+
+        api_key_id = get_api_key_id(api_key)
+        device_name = "PurpleAir LAN" if api_key == LOCAL_API_KEY else "PurpleAir API"
+
+        self._attr_name = f"{device_name} {entity_description.name}"
+        self._attr_unique_id = f"api_{api_key_id}_{entity_description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"api_{api_key_id}")},
+            "name": device_name,
+            "manufacturer": "PurpleAir",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+
+class PurpleAirUpdateStatsSensor(PAApiSensorBase, SensorEntity):
+    """Provide diagnostic statistics about the updates of the API of a key."""
+
+    entity_description: PAUpdateStatsSensorDescription
+
+    @property
+    def available(self) -> bool:
+        """Get the sensor availability."""
+
+        stats = self.coordinator.get_api_update_stats(self.api_key)
+        return stats is not None and stats.last is not None
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Get the rolling statistics for the API."""
+
+        if not (stats := self.coordinator.get_api_update_stats(self.api_key)):
+            return None
+
+        return self.entity_description.attributes_fn(stats)
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Get the statistic from the last update."""
+
+        stats = self.coordinator.get_api_update_stats(self.api_key)
+        if not stats or not (last := stats.last):
+            return None
+
+        return self.entity_description.value_fn(last)
+
+
+class PurpleAirApiPointsSensor(PAApiSensorBase, SensorEntity):
+    """Provide the API points spent this month by a key."""
+
+    @property
+    def available(self) -> bool:
+        """Get the sensor availability."""
+
+        usage = self.coordinator.get_points_usage(self.api_key)
+        return usage is not None and bool(usage["month"])
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Get the budget and projected spending of the key."""
+
+        if not (usage := self.coordinator.get_points_usage(self.api_key)):
+            return None
+
+        return {
+            "month": usage["month"],
+            "budget": usage["budget"] or None,
+            "projected_month_points": usage["projected_month_points"],
+            "poll_scale": usage["poll_scale"],
+            "requests": usage["requests"],
+            "last_request_points": usage["last_points"],
+            "points_per_row": usage["points_per_row"],
+        }
+
+    @property
+    def native_value(self) -> int | None:
+        """Get the points spent this month."""
+
+        usage = self.coordinator.get_points_usage(self.api_key)
+        return usage["month_points"] if usage else None
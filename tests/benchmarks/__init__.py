@@ -0,0 +1,5 @@
+"""Benchmarks for the PurpleAir integration.
+
+Each benchmark is a script run from the repository root, for example
+`python -m tests.benchmarks.bench_decoder`, and prints its results.
+"""
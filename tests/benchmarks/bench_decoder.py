@@ -0,0 +1,50 @@
+"""Benchmark decoding v1 /sensors responses, in rows per second.
+
+Run with `python -m tests.benchmarks.bench_decoder [rows] [repeats]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import cast
+
+from custom_components.purpleair.purple_air_api.v1.decoder import SensorDataDecoder
+from custom_components.purpleair.purple_air_api.v1.fleet import SensorFleetStore
+from custom_components.purpleair.purple_air_api.v1.responses import ApiSensorResponse
+
+from .synthetic import make_sensor_response  # noqa: TID251
+
+
+def bench_decode(rows: int, repeats: int, include_device_data: bool) -> float:
+    """Get the rows decoded per second, taking the best of the repeats."""
+
+    data = make_sensor_response(rows, include_device_data)
+    fields = {field: index for index, field in enumerate(data["fields"])}
+    decoder = SensorDataDecoder(fields, include_device_data)
+    response = cast("ApiSensorResponse", data)
+
+    best = float("inf")
+    for _ in range(repeats):
+        store = SensorFleetStore()
+        started = time.perf_counter()
+        decoder.decode(response, data["data"], store)
+        best = min(best, time.perf_counter() - started)
+
+    return rows / best
+
+
+def main() -> None:
+    """Print the decoding rate with and without device fields."""
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    for include_device_data in (False, True):
+        rate = bench_decode(rows, repeats, include_device_data)
+        label = "sensor + device fields" if include_device_data else "sensor fields"
+        print(f"{label}: {rate:,.0f} rows/s ({rows} rows)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
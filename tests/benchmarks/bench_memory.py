@@ -0,0 +1,102 @@
+"""Benchmark the memory held per sensor by the readings and EPA values.
+
+Run with `python -m tests.benchmarks.bench_memory [sensors]`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+import gc
+import random
+import sys
+import tracemalloc
+from typing import Any, cast
+
+from custom_components.purpleair.purple_air_api import (
+    model as model_v0,
+    util as util_v0,
+)
+from custom_components.purpleair.purple_air_api.v1.decoder import SensorDataDecoder
+from custom_components.purpleair.purple_air_api.v1.fleet import SensorFleetStore
+from custom_components.purpleair.purple_air_api.v1.model import EpaAvgValue
+from custom_components.purpleair.purple_air_api.v1.responses import ApiSensorResponse
+from custom_components.purpleair.purple_air_api.v1.util import create_epa_value_cache
+
+from .synthetic import make_sensor_response  # noqa: TID251
+
+EPA_VALUES = 12
+
+
+def measure(count: int, create: Callable[[], Any]) -> float:
+    """Get the bytes per sensor still allocated by what `create` returns."""
+
+    gc.collect()
+    tracemalloc.start()
+    kept = create()
+    gc.collect()
+    (allocated, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return allocated / count
+
+
+def main() -> None:
+    """Print the bytes per sensor of the v1 and v0 data."""
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rnd = random.Random(1)
+
+    data = make_sensor_response(count, include_device_data=True)
+    fields = {field: index for index, field in enumerate(data["fields"])}
+    decoder = SensorDataDecoder(fields, include_device_data=True)
+    response = cast("ApiSensorResponse", data)
+
+    def decode() -> tuple[SensorFleetStore, Any]:
+        store = SensorFleetStore()
+        return (store, decoder.decode(response, data["data"], store))
+
+    def fill_v1_cache() -> Any:
+        cache = create_epa_value_cache()
+        for index in range(count):
+            for _ in range(EPA_VALUES):
+                cache[str(index)].append(
+                    EpaAvgValue(hum=rnd.uniform(0, 100), pm25=rnd.uniform(0, 50))
+                )
+        return cache
+
+    def fill_v0_data() -> Any:
+        now = datetime.now(UTC)
+        cache = util_v0.create_epa_value_cache()
+        sensors = {}
+        for index in range(count):
+            pa_sensor_id = str(index)
+            sensor = model_v0.PurpleAirApiSensorData(
+                pa_sensor_id=pa_sensor_id,
+                label=f"Sensor {index}",
+                last_seen=now,
+                last_update=now,
+                device_location=sys.intern("outside"),
+                version=sys.intern("7.02"),
+                type=sys.intern("PMS5003+PMS5003+BME280"),
+            )
+            sensor.readings.pm2_5_atm = rnd.uniform(0, 50)
+            sensor.readings.humidity = rnd.uniform(0, 100)
+            sensors[pa_sensor_id] = sensor
+            cache[pa_sensor_id].extend(
+                model_v0.EpaAvgValue(hum=rnd.uniform(0, 100), pm25=rnd.uniform(0, 50))
+                for _ in range(EPA_VALUES)
+            )
+        return (sensors, cache)
+
+    results = {
+        "v1 fleet store rows and device readings": measure(count, decode),
+        f"v1 EPA window with {EPA_VALUES} values": measure(count, fill_v1_cache),
+        f"v0 sensor data with {EPA_VALUES} EPA values": measure(count, fill_v0_data),
+    }
+    for label, per_sensor in results.items():
+        print(f"{label}: {per_sensor:,.0f} B/sensor ({count} sensors)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
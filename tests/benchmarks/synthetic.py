@@ -0,0 +1,63 @@
+"""Synthetic v1 /sensors responses for the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from custom_components.purpleair.purple_air_api.v1.const import (
+    API_DEVICE_FIELDS,
+    API_SENSOR_FIELDS,
+)
+
+LOCATION_TYPES = ["outside", "inside"]
+CHANNEL_STATES = ["No PM", "PM-A", "PM-B", "PM-A+PM-B"]
+CHANNEL_FLAGS = ["Normal", "A-Downgraded", "B-Downgraded", "A+B-Downgraded"]
+
+
+def _make_value(field: str, index: int, rnd: random.Random) -> Any:
+    if field == "sensor_index":
+        return 1000 + index
+    if field == "rssi":
+        return -rnd.randint(30, 90)
+    if field in ("uptime", "confidence", "humidity", "temperature"):
+        return rnd.randint(0, 100)
+    if field == "last_seen":
+        return 1700000000 + rnd.randint(0, 300)
+    if field == "location_type":
+        return rnd.randrange(len(LOCATION_TYPES))
+    if field in ("channel_state", "channel_flags"):
+        return rnd.randrange(len(CHANNEL_STATES))
+    if field == "private":
+        return rnd.randint(0, 1)
+    if field in ("model", "hardware", "firmware_version", "firmware_upgrade"):
+        return "PA-II"
+
+    return round(rnd.uniform(0, 200), 2)
+
+
+def make_sensor_response(
+    count: int, include_device_data: bool = False, seed: int = 1
+) -> dict[str, Any]:
+    """Make a response with every sensor field for `count` sensors."""
+
+    rnd = random.Random(seed)
+    fields = list(API_SENSOR_FIELDS)
+    if include_device_data:
+        fields.extend(API_DEVICE_FIELDS)
+
+    return {
+        "api_version": "V1",
+        "time_stamp": 1700000300,
+        "data_time_stamp": 1700000300,
+        "max_age": 604800,
+        "firmware_default_version": "7.02",
+        "fields": fields,
+        "location_types": LOCATION_TYPES,
+        "channel_states": CHANNEL_STATES,
+        "channel_flags": CHANNEL_FLAGS,
+        "data": [
+            [_make_value(field, index, rnd) for field in fields]
+            for index in range(count)
+        ],
+    }
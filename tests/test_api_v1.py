@@ -0,0 +1,133 @@
+"""Tests for reading sensor responses with the v1 API."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.purpleair.purple_air_api.v1 import api as api_v1
+from custom_components.purpleair.purple_air_api.v1.api import PurpleAirApiV1
+from custom_components.purpleair.purple_air_api.v1.exceptions import (
+    PurpleAirApiDataError,
+)
+
+
+@pytest.fixture
+async def stub_body(
+    aiohttp_server: Any, socket_enabled: None, monkeypatch: pytest.MonkeyPatch
+) -> list[Any]:
+    """Serve the sensors endpoint with the status and body set by a test."""
+
+    body: list[Any] = []
+
+    async def sensors(request: web.Request) -> web.Response:
+        (status, data) = body[0]
+        return web.Response(status=status, body=data, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/v1/sensors", sensors)
+    server: TestServer = await aiohttp_server(app)
+
+    monkeypatch.setattr(
+        api_v1, "URL_API_V1_SENSORS", f"http://{server.host}:{server.port}/v1/sensors"
+    )
+    return body
+
+
+@pytest.mark.parametrize(
+    ("status", "body", "description"),
+    [
+        (
+            200,
+            b'{"fields": ["sensor_index"], "data": [[1234',
+            "Invalid sensor response",
+        ),
+        (200, b'{"data": [[1234]]}', "Invalid sensor response"),
+        (200, b"not json", "Invalid sensor response"),
+        (403, b"<html>Forbidden</html>", "Invalid error response"),
+    ],
+)
+async def test_bad_response_raises_data_error(
+    stub_body: list[Any], status: int, body: bytes, description: str
+) -> None:
+    """A truncated or malformed response is raised as an API data error."""
+
+    stub_body.append((status, body))
+
+    async with ClientSession() as session:
+        api = PurpleAirApiV1(session, "KEY")
+        api.register_sensor("1234", "Sensor", hidden=False)
+
+        with pytest.raises(PurpleAirApiDataError) as exc_info:
+            await api.async_update(do_device_update=False)
+
+    assert exc_info.value.status == status
+    assert exc_info.value.description == description
+
+
+async def test_bad_response_leaves_fleet_untouched(
+    stub_body: list[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rows decoded before a response fails part way through are not kept."""
+
+    # decode every row as soon as it arrives, ahead of the body failing to parse
+    monkeypatch.setattr(api_v1, "API_DECODE_BLOCK_ROWS", 1)
+    header = b'{"fields": ["sensor_index", "last_seen", "humidity", "pm2.5_cf_1"], '
+    last_seen = int(time.time()) - 120
+    stub_body.append(
+        (200, header + b'"data": [[%d, %d, 40, 10.0]]}' % (1234, last_seen))
+    )
+
+    async with ClientSession() as session:
+        api = PurpleAirApiV1(session, "KEY")
+        api.register_sensor("1234", "Sensor", hidden=False)
+        api.set_sensor_fields("1234", ())
+
+        await api.async_update(do_device_update=False)
+        version = api.fleet.get_version("1234")
+        humidity = api.fleet.get_value("1234", "humidity")
+        aqi = api.fleet.get_value("1234", "pm2_5_aqi_epa")
+
+        stub_body[0] = (
+            200,
+            header + b'"data": [[%d, %d, 80, 90.0], [12' % (1234, last_seen + 60),
+        )
+        with pytest.raises(PurpleAirApiDataError):
+            await api.async_update(do_device_update=False)
+
+    assert version
+    assert api.fleet.get_version("1234") == version
+    assert api.fleet.get_value("1234", "humidity") == humidity == 44
+    assert api.fleet.get_value("1234", "pm2_5_aqi_epa") == aqi is not None
+
+
+async def test_epa_average_spans_hour_at_short_poll_interval(
+    stub_body: list[Any],
+) -> None:
+    """Polling every 2 minutes still averages the last hour, not 24 minutes."""
+
+    header = b'{"fields": ["sensor_index", "last_seen", "humidity", "pm2.5_cf_1"], '
+    now = int(time.time())
+
+    async with ClientSession() as session:
+        api = PurpleAirApiV1(session, "KEY")
+        api.register_sensor("1234", "Sensor", hidden=False)
+        api.set_sensor_fields("1234", ())
+
+        # a reading every 2 minutes over the last hour, higher in the first half
+        for minutes_ago in range(58, -1, -2):
+            pm25 = 100.0 if minutes_ago > 30 else 10.0
+            row = b"[%d, %d, 40, %f]" % (1234, now - minutes_ago * 60, pm25)
+            stub_body[:] = [(200, header + b'"data": [' + row + b"]}")]
+            await api.async_update(do_device_update=False)
+
+    window = api._cache["1234"]  # noqa: SLF001
+    assert len(window) <= window.max_samples
+    assert window.values[0].timestamp < now - 50 * 60
+    assert window.pm25_avg is not None
+    assert window.pm25_avg > 40.0
+    assert api.fleet.get_value("1234", "pm2_5_aqi_epa_status") == "stable"
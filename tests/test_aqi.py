@@ -0,0 +1,110 @@
+"""Tests for the AQI calculations shared by the PurpleAir APIs."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import math
+import time
+
+from custom_components.purpleair.purple_air_api import util as util_v0
+from custom_components.purpleair.purple_air_api.aqi import calc_aqi_batch
+from custom_components.purpleair.purple_air_api.v1 import util as util_v1
+from custom_components.purpleair.purple_air_api.v1.aqi_breakpoints import (
+    AQI_BREAKPOINT_TABLES,
+)
+from custom_components.purpleair.purple_air_api.v1.fleet import SensorFleetStore
+from custom_components.purpleair.purple_air_api.v1.model import (
+    EpaAvgValue,
+    EpaAvgWindow,
+)
+
+
+def test_calc_aqi_batch() -> None:
+    """Values resolve to their breakpoint, while invalid values are None."""
+
+    values = [0.0, 12.0, 12.05, 35.4, 55.5, 999.9, 1000.0, -1.0, math.nan]
+    assert calc_aqi_batch(values, "pm2_5", AQI_BREAKPOINT_TABLES) == [
+        0,
+        50,
+        None,
+        100,
+        151,
+        999,
+        None,
+        None,
+        None,
+    ]
+    assert calc_aqi_batch(values, "pm10", AQI_BREAKPOINT_TABLES) == [None] * 9
+
+
+def test_calc_aqi_matches_between_apis() -> None:
+    """Both APIs calculate the same AQI from their own breakpoint tables."""
+
+    for value in (0.0, 8.3, 20.0, 40.0, 100.0, 200.0, 300.0, 400.0, 600.0):
+        assert util_v0.calc_aqi(value, "pm2_5") == util_v1.calc_aqi(value, "pm2_5")
+
+
+def test_epa_average_buckets_by_reading_time() -> None:
+    """Readings are bucketed by when they were taken, and only averaged once."""
+
+    fleet = SensorFleetStore()
+    row = fleet.add("1")
+    cache = util_v1.create_epa_value_cache(bucketed=True)
+
+    # the start of the last five minute bucket
+    bucket = (time.time() // 300 - 1) * 300
+
+    def add_reading(offset: float, pm25: float) -> None:
+        last_seen = datetime.fromtimestamp(bucket + offset, UTC)
+        fleet.set_column("last_seen", (row,), (last_seen,))
+        fleet.set_column("pm2_5_cf_1", (row,), (pm25,))
+        fleet.set_column("humidity", (row,), (40.0,))
+        util_v1.add_aqi_calculations(fleet, (row,), cache=cache)
+
+    add_reading(10, 10.0)
+    add_reading(70, 20.0)
+    add_reading(70, 20.0)
+
+    window = cache["1"]
+    assert len(window) == 1
+    assert window.pm25_avg == 15.0
+    assert window.values[0].timestamp == bucket + 70
+
+    add_reading(310, 30.0)
+    assert len(window) == 2
+    assert window.pm25_avg == 22.5
+
+
+def test_empty_epa_window_has_no_average() -> None:
+    """A window without values has no averages, rather than averages of 0."""
+
+    window = EpaAvgWindow(timedelta(minutes=10), 10)
+    assert window.hum_avg is None
+    assert window.pm25_avg is None
+
+    window.append(EpaAvgValue(hum=40.0, pm25=10.0, timestamp=time.time() - 3600))
+    assert window.pm25_avg == 10.0
+
+    window.expire(datetime.now(UTC))
+    assert window.hum_avg is None
+    assert window.pm25_avg is None
+
+
+def test_stale_reading_has_no_epa_aqi() -> None:
+    """A reading older than the averaging windows leaves the EPA AQI missing."""
+
+    fleet = SensorFleetStore()
+    row = fleet.add("1")
+    last_seen = datetime.now(UTC) - timedelta(minutes=70)
+    fleet.set_column("last_seen", (row,), (last_seen,))
+    fleet.set_column("pm2_5_cf_1", (row,), (100.0,))
+    fleet.set_column("humidity", (row,), (40.0,))
+
+    cache = util_v1.create_epa_value_cache()
+    fast_cache = util_v1.create_epa_fast_value_cache()
+    util_v1.add_aqi_calculations(fleet, (row,), cache=cache, fast_cache=fast_cache)
+
+    assert fleet.get_value("1", "pm2_5_aqi_epa") is None
+    assert fleet.get_value("1", "pm2_5_aqi_epa_fast") is None
+    assert fleet.get_value("1", "pm2_5_aqi_epa_status") is None
+    assert not cache["1"]
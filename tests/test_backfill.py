@@ -0,0 +1,99 @@
+"""Tests for seeding the EPA average of the v1 API from sensor history."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.purpleair.purple_air_api.v1 import api as api_v1
+from custom_components.purpleair.purple_air_api.v1.api import PurpleAirApiV1
+
+SENSOR_FIELDS = [
+    "sensor_index",
+    "rssi",
+    "analog_input",
+    "last_seen",
+    "humidity",
+    "pm2.5_cf_1",
+    "uptime",
+]
+
+
+@pytest.fixture
+async def stub_api(
+    aiohttp_server: Any, socket_enabled: None, monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    """Serve the sensors and history endpoints, returning the requested paths."""
+
+    requests: list[str] = []
+    now = int(time.time())
+
+    async def sensors(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        return web.json_response(
+            {
+                "fields": SENSOR_FIELDS,
+                "data": [[1234, -60, 0.02, now, 40, 12.0, 1000]],
+            }
+        )
+
+    async def history(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        return web.json_response(
+            {
+                "fields": ["time_stamp", "humidity", "pm2.5_cf_1"],
+                "data": [[now - minutes * 60, 40, 12.0] for minutes in range(60)],
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/v1/sensors", sensors)
+    app.router.add_get("/v1/sensors/{pa_sensor_id}/history", history)
+    server: TestServer = await aiohttp_server(app)
+
+    base_url = f"http://{server.host}:{server.port}/v1/sensors"
+    monkeypatch.setattr(api_v1, "URL_API_V1_SENSORS", base_url)
+    monkeypatch.setattr(
+        api_v1, "URL_API_V1_SENSOR_HISTORY", f"{base_url}/{{pa_sensor_id}}/history"
+    )
+    return requests
+
+
+async def test_history_not_backfilled_by_default(stub_api: list[str]) -> None:
+    """A new sensor only fills its EPA average from polls by default."""
+
+    async with ClientSession() as session:
+        api = PurpleAirApiV1(session, "KEY")
+        api.register_sensor("1234", "Sensor", hidden=False)
+
+        data = await api.async_update(do_device_update=False)
+
+    assert stub_api == ["/v1/sensors"]
+    assert data["1234"]["version"]
+    status = api.fleet.get_value("1234", "pm2_5_aqi_epa_status")
+    assert status == "calculating (55 mins left)"
+
+
+async def test_history_backfilled_when_requested(stub_api: list[str]) -> None:
+    """A requested backfill fills the EPA average from the last hour of history."""
+
+    async with ClientSession() as session:
+        api = PurpleAirApiV1(session, "KEY")
+        api.register_sensor("1234", "Sensor", hidden=False)
+        api.request_history_backfill("1234")
+
+        data = await api.async_update(do_device_update=False)
+        unchanged = await api.async_update(do_device_update=False)
+
+    assert sorted(stub_api) == [
+        "/v1/sensors",
+        "/v1/sensors",
+        "/v1/sensors/1234/history",
+    ]
+    assert unchanged["1234"]["version"] == data["1234"]["version"]
+    assert api.fleet.get_value("1234", "pm2_5_aqi_epa_status") == "stable"
+    assert api.points_ledger.as_dict()
@@ -0,0 +1,286 @@
+"""Tests for the PurpleAir v1 data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Collection
+from datetime import timedelta
+import logging
+
+from aiohttp import ClientSession
+import pytest
+
+from custom_components.purpleair.const import DOMAIN
+from custom_components.purpleair.coordinator import PurpleAirDataUpdateCoordinator
+from custom_components.purpleair.model import PurpleAirDomainData
+from custom_components.purpleair.purple_air_api.resilience import CircuitBreaker
+from custom_components.purpleair.purple_air_api.v1.exceptions import (
+    PurpleAirApiDataError,
+)
+from custom_components.purpleair.purple_air_api.v1.fleet import SensorFleetStore
+from custom_components.purpleair.purple_air_api.v1.model import (
+    ApiPointsLedger,
+    ApiUpdateStatsHistory,
+    EpaAvgValueCacheSnapshot,
+    NormalizedApiData,
+)
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FakeApi:
+    """Serve the readings set by a test, or raise the error set by a test."""
+
+    def __init__(self) -> None:
+        """Create a new fake API with no sensors."""
+
+        self.error: BaseException | None = None
+        self.missing: set[str] = set()
+        self.fleet = SensorFleetStore()
+        self.points_ledger = ApiPointsLedger()
+        self.update_stats = ApiUpdateStatsHistory(10)
+
+    def set_reading(self, pa_sensor_id: str) -> None:
+        """Commit a new reading for the sensor, seen now."""
+
+        row = self.fleet.add(pa_sensor_id)
+        self.fleet.clear((row,))
+        self.fleet.set_column("last_seen", (row,), (dt_util.utcnow(),))
+        self.fleet.commit((row,))
+
+    def get_sensor_count(self) -> int:
+        """Get the number of sensors with readings."""
+        return len(self.fleet)
+
+    def register_sensor(
+        self, pa_sensor_id: str, name: str, hidden: bool, read_key: str | None = None
+    ) -> None:
+        """Register the sensor with a fresh reading."""
+        self.set_reading(pa_sensor_id)
+
+    def unregister_sensor(self, pa_sensor_id: str) -> None:
+        """Unregister the sensor."""
+        self.fleet.remove(pa_sensor_id)
+
+    def request_history_backfill(self, pa_sensor_id: str) -> None:
+        """Ignore the backfill."""
+
+    def set_sensor_fields(
+        self, pa_sensor_id: str, fields: Collection[str] | None
+    ) -> None:
+        """Ignore the wanted fields."""
+
+    def get_sensor_fields(self) -> dict[str, int]:
+        """Get no sensor fields."""
+        return {}
+
+    def get_epa_cache_snapshot(self) -> EpaAvgValueCacheSnapshot:
+        """Get an empty snapshot."""
+        return {}
+
+    def restore_epa_cache(self, pa_sensor_id: str, values: list[list[float]]) -> None:
+        """Ignore the restored values."""
+
+    async def async_update(
+        self, do_device_update: bool, pa_sensor_ids: Collection[str] | None = None
+    ) -> dict[str, NormalizedApiData]:
+        """Get the readings of the given sensors but the missing ones, or raise."""
+
+        if self.error:
+            raise self.error
+
+        return {
+            pa_sensor_id: {
+                "version": self.fleet.get_version(pa_sensor_id),
+                "device": None,
+            }
+            for pa_sensor_id in self.fleet.rows
+            if (pa_sensor_ids is None or pa_sensor_id in pa_sensor_ids)
+            and pa_sensor_id not in self.missing
+        }
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant,
+) -> AsyncGenerator[PurpleAirDataUpdateCoordinator]:
+    """Create a coordinator with a fake API for each key."""
+
+    # registrations don't schedule a refresh, tests refresh when they need to
+    hass.data[DOMAIN] = PurpleAirDomainData(expected_entries_v1=100)
+
+    def create_api(session: ClientSession, api_key: str) -> FakeApi:
+        return FakeApi()
+
+    coordinator = PurpleAirDataUpdateCoordinator(
+        create_api,
+        hass,
+        _LOGGER,
+        name="purpleair",
+        update_interval=timedelta(minutes=5),
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+async def test_listeners_routed_to_changed_sensors(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """Sensor listeners are only called when their sensor changed."""
+
+    for pa_sensor_id in ("1", "2"):
+        coordinator.register_sensor("KEY", pa_sensor_id, pa_sensor_id, False, None, 0)
+
+    calls: list[str] = []
+    for pa_sensor_id in ("1", "2"):
+        coordinator.async_add_listener(
+            lambda pa_sensor_id=pa_sensor_id: calls.append(pa_sensor_id), pa_sensor_id
+        )
+    remove_listener = coordinator.async_add_listener(lambda: calls.append("all"))
+
+    await coordinator.async_refresh()
+    assert sorted(calls) == ["1", "2", "all"]
+
+    calls.clear()
+    api = coordinator.apis["KEY"]
+    assert isinstance(api, FakeApi)
+    api.set_reading("2")
+    await coordinator.async_refresh()
+    assert sorted(calls) == ["2", "all"]
+    assert coordinator.suppressed_writes == 1
+
+    # every listener is called after a failed update
+    calls.clear()
+    api.error = PurpleAirApiDataError(403, "Forbidden", "Invalid key.", "ApiKeyInvalid")
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert sorted(calls) == ["1", "2", "all"]
+    assert coordinator.suppressed_writes == 1
+
+    remove_listener()
+
+
+async def test_sensor_listeners_keep_refresh_scheduled(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """The refresh stays scheduled until the last sensor listener is removed."""
+
+    remove_first = coordinator.async_add_listener(lambda: None, "1")
+    remove_second = coordinator.async_add_listener(lambda: None, "2")
+
+    remove_first()
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
+
+    remove_second()
+    assert coordinator._unsub_refresh is None  # noqa: SLF001
+
+
+async def test_points_budget_follows_registrations(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """The smallest budget of the sensors of a key applies to the key."""
+
+    coordinator.register_sensor("KEY", "1", "1", False, points_budget=5000)
+    coordinator.register_sensor("KEY", "2", "2", False, points_budget=2000)
+    coordinator.register_sensor("OTHER", "3", "3", False)
+
+    usage = coordinator.get_points_usage("KEY")
+    assert usage is not None
+    assert usage["budget"] == 2000
+
+    coordinator.unregister_sensor("2")
+    usage = coordinator.get_points_usage("KEY")
+    assert usage is not None
+    assert usage["budget"] == 5000
+
+    # moving the last sensor of a key to another key drops the key
+    coordinator.register_sensor("OTHER", "1", "1", False, points_budget=5000)
+    assert coordinator.get_points_usage("KEY") is None
+    usage = coordinator.get_points_usage("OTHER")
+    assert usage is not None
+    assert usage["budget"] == 5000
+
+
+async def test_tick_follows_short_poll_interval(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """Sensors polled more often than the fewest seconds between ticks set the tick."""
+
+    coordinator.register_sensor("KEY", "1", "1", False, poll_interval=300)
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+    coordinator.register_sensor("local", "2", "2", False, poll_interval=10)
+    assert coordinator.update_interval == timedelta(seconds=10)
+
+    coordinator.unregister_sensor("2")
+    coordinator.register_sensor("local", "2", "2", False, poll_interval=60)
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+async def test_failing_key_does_not_fail_other_keys(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """An unexpected error polling one key leaves the sensors of other keys."""
+
+    coordinator.register_sensor("KEY", "1", "1", False)
+    coordinator.register_sensor("OTHER", "2", "2", False)
+    api = coordinator.apis["KEY"]
+    assert isinstance(api, FakeApi)
+    api.error = KeyError("fields")
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert list(coordinator.data) == ["2"]
+    assert coordinator.api_errors == {"KEY": "'fields'"}
+    assert coordinator.get_diagnostics("1")["api_breaker"] == "closed"
+    assert coordinator._breakers["KEY"].failures == 1  # noqa: SLF001
+
+
+async def test_missing_sensor_keeps_data_until_max_age(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """A due sensor missing from a response keeps its data up to its max age."""
+
+    coordinator.register_sensor("KEY", "1", "1", False, max_data_age=600)
+    coordinator.register_sensor("KEY", "2", "2", False, max_data_age=0)
+    await coordinator.async_refresh()
+    previous = coordinator.data["1"]
+
+    api = coordinator.apis["KEY"]
+    assert isinstance(api, FakeApi)
+    api.missing = {"1", "2"}
+    coordinator._next_polls = dict.fromkeys(coordinator._next_polls, 0.0)  # noqa: SLF001
+    await coordinator.async_refresh()
+
+    assert coordinator.data == {"1": previous}
+    assert coordinator.stale_sensor_ids == {"1"}
+
+    # once the data is older than its max age it is dropped
+    coordinator._polled_at["1"] -= 600  # noqa: SLF001
+    await coordinator.async_refresh()
+
+    assert coordinator.data == {}
+
+
+async def test_cancelled_poll_releases_breaker_trial(
+    coordinator: PurpleAirDataUpdateCoordinator,
+) -> None:
+    """A poll cancelled while the breaker is half open gives back the trial."""
+
+    coordinator.register_sensor("KEY", "1", "1", False)
+    breaker = coordinator._breakers["KEY"] = CircuitBreaker(1, 0.01, 0.01)  # noqa: SLF001
+    breaker.record_failure()
+    await asyncio.sleep(0.02)
+    assert breaker.state == "half_open"
+
+    api = coordinator.apis["KEY"]
+    assert isinstance(api, FakeApi)
+    api.error = asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await coordinator.async_refresh()
+
+    assert breaker.allow_request()
@@ -0,0 +1,79 @@
+"""Tests for the sensor fleet store of the v1 API."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from custom_components.purpleair.purple_air_api.v1.fleet import SensorFleetStore
+
+
+def test_values_read_by_row() -> None:
+    """Values are read back from the row of a sensor with their types."""
+
+    fleet = SensorFleetStore()
+    row = fleet.add("1")
+    last_seen = datetime(2024, 5, 1, 12, tzinfo=UTC)
+    fleet.set_column("last_seen", (row,), (last_seen,))
+    fleet.set_column("pm2_5_aqi_epa", (row,), (42.0,))
+    fleet.set_column("humidity", (row,), (None,))
+    fleet.set_column("pm2_5_aqi_epa_status", (row,), ("stable",))
+
+    assert fleet.get_value("1", "last_seen") == last_seen
+    assert fleet.get_value("1", "pm2_5_aqi_epa") == 42
+    assert isinstance(fleet.get_value("1", "pm2_5_aqi_epa"), int)
+    assert fleet.get_value("1", "humidity") is None
+    assert fleet.get_value("1", "pm2_5_aqi_epa_status") == "stable"
+    assert fleet.get_value("2", "humidity") is None
+
+    reading = fleet.get_reading("1")
+    assert reading is not None
+    assert reading.pa_sensor_id == "1"
+    assert reading.pm2_5_aqi_epa == 42
+
+
+def test_versions_change_on_commit() -> None:
+    """A committed row gets a new version, which clearing the row takes away."""
+
+    fleet = SensorFleetStore()
+    rows = [fleet.add("1"), fleet.add("2")]
+    assert fleet.get_version("1") == 0
+
+    fleet.commit(rows)
+    first = fleet.get_version("1")
+    assert first
+    assert fleet.get_version("2") not in (0, first)
+
+    fleet.clear(rows[:1])
+    assert fleet.get_version("1") == 0
+
+    fleet.commit(rows[:1])
+    assert fleet.get_version("1") > first
+
+    fleet.remove("1")
+    assert fleet.get_version("1") == 0
+    assert fleet.versions[rows[0]] == 0
+
+
+def test_copy_from_staging_store() -> None:
+    """Rows copied from a staging store replace every value, without a version."""
+
+    fleet = SensorFleetStore()
+    row = fleet.add("1")
+    fleet.set_column("pm2_5_atm", (row,), (5.0,))
+    fleet.set_column("pm2_5_aqi_epa", (row,), (21.0,))
+    fleet.commit((row,))
+
+    staging = SensorFleetStore()
+    staging.add("2")
+    staging_row = staging.add("1")
+    staging.set_column("pm2_5_atm", (staging_row,), (9.0,))
+    staging.set_column("channel_state", (staging_row,), ("PMS",))
+
+    rows = fleet.copy_from(staging)
+
+    assert rows == [fleet.rows["2"], row]
+    assert fleet.get_value("1", "pm2_5_atm") == 9.0
+    assert fleet.get_value("1", "pm2_5_aqi_epa") is None
+    assert fleet.get_value("1", "channel_state") == "PMS"
+    assert fleet.get_version("1") == 0
+    assert fleet.get_version("2") == 0
@@ -0,0 +1,204 @@
+"""Tests for polling PurpleAir sensors over the LAN."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.purpleair.purple_air_api.local.api import PurpleAirApiLocal
+from custom_components.purpleair.purple_air_api.local.const import LOCAL_DATETIME_FORMAT
+from custom_components.purpleair.purple_air_api.local.util import (
+    get_local_sensor_config,
+    get_local_sensor_json,
+)
+from custom_components.purpleair.purple_air_api.v1.exceptions import (
+    PurpleAirApiConfigError,
+    PurpleAirApiDataError,
+)
+
+# nothing listens on port 1, so connecting to it fails right away
+UNREACHABLE_HOST = "127.0.0.1:1"
+
+
+def _format_time(value: datetime) -> str:
+    """Format a time the way a sensor reports it."""
+    return value.strftime(LOCAL_DATETIME_FORMAT)
+
+
+class StubSensor:
+    """Serve the JSON of a sensor on the LAN, or a bad body when set."""
+
+    def __init__(self) -> None:
+        """Create a new stub sensor with a first reading."""
+
+        self.bad_body = False
+        self.host = ""
+        self.data: dict[str, Any] = {
+            "SensorId": "84:f3:eb:00:00:01",
+            "DateTime": _format_time(datetime.now(UTC) - timedelta(minutes=2)),
+            "Geo": "PurpleAir-abcd",
+            "place": "outside",
+            "version": "7.02",
+            "hardwarediscovered": "2.0+BME280",
+            "rssi": -60,
+            "uptime": 1234,
+            "current_humidity": 40,
+            "current_temp_f": 70,
+            "pressure": 1012.5,
+            "pm1_0_atm": 5,
+            "pm2_5_atm": 10.0,
+            "pm2_5_cf_1": 10.0,
+            "pm10_0_atm": 12,
+            "pm1_0_atm_b": 7,
+            "pm2_5_atm_b": 12.0,
+            "pm2_5_cf_1_b": 12.0,
+            "pm10_0_atm_b": 14,
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Serve the sensor JSON."""
+
+        if self.bad_body:
+            return web.Response(text="<html>Not a sensor</html>")
+
+        return web.json_response(self.data)
+
+
+@pytest.fixture
+async def stub_sensor(aiohttp_server: Any, socket_enabled: None) -> StubSensor:
+    """Serve a sensor on the LAN."""
+
+    sensor = StubSensor()
+    app = web.Application()
+    app.router.add_get("/json", sensor.handle)
+    server: TestServer = await aiohttp_server(app)
+
+    sensor.host = f"{server.host}:{server.port}"
+    return sensor
+
+
+async def test_get_sensor_json(stub_sensor: StubSensor) -> None:
+    """The sensor JSON is returned along with its size."""
+
+    async with ClientSession() as session:
+        (data, size) = await get_local_sensor_json(session, stub_sensor.host)
+
+    assert data == stub_sensor.data
+    assert size > 0
+
+
+async def test_get_sensor_json_bad_body(stub_sensor: StubSensor) -> None:
+    """A body that isn't sensor JSON raises a data error."""
+
+    stub_sensor.bad_body = True
+
+    async with ClientSession() as session:
+        with pytest.raises(PurpleAirApiDataError):
+            await get_local_sensor_json(session, stub_sensor.host)
+
+
+async def test_get_sensor_json_unreachable(socket_enabled: None) -> None:
+    """Connection errors are raised as is."""
+
+    async with ClientSession() as session:
+        with pytest.raises(ClientError):
+            await get_local_sensor_json(session, UNREACHABLE_HOST)
+
+
+async def test_get_sensor_config(stub_sensor: StubSensor) -> None:
+    """A sensor is configured by its host and named by its own name."""
+
+    async with ClientSession() as session:
+        config = await get_local_sensor_config(
+            session, f" http://{stub_sensor.host}/json "
+        )
+
+        with pytest.raises(PurpleAirApiConfigError) as exc_info:
+            await get_local_sensor_config(session, UNREACHABLE_HOST)
+        assert exc_info.value.extra == "unreachable"
+
+        stub_sensor.bad_body = True
+        with pytest.raises(PurpleAirApiConfigError) as exc_info:
+            await get_local_sensor_config(session, stub_sensor.host)
+        assert exc_info.value.extra == "invalid_response"
+
+    assert config.pa_sensor_id == stub_sensor.host
+    assert config.name == "PurpleAir-abcd"
+
+
+async def test_update(stub_sensor: StubSensor) -> None:
+    """The sensors are polled, leaving out the ones that can't be reached."""
+
+    async with ClientSession() as session:
+        api = PurpleAirApiLocal(session)
+        api.register_sensor(stub_sensor.host, "Sensor", hidden=False)
+        api.register_sensor(UNREACHABLE_HOST, "Gone", hidden=False)
+
+        data = await api.async_update(do_device_update=True)
+
+    assert list(data) == [stub_sensor.host]
+    assert data[stub_sensor.host]["version"]
+    stats = api.update_stats.last
+    assert stats is not None
+    assert stats.requests == 2
+    assert api.fleet.get_value(stub_sensor.host, "pm2_5_atm") == 11.0
+    assert api.fleet.get_value(stub_sensor.host, "pm2_5_aqi_epa") is not None
+
+    device = data[stub_sensor.host]["device"]
+    assert device is not None
+    assert device.model == "PA-II"
+    assert device.firmware_version == "7.02"
+
+
+async def test_update_unchanged_reading(stub_sensor: StubSensor) -> None:
+    """A sensor whose reading time didn't change keeps the version of its row."""
+
+    async with ClientSession() as session:
+        api = PurpleAirApiLocal(session)
+        api.register_sensor(stub_sensor.host, "Sensor", hidden=False)
+
+        first = await api.async_update(do_device_update=False)
+        unchanged = await api.async_update(do_device_update=False)
+
+        stub_sensor.data["DateTime"] = _format_time(datetime.now(UTC))
+        stub_sensor.data["pm2_5_atm"] = 50.0
+        stub_sensor.data["pm2_5_atm_b"] = 52.0
+        changed = await api.async_update(do_device_update=False)
+
+    version = first[stub_sensor.host]["version"]
+    assert unchanged[stub_sensor.host]["version"] == version
+    assert changed[stub_sensor.host]["version"] != version
+    assert api.fleet.get_value(stub_sensor.host, "pm2_5_atm") == 51.0
+
+
+async def test_update_bad_body(stub_sensor: StubSensor) -> None:
+    """The error of the sensor is raised when no sensor could be polled."""
+
+    stub_sensor.bad_body = True
+
+    async with ClientSession() as session:
+        api = PurpleAirApiLocal(session)
+        api.register_sensor(stub_sensor.host, "Sensor", hidden=False)
+
+        with pytest.raises(PurpleAirApiDataError):
+            await api.async_update(do_device_update=False)
+
+
+async def test_update_unreachable(socket_enabled: None) -> None:
+    """The connection error is raised when no sensor could be reached."""
+
+    async with ClientSession() as session:
+        api = PurpleAirApiLocal(session)
+        api.register_sensor(UNREACHABLE_HOST, "Gone", hidden=False)
+
+        with pytest.raises(ClientError):
+            await api.async_update(do_device_update=False)
+
+    # the failed poll still counts as a request
+    stats = api.update_stats.last
+    assert stats is not None
+    assert stats.requests == 1
@@ -0,0 +1,97 @@
+"""Tests for the PurpleAir v1 sensor entities."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.purpleair.const import DOMAIN
+from custom_components.purpleair.purple_air_api.v1 import api as api_v1
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def stub_api(
+    aiohttp_server: Any, socket_enabled: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Serve a sensors endpoint without any sensors."""
+
+    async def sensors(request: web.Request) -> web.Response:
+        return web.json_response({"fields": ["sensor_index"], "data": []})
+
+    app = web.Application()
+    app.router.add_get("/v1/sensors", sensors)
+    server: TestServer = await aiohttp_server(app)
+
+    monkeypatch.setattr(
+        api_v1, "URL_API_V1_SENSORS", f"http://{server.host}:{server.port}/v1/sensors"
+    )
+
+
+def _add_entry(hass: HomeAssistant, pa_sensor_id: str) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=4,
+        unique_id=pa_sensor_id,
+        title=f"Sensor {pa_sensor_id}",
+        data={
+            "pa_sensor_id": pa_sensor_id,
+            "title": f"Sensor {pa_sensor_id}",
+            "api_version": 1,
+            "api_key": "KEY",
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _get_api_entity_entries(hass: HomeAssistant) -> set[str | None]:
+    """Get the config entries of the entities about the API."""
+
+    return {
+        entity.config_entry_id
+        for entity in er.async_get(hass).entities.values()
+        if entity.unique_id.startswith("api_")
+    }
+
+
+async def test_api_entities_created_once_for_key(
+    hass: HomeAssistant, stub_api: None
+) -> None:
+    """The entities about the API of a key are created once for all its sensors."""
+
+    entries = {_add_entry(hass, "1").entry_id, _add_entry(hass, "2").entry_id}
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    owners = _get_api_entity_entries(hass)
+    assert len(owners) == 1
+
+    # the other entry of the key takes them over when the owner reloads, without
+    # being reloaded itself
+    owner = owners.pop()
+    (other,) = entries - {owner}
+    other_unloads: list[bool] = []
+    other_entry = hass.config_entries.async_get_entry(other)
+    assert other_entry
+    other_entry.async_on_unload(lambda: other_unloads.append(True))
+
+    assert await hass.config_entries.async_reload(owner)
+    await hass.async_block_till_done()
+
+    assert _get_api_entity_entries(hass) == {other}
+    assert not other_unloads
+
+    # and keeps them when the old owner is unloaded
+    assert await hass.config_entries.async_unload(owner)
+    await hass.async_block_till_done()
+
+    assert _get_api_entity_entries(hass) == {other}
+
+    await hass.data[DOMAIN].coordinator_v1.async_shutdown()